@@ -1,9 +1,16 @@
 """
 Generate performance comparison plots for Quicksort algorithms.
+
+Runs in two stages: the benchmark stage writes results artifacts to
+docs/data/, rerunning only cells whose algorithm code, generator, or size
+changed since the last run; the plotting stage draws every figure from those
+artifacts. Use --plots-only to redraw without benchmarking, or
+--benchmarks-only to refresh the artifacts.
 """
 
 import sys
 import os
+import argparse
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import matplotlib.pyplot as plt
@@ -13,45 +20,77 @@ from src.comparison import (
     generate_sorted_array,
     generate_reverse_sorted_array,
     generate_nearly_sorted_array,
-    generate_array_with_duplicates,
-    compare_algorithms
+    generate_array_with_duplicates
 )
 from src.quicksort import quicksort, randomized_quicksort, quicksort_3way
-import os
+from src.results import load_results, run_incremental_benchmark
+
+
+PERFORMANCE_RESULTS = os.path.join('docs', 'data', 'performance_results.json')
+THREEWAY_RESULTS = os.path.join('docs', 'data', 'quicksort_3way_results.json')
+
+# Test sizes
+SIZES = [100, 500, 1000, 2000, 5000, 10000]
+
+PERFORMANCE_ALGORITHMS = {
+    'Deterministic Quicksort': lambda arr: quicksort(arr),
+    'Randomized Quicksort': lambda arr: randomized_quicksort(arr, seed=42)
+}
+
+PERFORMANCE_GENERATORS = {
+    'Random': generate_random_array,
+    'Sorted': generate_sorted_array,
+    'Reverse Sorted': generate_reverse_sorted_array,
+    'Nearly Sorted': lambda size: generate_nearly_sorted_array(size, swap_count=10),
+    'Many Duplicates': lambda size: generate_array_with_duplicates(size, unique_count=10)
+}
+
+THREEWAY_ALGORITHMS = {
+    'Standard Quicksort (Randomized)': lambda arr: randomized_quicksort(arr, seed=42),
+    'Three-Way Quicksort': lambda arr: quicksort_3way(arr)
+}
+
+# Duplicate levels shared by the three-way line plot and bar chart
+THREEWAY_GENERATORS = {
+    '10 Unique Values': lambda size: generate_array_with_duplicates(size, unique_count=10),
+    '5 Unique Values': lambda size: generate_array_with_duplicates(size, unique_count=5),
+    'All Equal': lambda size: [5] * size  # All elements are the same
+}
+
+
+def run_benchmarks():
+    """Benchmark stage: refresh the results artifacts, rerunning only changed cells."""
+    print("Running benchmarks (only changed cells are rerun)...")
+    run_incremental_benchmark(
+        PERFORMANCE_ALGORITHMS,
+        PERFORMANCE_GENERATORS,
+        SIZES,
+        PERFORMANCE_RESULTS,
+        iterations=3,
+        workers=os.cpu_count()
+    )
+    print(f"Saved: {PERFORMANCE_RESULTS}")
+    
+    print("Running benchmarks for Three-Way Quicksort comparison...")
+    run_incremental_benchmark(
+        THREEWAY_ALGORITHMS,
+        THREEWAY_GENERATORS,
+        SIZES,
+        THREEWAY_RESULTS,
+        iterations=3,
+        workers=os.cpu_count()
+    )
+    print(f"Saved: {THREEWAY_RESULTS}")
 
 
-def generate_performance_plots():
-    """Generate comprehensive performance comparison plots."""
+def generate_performance_plots(results):
+    """Generate comprehensive performance comparison plots from benchmark results."""
     print("Generating performance plots...")
     
     # Ensure docs directory exists
     os.makedirs('docs', exist_ok=True)
     
-    # Define algorithms
-    algorithms = {
-        'Deterministic Quicksort': lambda arr: quicksort(arr),
-        'Randomized Quicksort': lambda arr: randomized_quicksort(arr, seed=42)
-    }
-    
-    # Define array generators
-    array_generators = {
-        'Random': generate_random_array,
-        'Sorted': generate_sorted_array,
-        'Reverse Sorted': generate_reverse_sorted_array,
-        'Nearly Sorted': lambda size: generate_nearly_sorted_array(size, swap_count=10),
-        'Many Duplicates': lambda size: generate_array_with_duplicates(size, unique_count=10)
-    }
-    
-    # Test sizes
-    sizes = [100, 500, 1000, 2000, 5000, 10000]
-    
-    print("Running benchmarks (this may take a few minutes)...")
-    results = compare_algorithms(
-        algorithms=algorithms,
-        array_generators=array_generators,
-        sizes=sizes,
-        iterations=3
-    )
+    sizes = SIZES
     
     # Plot 1: Line plot comparing algorithms across distributions
     print("Generating line plot...")
@@ -59,7 +98,7 @@ def generate_performance_plots():
     fig.suptitle('Quicksort Performance Comparison', fontsize=16, fontweight='bold')
     
     distributions = ['Random', 'Sorted', 'Reverse Sorted', 'Nearly Sorted', 'Many Duplicates']
-    algo_names = list(algorithms.keys())
+    algo_names = list(PERFORMANCE_ALGORITHMS.keys())
     colors = ['#1f77b4', '#ff7f0e']
     
     for idx, dist in enumerate(distributions):
@@ -300,40 +339,15 @@ def generate_performance_plots():
     print("Plots saved in the 'docs' directory.")
 
 
-def generate_3way_quicksort_plot():
+def generate_3way_quicksort_plot(all_results):
     """Generate visualization comparing standard Quicksort vs Three-Way Quicksort on duplicate-heavy data."""
     print("\nGenerating Three-Way Quicksort comparison plot...")
     
     # Ensure docs directory exists
     os.makedirs('docs', exist_ok=True)
     
-    # Define algorithms for comparison
-    algorithms = {
-        'Standard Quicksort (Randomized)': lambda arr: randomized_quicksort(arr, seed=42),
-        'Three-Way Quicksort': lambda arr: quicksort_3way(arr)
-    }
-    
-    # Test with different duplicate levels
-    sizes = [100, 500, 1000, 2000, 5000, 10000]
-    duplicate_configs = [
-        ('10 Unique Values', lambda size: generate_array_with_duplicates(size, unique_count=10)),
-        ('5 Unique Values', lambda size: generate_array_with_duplicates(size, unique_count=5)),
-        ('All Equal', lambda size: [5] * size)  # All elements are the same
-    ]
-    
-    print("Running benchmarks for Three-Way Quicksort comparison...")
-    
-    # Run benchmarks once for all configurations
-    all_results = {}
-    for config_name, gen_func in duplicate_configs:
-        array_generators = {'Test': gen_func}
-        results = compare_algorithms(
-            algorithms=algorithms,
-            array_generators=array_generators,
-            sizes=sizes,
-            iterations=3
-        )
-        all_results[config_name] = results
+    algorithms = THREEWAY_ALGORITHMS
+    duplicate_configs = list(THREEWAY_GENERATORS.items())
     
     # Create figure with subplots
     fig, axes = plt.subplots(1, 3, figsize=(18, 6))
@@ -345,15 +359,15 @@ def generate_3way_quicksort_plot():
     
     for config_idx, (config_name, _) in enumerate(duplicate_configs):
         ax = axes[config_idx]
-        results = all_results[config_name]
         
         for algo_idx, algo_name in enumerate(algorithms.keys()):
-            if 'Test' in results[algo_name]:
-                sizes_list = sorted(results[algo_name]['Test'].keys())
+            if config_name in all_results[algo_name]:
+                cells = all_results[algo_name][config_name]
+                sizes_list = sorted(cells.keys())
                 # Filter out infinite values
-                valid_data = [(s, results[algo_name]['Test'][s]['mean']) 
+                valid_data = [(s, cells[s]['mean']) 
                              for s in sizes_list 
-                             if np.isfinite(results[algo_name]['Test'][s]['mean'])]
+                             if np.isfinite(cells[s]['mean'])]
                 if valid_data:
                     valid_sizes, valid_times = zip(*valid_data)
                     ax.plot(valid_sizes, valid_times, marker=markers[algo_idx], 
@@ -382,28 +396,16 @@ def generate_3way_quicksort_plot():
     x = np.arange(len(test_sizes))
     width = 0.25
     
+    # Short labels for the duplicate levels, reusing the line plot's results
     configs_for_bar = [
-        ('10 Unique', lambda size: generate_array_with_duplicates(size, unique_count=10)),
-        ('5 Unique', lambda size: generate_array_with_duplicates(size, unique_count=5)),
-        ('All Equal', lambda size: [5] * size)
+        ('10 Unique', '10 Unique Values'),
+        ('5 Unique', '5 Unique Values'),
+        ('All Equal', 'All Equal')
     ]
     
     bar_colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
     
-    # Run benchmarks for bar chart
-    bar_results = {}
-    for config_name, gen_func in configs_for_bar:
-        array_generators = {'Test': gen_func}
-        results = compare_algorithms(
-            algorithms=algorithms,
-            array_generators=array_generators,
-            sizes=test_sizes,
-            iterations=3
-        )
-        bar_results[config_name] = results
-    
-    for config_idx, (config_name, _) in enumerate(configs_for_bar):
-        results = bar_results[config_name]
+    for config_idx, (config_name, result_key) in enumerate(configs_for_bar):
         standard_times = []
         threeway_times = []
         
@@ -411,15 +413,15 @@ def generate_3way_quicksort_plot():
             std_time = None
             way3_time = None
             
-            if 'Test' in results['Standard Quicksort (Randomized)']:
-                if size in results['Standard Quicksort (Randomized)']['Test']:
-                    mean_val = results['Standard Quicksort (Randomized)']['Test'][size]['mean']
+            if result_key in all_results['Standard Quicksort (Randomized)']:
+                if size in all_results['Standard Quicksort (Randomized)'][result_key]:
+                    mean_val = all_results['Standard Quicksort (Randomized)'][result_key][size]['mean']
                     if np.isfinite(mean_val):
                         std_time = mean_val
             
-            if 'Test' in results['Three-Way Quicksort']:
-                if size in results['Three-Way Quicksort']['Test']:
-                    mean_val = results['Three-Way Quicksort']['Test'][size]['mean']
+            if result_key in all_results['Three-Way Quicksort']:
+                if size in all_results['Three-Way Quicksort'][result_key]:
+                    mean_val = all_results['Three-Way Quicksort'][result_key][size]['mean']
                     if np.isfinite(mean_val):
                         way3_time = mean_val
             
@@ -461,7 +463,29 @@ def generate_3way_quicksort_plot():
     print("Three-Way Quicksort plots generated successfully!")
 
 
+def generate_all_plots():
+    """Plotting stage: draw every figure from the saved results artifacts."""
+    for path in (PERFORMANCE_RESULTS, THREEWAY_RESULTS):
+        if not os.path.exists(path):
+            raise SystemExit(f"Missing {path}; run the benchmark stage first")
+    
+    performance_results, _ = load_results(PERFORMANCE_RESULTS)
+    threeway_results, _ = load_results(THREEWAY_RESULTS)
+    generate_performance_plots(performance_results)
+    generate_3way_quicksort_plot(threeway_results)
+
+
 if __name__ == '__main__':
-    generate_performance_plots()
-    generate_3way_quicksort_plot()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    stage = parser.add_mutually_exclusive_group()
+    stage.add_argument('--plots-only', action='store_true',
+                       help='redraw figures from saved results without benchmarking')
+    stage.add_argument('--benchmarks-only', action='store_true',
+                       help='refresh saved results without drawing figures')
+    args = parser.parse_args()
+    
+    if not args.plots_only:
+        run_benchmarks()
+    if not args.benchmarks_only:
+        generate_all_plots()
 
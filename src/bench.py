@@ -0,0 +1,331 @@
+"""
+Benchmark Command-Line Runner
+
+Runs a compare_algorithms grid from command-line flags or a TOML/JSON config
+file and writes the results as a table, JSON, or CSV, so the same benchmark
+matrix can run unattended on any host.
+
+Usage:
+    python -m src.bench --algorithms quicksort,randomized --sizes 1000,10000
+    python -m src.bench --config bench.toml --format json --output run.json
+
+Config files use the long flag names as keys (with underscores), e.g.:
+
+    algorithms = ["quicksort", "randomized", "3way"]
+    distributions = ["random", "sorted", "duplicates"]
+    sizes = [1000, 10000, 100000]
+    iterations = 5
+    seed = 42
+    timeout = 60
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+import contextlib
+from typing import List, Callable, Dict, Any, Optional
+
+from .comparison import (
+    generate_random_array,
+    generate_sorted_array,
+    generate_reverse_sorted_array,
+    generate_nearly_sorted_array,
+    generate_array_with_duplicates,
+    generate_organ_pipe_array,
+    generate_sawtooth_array,
+    generate_ascending_runs_array,
+    generate_skewed_duplicates_array,
+    generate_common_prefix_strings,
+    generate_mcilroy_adversary,
+    compare_algorithms,
+    format_results_table
+)
+from .quicksort import quicksort, randomized_quicksort, quicksort_3way
+from .complexity import analyze_scaling, format_scaling_report
+from .results import (
+    write_results,
+    load_results,
+    compare_to_baseline,
+    find_regressions,
+    format_comparison_table
+)
+
+
+DEFAULTS: Dict[str, Any] = {
+    'algorithms': ['quicksort', 'randomized', '3way'],
+    'distributions': ['random', 'sorted', 'reverse_sorted', 'nearly_sorted', 'duplicates'],
+    'sizes': [100, 1000, 10000],
+    'iterations': 3,
+    'seed': 42,
+    'workers': None,
+    'timeout': None,
+    'measure_memory': False,
+    'cache_dir': None,
+    'format': 'table',
+    'output': None,
+    'baseline': None,
+    'scaling': False,
+}
+
+# Fewest timed runs per cell for which --baseline comparisons are allowed;
+# with 3 vs 3 samples no Mann-Whitney p-value can fall below 0.05
+MIN_BASELINE_ITERATIONS = 5
+
+# Distributions with a vectorized counterpart in src.datasets
+_DATASET_NAMES = {'random', 'sorted', 'reverse_sorted', 'nearly_sorted', 'duplicates'}
+
+
+def build_algorithms(names: List[str], seed: int) -> Dict[str, Callable[[List[Any]], Any]]:
+    """
+    Map algorithm names to sorting functions.
+    
+    Args:
+        names: Algorithm names ('quicksort', 'randomized', '3way')
+        seed: Seed for randomized pivot selection
+    
+    Returns:
+        Dictionary mapping algorithm names to sorting functions
+    """
+    registry = {
+        'quicksort': lambda arr: quicksort(arr),
+        'randomized': lambda arr: randomized_quicksort(arr, seed=seed),
+        '3way': lambda arr: quicksort_3way(arr),
+    }
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(f"Unknown algorithm(s) {unknown}; choose from {sorted(registry)}")
+    return {name: registry[name] for name in names}
+
+
+def _seeded_generator(
+    gen_func: Callable[[int], List[Any]],
+    seed: int,
+    name: str
+) -> Callable[[int], List[Any]]:
+    """Wrap gen_func so each size draws from its own seeded random stream."""
+    def generator(size: int) -> List[Any]:
+        random.seed(f"{seed}:{name}:{size}")
+        return gen_func(size)
+    
+    return generator
+
+
+def build_generators(
+    names: List[str],
+    sort_func: Callable[[List[Any]], Any],
+    seed: int,
+    cache_dir: Optional[str] = None
+) -> Dict[str, Callable[[int], List[Any]]]:
+    """
+    Map distribution names to array generators.
+    
+    Every generator seeds the random module from (seed, distribution, size)
+    before building its input, so each cell gets the same input whether it
+    runs in this process or in a worker that inherited another RNG state.
+    
+    Args:
+        names: Distribution names
+        sort_func: Sort the 'mcilroy' adversary is built against
+        seed: Root seed for the inputs of every cell
+        cache_dir: If given, basic distributions come from src.datasets and
+                   are cached there as .npy files
+    
+    Returns:
+        Dictionary mapping distribution names to generator functions
+    """
+    registry = {
+        'random': generate_random_array,
+        'sorted': generate_sorted_array,
+        'reverse_sorted': generate_reverse_sorted_array,
+        'nearly_sorted': lambda size: generate_nearly_sorted_array(size, swap_count=10),
+        'duplicates': lambda size: generate_array_with_duplicates(size, unique_count=10),
+        'organ_pipe': generate_organ_pipe_array,
+        'sawtooth': generate_sawtooth_array,
+        'ascending_runs': generate_ascending_runs_array,
+        'skewed_duplicates': generate_skewed_duplicates_array,
+        'common_prefix_strings': generate_common_prefix_strings,
+        'mcilroy': lambda size: generate_mcilroy_adversary(size, sort_func),
+    }
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(f"Unknown distribution(s) {unknown}; choose from {sorted(registry)}")
+    registry = {name: _seeded_generator(gen_func, seed, name) for name, gen_func in registry.items()}
+    
+    if cache_dir is not None:
+        from .datasets import cached_generator
+        params = {'nearly_sorted': {'swap_count': 10}, 'duplicates': {'unique_count': 10}}
+        for name in _DATASET_NAMES:
+            registry[name] = cached_generator(name, seed=seed, cache_dir=cache_dir,
+                                              **params.get(name, {}))
+    
+    return {name: registry[name] for name in names}
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Load benchmark settings from a TOML or JSON file.
+    
+    Args:
+        path: Path ending in .toml or .json
+    
+    Returns:
+        Dictionary of settings keyed like DEFAULTS
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML config files require Python 3.11+; use JSON instead")
+        with open(path, 'rb') as f:
+            config = tomllib.load(f)
+    elif ext == '.json':
+        with open(path) as f:
+            config = json.load(f)
+    else:
+        raise ValueError(f"Unsupported config format '{ext}' (use .toml or .json)")
+    
+    unknown = sorted(set(config) - set(DEFAULTS))
+    if unknown:
+        raise ValueError(f"Unknown config key(s) {unknown}")
+    return config
+
+
+def run_benchmark(settings: Dict[str, Any]) -> Dict[str, Dict[str, Dict[int, Dict[str, Any]]]]:
+    """
+    Run the benchmark grid described by settings.
+    
+    Args:
+        settings: Dictionary keyed like DEFAULTS
+    
+    Returns:
+        Nested dictionary: results[algorithm][distribution][size] = timing_stats
+    """
+    random.seed(settings['seed'])
+    algorithms = build_algorithms(settings['algorithms'], settings['seed'])
+    options = {
+        'iterations': settings['iterations'],
+        'workers': settings['workers'],
+        'timeout': settings['timeout'],
+        'measure_memory': settings['measure_memory'],
+    }
+    
+    # The McIlroy adversary depends on the algorithm, so give each engine its own grid
+    if 'mcilroy' in settings['distributions']:
+        results = {}
+        for algo_name, algo_func in algorithms.items():
+            generators = build_generators(settings['distributions'], algo_func,
+                                          settings['seed'], settings['cache_dir'])
+            results[algo_name] = compare_algorithms(
+                {algo_name: algo_func}, generators, settings['sizes'], **options
+            )[algo_name]
+        return results
+    
+    generators = build_generators(settings['distributions'], quicksort,
+                                  settings['seed'], settings['cache_dir'])
+    return compare_algorithms(algorithms, generators, settings['sizes'], **options)
+
+
+def _csv_list(value: str) -> List[str]:
+    """Parse a comma-separated flag value into a list of non-empty strings."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _csv_ints(value: str) -> List[int]:
+    """Parse a comma-separated flag value into a list of integers."""
+    return [int(item) for item in _csv_list(value)]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line parser; every flag defaults to None so config values apply."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.bench',
+        description='Run the Quicksort benchmark grid and report the results.'
+    )
+    parser.add_argument('--config', help='TOML or JSON file with benchmark settings')
+    parser.add_argument('--algorithms', type=_csv_list,
+                        help='comma-separated algorithms (quicksort, randomized, 3way)')
+    parser.add_argument('--distributions', type=_csv_list,
+                        help='comma-separated input distributions')
+    parser.add_argument('--sizes', type=_csv_ints, help='comma-separated array sizes')
+    parser.add_argument('--iterations', type=int, help='timed runs per cell')
+    parser.add_argument('--seed', type=int, help='seed for inputs and randomized pivots')
+    parser.add_argument('--workers', type=int, help='run cells in this many worker processes')
+    parser.add_argument('--timeout', type=float, help='per-cell wall-clock budget in seconds')
+    parser.add_argument('--measure-memory', '--memory', action='store_const', const=True,
+                        help='also measure peak/net memory and call depth')
+    parser.add_argument('--cache-dir', help='use NumPy datasets cached in this directory')
+    parser.add_argument('--format', choices=['table', 'json', 'csv'], help='output format')
+    parser.add_argument('--output', help='write results to this file instead of stdout')
+    parser.add_argument('--baseline', help='saved run to compare against; exit 1 on regression '
+                        f'(needs --iterations {MIN_BASELINE_ITERATIONS} or more in both runs)')
+    parser.add_argument('--scaling', action='store_const', const=True,
+                        help='print fitted scaling exponents and extrapolated times to stderr')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for python -m src.bench.
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    
+    Returns:
+        Process exit code: 0 on success, 1 if the baseline comparison found
+        regressions, 2 on invalid settings (including a baseline comparison
+        with fewer than MIN_BASELINE_ITERATIONS iterations)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    settings = dict(DEFAULTS)
+    try:
+        if args.config:
+            settings.update(load_config(args.config))
+        settings.update({key: value for key, value in vars(args).items()
+                         if key != 'config' and value is not None})
+        
+        baseline = None
+        if settings['baseline']:
+            baseline, baseline_meta = load_results(settings['baseline'])
+            baseline_iterations = baseline_meta.get('settings', {}).get('iterations')
+            for run, iterations in (('this run', settings['iterations']),
+                                    (settings['baseline'], baseline_iterations)):
+                if iterations is not None and iterations < MIN_BASELINE_ITERATIONS:
+                    raise ValueError(f"--baseline needs at least {MIN_BASELINE_ITERATIONS} "
+                                     f"iterations per cell, but {run} uses {iterations}")
+        
+        # Progress messages go to stderr so stdout stays machine-readable
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_benchmark(settings)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    metadata = {'settings': {key: settings[key] for key in DEFAULTS
+                             if key not in ('output', 'baseline', 'scaling')}}
+    out = open(settings['output'], 'w', newline='') if settings['output'] else sys.stdout
+    try:
+        if settings['format'] == 'table':
+            out.write(format_results_table(results) + '\n')
+        else:
+            write_results(results, out, settings['format'], metadata)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    if settings['scaling']:
+        print(format_scaling_report(analyze_scaling(results)), file=sys.stderr)
+    
+    if baseline is not None:
+        comparison = compare_to_baseline(baseline, results)
+        print(format_comparison_table(comparison), file=sys.stderr)
+        if find_regressions(comparison):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,9 +5,16 @@ This module provides utilities for comparing different sorting algorithms
 and analyzing their performance characteristics.
 """
 
+import os
+import sys
 import time
 import random
-from typing import List, Callable, Dict, Tuple, Any
+import string
+import tracemalloc
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
+from typing import List, Callable, Dict, Tuple, Any, Optional
 from functools import wraps
 import statistics
 
@@ -63,10 +70,239 @@ def generate_array_with_duplicates(size: int, unique_count: int = 10) -> List[in
     return [random.choice(unique_values) for _ in range(size)]
 
 
+def generate_organ_pipe_array(size: int) -> List[int]:
+    """Generate an organ-pipe array: ascending to the middle, then descending."""
+    rising = (size + 1) // 2
+    return list(range(rising)) + list(range(size - rising - 1, -1, -1))
+
+
+def generate_sawtooth_array(size: int, teeth: int = 10) -> List[int]:
+    """Generate a sawtooth array made of `teeth` repeated ascending ramps."""
+    period = max(1, -(-size // max(1, teeth)))
+    return [i % period for i in range(size)]
+
+
+def generate_ascending_runs_array(size: int, mean_run_length: int = 32) -> List[int]:
+    """Generate random values arranged as ascending runs of random length."""
+    arr = [random.randint(0, size) for _ in range(size)]
+    start = 0
+    while start < size:
+        end = min(size, start + random.randint(1, 2 * mean_run_length - 1))
+        arr[start:end] = sorted(arr[start:end])
+        start = end
+    return arr
+
+
+def generate_skewed_duplicates_array(size: int, unique_count: int = 10, skew: float = 1.5) -> List[int]:
+    """Generate few unique values with Zipf-like frequencies (value 0 most common)."""
+    weights = [1.0 / (rank + 1) ** skew for rank in range(unique_count)]
+    return random.choices(range(unique_count), weights=weights, k=size)
+
+
+def generate_common_prefix_strings(
+    size: int,
+    prefix_length: int = 64,
+    suffix_length: int = 8,
+    prefix_count: int = 4
+) -> List[str]:
+    """
+    Generate strings that share long common prefixes (e.g. URLs or log keys).
+    
+    All strings start with the same base; `prefix_count` variants differ only
+    in the last character of the prefix, followed by a short random suffix.
+    """
+    letters = string.ascii_lowercase
+    base = ''.join(random.choice(letters) for _ in range(max(0, prefix_length - 1)))
+    prefixes = [base + letters[i % len(letters)] for i in range(max(1, prefix_count))]
+    return [
+        random.choice(prefixes) + ''.join(random.choice(letters) for _ in range(suffix_length))
+        for _ in range(size)
+    ]
+
+
+class _McIlroyAdversary:
+    """
+    State of McIlroy's "A Killer Adversary for Quicksort".
+    
+    Every element starts as 'gas' (value unknown). Comparisons freeze gas
+    values lazily so that the element the sort is likely using as pivot
+    always ends up among the smallest values.
+    """
+    
+    def __init__(self, size: int):
+        self.gas = size
+        self.values = [size] * size
+        self.nsolid = 0
+        self.candidate = 0
+    
+    def freeze(self, index: int) -> None:
+        self.values[index] = self.nsolid
+        self.nsolid += 1
+    
+    def compare(self, x: int, y: int) -> int:
+        values = self.values
+        if values[x] == self.gas and values[y] == self.gas:
+            self.freeze(x if x == self.candidate else y)
+        if values[x] == self.gas:
+            self.candidate = x
+        elif values[y] == self.gas:
+            self.candidate = y
+        return values[x] - values[y]
+
+
+class _AdversaryItem:
+    """Placeholder element whose value is decided by _McIlroyAdversary."""
+    
+    __slots__ = ('index', 'adversary')
+    __hash__ = None
+    
+    def __init__(self, index: int, adversary: _McIlroyAdversary):
+        self.index = index
+        self.adversary = adversary
+    
+    def __lt__(self, other: '_AdversaryItem') -> bool:
+        return self.adversary.compare(self.index, other.index) < 0
+    
+    def __gt__(self, other: '_AdversaryItem') -> bool:
+        return self.adversary.compare(self.index, other.index) > 0
+    
+    def __le__(self, other: '_AdversaryItem') -> bool:
+        return self.adversary.compare(self.index, other.index) <= 0
+    
+    def __ge__(self, other: '_AdversaryItem') -> bool:
+        return self.adversary.compare(self.index, other.index) >= 0
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _AdversaryItem):
+            return NotImplemented
+        return self.adversary.compare(self.index, other.index) == 0
+
+
+def generate_mcilroy_adversary(
+    size: int,
+    sort_func: Optional[Callable[[List[Any]], Any]] = None
+) -> List[int]:
+    """
+    Generate McIlroy's "antiquicksort" input for a given sort function.
+    
+    The adversary runs sort_func once on placeholder elements and decides
+    each element's value during the comparisons, so the resulting input
+    drives that pivot rule towards quadratic behavior. sort_func must be
+    deterministic (e.g. randomized_quicksort with a fixed seed) and sort in
+    place or return the sorted list, like the functions given to
+    compare_algorithms.
+    
+    If the construction run exceeds the recursion limit, the values decided
+    so far are kept and the remaining ones are frozen in order; the input
+    still drives the sort to the same depth.
+    
+    Args:
+        size: Number of elements
+        sort_func: Sort to attack; defaults to deterministic quicksort
+    
+    Returns:
+        A permutation of range(size)
+    """
+    if sort_func is None:
+        from .quicksort import quicksort
+        sort_func = quicksort
+    
+    adversary = _McIlroyAdversary(size)
+    items = [_AdversaryItem(i, adversary) for i in range(size)]
+    try:
+        sort_func(items)
+    except RecursionError:
+        pass
+    
+    for i in range(size):
+        if adversary.values[i] == adversary.gas:
+            adversary.freeze(i)
+    return adversary.values
+
+
+def measure_memory_usage(
+    sort_func: Callable[[List[Any]], Any],
+    array: List[Any]
+) -> Dict[str, int]:
+    """
+    Measure the memory a sorting function allocates on a copy of array.
+    
+    Uses tracemalloc, so the run is much slower than a timed one and should
+    never be mixed with timing measurements.
+    
+    Args:
+        sort_func: The sorting function to measure
+        array: The array to sort (copied before measuring)
+    
+    Returns:
+        Dictionary with 'peak_memory' (highest traced allocation above the
+        starting point during the sort, in bytes) and 'net_memory' (bytes
+        still allocated when the sort returns, including any returned copy)
+    """
+    arr_copy = array.copy()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        result = sort_func(arr_copy)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    del result
+    return {
+        'peak_memory': max(0, peak - before),
+        'net_memory': after - before
+    }
+
+
+def measure_max_depth(
+    sort_func: Callable[[List[Any]], Any],
+    array: List[Any]
+) -> int:
+    """
+    Measure the deepest Python call stack a sorting function reaches.
+    
+    For the recursive engines this is the recursion depth plus a small
+    constant for the entry point and wrappers, which is what drives stack
+    memory.
+    
+    Args:
+        sort_func: The sorting function to measure
+        array: The array to sort (copied before measuring)
+    
+    Returns:
+        Maximum call depth below (and including) sort_func
+    """
+    arr_copy = array.copy()
+    depth = 0
+    max_depth = 0
+    
+    def profiler(frame: Any, event: str, arg: Any) -> None:
+        nonlocal depth, max_depth
+        if event == 'call':
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        elif event == 'return':
+            depth -= 1
+    
+    previous = sys.getprofile()
+    sys.setprofile(profiler)
+    try:
+        sort_func(arr_copy)
+    finally:
+        sys.setprofile(previous)
+    return max_depth
+
+
 def benchmark_sorting_algorithm(
     sort_func: Callable[[List[Any]], Any],
     array: List[Any],
-    iterations: int = 1
+    iterations: int = 1,
+    measure_memory: bool = False
 ) -> Dict[str, float]:
     """
     Benchmark a sorting algorithm on a given array.
@@ -75,9 +311,14 @@ def benchmark_sorting_algorithm(
         sort_func: The sorting function to benchmark
         array: The array to sort
         iterations: Number of iterations to run (for averaging)
+        measure_memory: If True, also report 'peak_memory' and 'net_memory'
+                        (bytes, via tracemalloc) and 'max_depth' (call depth).
+                        These come from separate untimed runs so they do not
+                        distort the timings.
     
     Returns:
-        Dictionary with timing statistics
+        Dictionary with timing statistics, plus the raw per-iteration
+        timings under 'samples'
     """
     times = []
     
@@ -96,12 +337,206 @@ def benchmark_sorting_algorithm(
         
         times.append(end_time - start_time)
     
-    return {
+    stats = {
         'mean': statistics.mean(times),
         'median': statistics.median(times),
         'min': min(times),
         'max': max(times),
-        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'samples': times
+    }
+    
+    if measure_memory:
+        stats.update(measure_memory_usage(sort_func, array))
+        stats['max_depth'] = measure_max_depth(sort_func, array)
+    
+    return stats
+
+
+# Status recorded with every cell in compare_algorithms results
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+STATUS_SKIPPED = 'skipped'
+
+
+def _failed_stats(status: str = STATUS_ERROR) -> Dict[str, Any]:
+    """Timing statistics recorded for a cell that could not be benchmarked."""
+    return {
+        'mean': float('inf'),
+        'median': float('inf'),
+        'min': float('inf'),
+        'max': float('inf'),
+        'stdev': 0.0,
+        'samples': [],
+        'status': status
+    }
+
+
+def _run_cell(
+    algo_func: Callable[[List[Any]], Any],
+    gen_func: Callable[[int], List[Any]],
+    size: int,
+    iterations: int,
+    measure_memory: bool = False
+) -> Dict[str, float]:
+    """Generate the input for one grid cell and benchmark it."""
+    test_array = gen_func(size)
+    return benchmark_sorting_algorithm(algo_func, test_array, iterations, measure_memory)
+
+
+def _cell_worker(
+    conn: Any,
+    algo_func: Callable[[List[Any]], Any],
+    gen_func: Callable[[int], List[Any]],
+    size: int,
+    iterations: int,
+    measure_memory: bool,
+    cpu: Optional[int]
+) -> None:
+    """
+    Entry point of a worker process that benchmarks exactly one grid cell.
+    
+    The outcome is sent back through conn as ('ok', stats) or ('error', message).
+    """
+    if cpu is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {cpu})
+    try:
+        conn.send((STATUS_OK, _run_cell(algo_func, gen_func, size, iterations, measure_memory)))
+    except Exception as e:
+        conn.send((STATUS_ERROR, str(e)))
+    finally:
+        conn.close()
+
+
+def _process_context() -> Any:
+    """
+    Multiprocessing context used for grid workers.
+    
+    'fork' lets workers inherit lambdas and closures without pickling them;
+    platforms without it fall back to the default start method, in which case
+    algorithms and generators must be picklable module-level functions.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def _compare_algorithms_parallel(
+    algorithms: Dict[str, Callable[[List[Any]], Any]],
+    array_generators: Dict[str, Callable[[int], List[Any]]],
+    sizes: List[int],
+    iterations: int,
+    workers: int,
+    cpu_affinity: Optional[List[int]],
+    timeout: Optional[float],
+    measure_memory: bool
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Run every grid cell in its own short-lived worker process.
+    
+    At most `workers` processes run at once. Each process benchmarks a single
+    cell and exits, so cells never share an interpreter, heap, or warmed cache.
+    When cpu_affinity is given, each worker slot is pinned to one of those CPUs.
+    
+    When timeout is given, a cell still running after `timeout` seconds is
+    killed and recorded as timed out, and every larger size of the same
+    (algorithm, distribution) pair is skipped (cancelled if already running).
+    """
+    ctx = _process_context()
+    if cpu_affinity:
+        free_slots = [cpu_affinity[i % len(cpu_affinity)] for i in range(workers)]
+    else:
+        free_slots = [None] * workers
+    
+    pending = deque(
+        (algo_name, dist_name, size)
+        for algo_name in algorithms
+        for dist_name in array_generators
+        for size in sorted(sizes)
+    )
+    running = {}
+    collected = {}
+    
+    def _stop(conn: Any) -> None:
+        """Kill a running cell and release its slot."""
+        proc, _, cpu, _ = running.pop(conn)
+        proc.kill()
+        proc.join()
+        conn.close()
+        free_slots.append(cpu)
+    
+    def _skip_larger(algo_name: str, dist_name: str, size: int) -> None:
+        """Skip every cell of the pair larger than a size that timed out."""
+        for cell in [c for c in pending if c[:2] == (algo_name, dist_name) and c[2] > size]:
+            pending.remove(cell)
+            collected[cell] = _failed_stats(STATUS_SKIPPED)
+        for conn in [c for c, entry in running.items()
+                     if entry[1][:2] == (algo_name, dist_name) and entry[1][2] > size]:
+            collected[running[conn][1]] = _failed_stats(STATUS_SKIPPED)
+            _stop(conn)
+    
+    while pending or running:
+        # Fill every free slot with the next cell
+        while pending and free_slots:
+            algo_name, dist_name, size = pending.popleft()
+            cpu = free_slots.pop()
+            print(f"Testing {algo_name} on {dist_name} array of size {size}...")
+            
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proc = ctx.Process(
+                target=_cell_worker,
+                args=(send_conn, algorithms[algo_name], array_generators[dist_name],
+                      size, iterations, measure_memory, cpu),
+                daemon=True
+            )
+            proc.start()
+            send_conn.close()
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            running[recv_conn] = (proc, (algo_name, dist_name, size), cpu, deadline)
+        
+        # Wait until a cell finishes or the earliest deadline passes
+        wait_for = None
+        if timeout is not None:
+            wait_for = max(0.0, min(entry[3] for entry in running.values()) - time.monotonic())
+        
+        for conn in wait(list(running), timeout=wait_for):
+            proc, cell, cpu, _ = running.pop(conn)
+            algo_name, dist_name, size = cell
+            try:
+                status, payload = conn.recv()
+            except EOFError:
+                status, payload = STATUS_ERROR, f"worker exited with code {proc.exitcode}"
+            conn.close()
+            proc.join()
+            free_slots.append(cpu)
+            
+            if status == STATUS_OK:
+                collected[cell] = dict(payload, status=STATUS_OK)
+            else:
+                print(f"Error testing {algo_name} on {dist_name} size {size}: {payload}")
+                collected[cell] = _failed_stats(STATUS_ERROR)
+        
+        # Kill cells that have exceeded their budget
+        if timeout is not None:
+            now = time.monotonic()
+            for conn in [c for c, entry in running.items() if entry[3] <= now]:
+                if conn not in running:
+                    continue  # Already cancelled as a larger size of this pair
+                algo_name, dist_name, size = running[conn][1]
+                print(f"Timeout testing {algo_name} on {dist_name} size {size} "
+                      f"after {timeout}s; skipping larger sizes")
+                collected[(algo_name, dist_name, size)] = _failed_stats(STATUS_TIMEOUT)
+                _stop(conn)
+                _skip_larger(algo_name, dist_name, size)
+    
+    # Rebuild in grid order so the result matches the sequential layout
+    return {
+        algo_name: {
+            dist_name: {size: collected[(algo_name, dist_name, size)] for size in sizes}
+            for dist_name in array_generators
+        }
+        for algo_name in algorithms
     }
 
 
@@ -109,8 +544,12 @@ def compare_algorithms(
     algorithms: Dict[str, Callable[[List[Any]], Any]],
     array_generators: Dict[str, Callable[[int], List[Any]]],
     sizes: List[int],
-    iterations: int = 3
-) -> Dict[str, Dict[str, Dict[str, float]]]:
+    iterations: int = 3,
+    workers: Optional[int] = None,
+    cpu_affinity: Optional[List[int]] = None,
+    timeout: Optional[float] = None,
+    measure_memory: bool = False
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
     """
     Compare multiple sorting algorithms on different input distributions and sizes.
     
@@ -119,10 +558,38 @@ def compare_algorithms(
         array_generators: Dictionary mapping distribution names to generator functions
         sizes: List of array sizes to test
         iterations: Number of iterations per test (for averaging)
+        workers: If given, run each (algorithm, distribution, size) cell in its
+                 own worker process, with at most this many running at once.
+                 If None, cells run sequentially in the current process.
+        cpu_affinity: Optional list of CPU ids to pin worker processes to
+                      (Linux only). Implies process mode; defaults workers
+                      to len(cpu_affinity).
+        timeout: Optional wall-clock budget in seconds per cell. The cell runs
+                 in a worker process that is killed when the budget runs out,
+                 and larger sizes of the same (algorithm, distribution) pair
+                 are skipped. Implies process mode with one worker by default.
+        measure_memory: If True, each cell also reports peak and net memory
+                        and maximum call depth (see benchmark_sorting_algorithm)
     
     Returns:
-        Nested dictionary: results[algorithm][distribution][size] = timing_stats
+        Nested dictionary: results[algorithm][distribution][size] = timing_stats.
+        Each timing_stats dict carries a 'status' of 'ok', 'error', 'timeout',
+        or 'skipped'; cells that did not complete report infinite times.
     """
+    if timeout is not None and timeout <= 0:
+        raise ValueError(f"timeout must be positive, got {timeout}")
+    if cpu_affinity and workers is None:
+        workers = len(cpu_affinity)
+    if timeout is not None and workers is None:
+        workers = 1
+    if workers is not None:
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        return _compare_algorithms_parallel(
+            algorithms, array_generators, sizes, iterations, workers, cpu_affinity,
+            timeout, measure_memory
+        )
+    
     results = {}
     
     for algo_name, algo_func in algorithms.items():
@@ -134,27 +601,85 @@ def compare_algorithms(
             for size in sizes:
                 print(f"Testing {algo_name} on {dist_name} array of size {size}...")
                 
-                # Generate test array
-                test_array = gen_func(size)
-                
-                # Benchmark
+                # Generate test array and benchmark
                 try:
-                    stats = benchmark_sorting_algorithm(algo_func, test_array, iterations)
-                    results[algo_name][dist_name][size] = stats
+                    stats = _run_cell(algo_func, gen_func, size, iterations, measure_memory)
+                    results[algo_name][dist_name][size] = dict(stats, status=STATUS_OK)
                 except Exception as e:
                     print(f"Error testing {algo_name} on {dist_name} size {size}: {e}")
-                    results[algo_name][dist_name][size] = {
-                        'mean': float('inf'),
-                        'median': float('inf'),
-                        'min': float('inf'),
-                        'max': float('inf'),
-                        'stdev': 0.0
-                    }
+                    results[algo_name][dist_name][size] = _failed_stats(STATUS_ERROR)
     
     return results
 
 
-def format_results_table(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+def adversarial_generators(
+    sort_func: Optional[Callable[[List[Any]], Any]] = None
+) -> Dict[str, Callable[[int], List[Any]]]:
+    """
+    Adversarial and structured input distributions.
+    
+    Args:
+        sort_func: Sort the McIlroy adversary is built against
+                   (defaults to deterministic quicksort)
+    
+    Returns:
+        Dictionary mapping distribution names to generator functions
+    """
+    return {
+        'McIlroy Adversary': lambda size: generate_mcilroy_adversary(size, sort_func),
+        'Organ Pipe': generate_organ_pipe_array,
+        'Sawtooth': generate_sawtooth_array,
+        'Ascending Runs': generate_ascending_runs_array,
+        'Skewed Duplicates': generate_skewed_duplicates_array,
+        'Common Prefix Strings': generate_common_prefix_strings
+    }
+
+
+def run_adversarial_benchmark(
+    sizes: List[int],
+    algorithms: Optional[Dict[str, Callable[[List[Any]], Any]]] = None,
+    iterations: int = 3,
+    **options: Any
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Benchmark preset running every engine against the adversarial inputs.
+    
+    The McIlroy adversary is rebuilt against each algorithm, so every engine
+    faces the input that is worst for its own pivot rule.
+    
+    Args:
+        sizes: List of array sizes to test
+        algorithms: Dictionary mapping algorithm names to sorting functions;
+                    defaults to all Quicksort engines
+        iterations: Number of iterations per test (for averaging)
+        **options: Forwarded to compare_algorithms (workers, cpu_affinity,
+                   timeout, measure_memory)
+    
+    Returns:
+        Nested dictionary: results[algorithm][distribution][size] = timing_stats
+    """
+    if algorithms is None:
+        from .quicksort import quicksort, randomized_quicksort, quicksort_3way
+        algorithms = {
+            'Deterministic Quicksort': lambda arr: quicksort(arr),
+            'Randomized Quicksort': lambda arr: randomized_quicksort(arr, seed=42),
+            'Three-Way Quicksort': lambda arr: quicksort_3way(arr)
+        }
+    
+    results = {}
+    for algo_name, algo_func in algorithms.items():
+        engine_results = compare_algorithms(
+            {algo_name: algo_func},
+            adversarial_generators(algo_func),
+            sizes,
+            iterations=iterations,
+            **options
+        )
+        results[algo_name] = engine_results[algo_name]
+    return results
+
+
+def format_results_table(results: Dict[str, Dict[str, Dict[str, Any]]]) -> str:
     """
     Format benchmark results as a readable table.
     
@@ -175,16 +700,33 @@ def format_results_table(results: Dict[str, Dict[str, Dict[str, float]]]) -> str
         lines.append("-" * 80)
         
         for dist_name in results[algo_name]:
+            cells = results[algo_name][dist_name]
+            # Memory columns appear only when the run measured memory
+            with_memory = any('peak_memory' in stats for stats in cells.values())
+            
+            header = f"  {'Size':<10} {'Mean (s)':<15} {'Median (s)':<15} {'Min (s)':<15} {'Max (s)':<15}"
+            if with_memory:
+                header += f" {'Peak (KiB)':<12} {'Net (KiB)':<12} {'Depth':<8}"
             lines.append(f"\n  {dist_name}:")
-            lines.append(f"  {'Size':<10} {'Mean (s)':<15} {'Median (s)':<15} {'Min (s)':<15} {'Max (s)':<15}")
-            lines.append("  " + "-" * 70)
+            lines.append(header)
+            lines.append("  " + "-" * (105 if with_memory else 70))
             
-            for size in sorted(results[algo_name][dist_name].keys()):
-                stats = results[algo_name][dist_name][size]
-                lines.append(
+            for size in sorted(cells.keys()):
+                stats = cells[size]
+                status = stats.get('status', STATUS_OK)
+                if status != STATUS_OK:
+                    lines.append(f"  {size:<10} {status.upper()}")
+                    continue
+                row = (
                     f"  {size:<10} {stats['mean']:<15.6f} {stats['median']:<15.6f} "
                     f"{stats['min']:<15.6f} {stats['max']:<15.6f}"
                 )
+                if with_memory and 'peak_memory' in stats:
+                    row += (
+                        f" {stats['peak_memory'] / 1024:<12.1f} "
+                        f"{stats['net_memory'] / 1024:<12.1f} {stats['max_depth']:<8}"
+                    )
+                lines.append(row)
     
     lines.append("\n" + "=" * 80)
     return "\n".join(lines)
@@ -0,0 +1,230 @@
+"""
+Empirical Complexity Fitting
+
+This module fits the timing series from compare_algorithms to scaling models,
+reporting the fitted exponent and constant of each (algorithm, distribution)
+series, flagging series that trend quadratic, and extrapolating running times
+to sizes far beyond the benchmarked ones.
+"""
+
+import math
+from typing import List, Callable, Dict, Tuple, Any, Optional
+
+
+# Candidate growth models, as functions of n
+MODELS: Dict[str, Callable[[float], float]] = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log2(n),
+    'n^2': lambda n: n * n,
+}
+
+DEFAULT_EXTRAPOLATION_SIZES = [10 ** 6, 10 ** 7, 10 ** 8]
+
+
+def fit_power_law(sizes: List[int], times: List[float]) -> Tuple[float, float]:
+    """
+    Fit t = c * n^k by least squares on log-log data.
+    
+    Args:
+        sizes: Input sizes (at least two distinct values, all > 0)
+        times: Measured times in seconds (all > 0)
+    
+    Returns:
+        Tuple of (exponent k, constant c)
+    """
+    if len(set(sizes)) < 2:
+        raise ValueError("At least two distinct sizes are needed to fit a power law")
+    
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    slope = (sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+             / sum((x - x_mean) ** 2 for x in xs))
+    return slope, math.exp(y_mean - slope * x_mean)
+
+
+def fit_model(sizes: List[int], times: List[float], model: str) -> Tuple[float, float]:
+    """
+    Fit t = c * f(n) for one candidate model by least squares on log data.
+    
+    Args:
+        sizes: Input sizes (all > 1)
+        times: Measured times in seconds (all > 0)
+        model: Key of MODELS
+    
+    Returns:
+        Tuple of (constant c, root-mean-square residual in natural-log units)
+    """
+    f = MODELS[model]
+    logs = [math.log(t) - math.log(f(n)) for n, t in zip(sizes, times)]
+    log_c = sum(logs) / len(logs)
+    rms = math.sqrt(sum((v - log_c) ** 2 for v in logs) / len(logs))
+    return math.exp(log_c), rms
+
+
+def fit_series(
+    sizes: List[int],
+    times: List[float],
+    extrapolate_to: Optional[List[int]] = None,
+    quadratic_threshold: float = 1.5
+) -> Dict[str, Any]:
+    """
+    Fit one timing series to the power law and every candidate model.
+    
+    Args:
+        sizes: Input sizes
+        times: Measured times in seconds
+        extrapolate_to: Sizes to predict times for (defaults to 10^6..10^8)
+        quadratic_threshold: Exponent at or above which the series is
+                             flagged as trending quadratic
+    
+    Returns:
+        Dictionary with 'exponent' and 'constant' (power law), 'model' (best
+        candidate), 'model_constant', 'residuals' per model, 'quadratic' flag,
+        'points', and 'extrapolated' times from the best model
+    """
+    if extrapolate_to is None:
+        extrapolate_to = DEFAULT_EXTRAPOLATION_SIZES
+    
+    exponent, constant = fit_power_law(sizes, times)
+    fits = {model: fit_model(sizes, times, model) for model in MODELS}
+    best = min(fits, key=lambda model: fits[model][1])
+    model_constant = fits[best][0]
+    
+    return {
+        'exponent': exponent,
+        'constant': constant,
+        'model': best,
+        'model_constant': model_constant,
+        'residuals': {model: fit[1] for model, fit in fits.items()},
+        'quadratic': exponent >= quadratic_threshold or best == 'n^2',
+        'points': len(sizes),
+        'extrapolated': {n: model_constant * MODELS[best](n) for n in extrapolate_to}
+    }
+
+
+def analyze_scaling(
+    results: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]],
+    extrapolate_to: Optional[List[int]] = None,
+    quadratic_threshold: float = 1.5,
+    statistic: str = 'median'
+) -> Dict[str, Dict[str, Optional[Dict[str, Any]]]]:
+    """
+    Fit every (algorithm, distribution) series in compare_algorithms results.
+    
+    Only cells that completed (status 'ok' with a finite time) are used.
+    Degenerate points that a log-log fit cannot use (size 1 or below, or a
+    time of zero) are left out of the fit without counting as incomplete. A
+    series that timed out or failed at some size is flagged as quadratic,
+    since it did not finish where a faster engine did.
+    
+    Args:
+        results: Results dictionary from compare_algorithms
+        extrapolate_to: Sizes to predict times for (defaults to 10^6..10^8)
+        quadratic_threshold: Exponent at or above which a series is flagged
+        statistic: Timing statistic to fit ('median', 'mean', or 'min')
+    
+    Returns:
+        Nested dictionary: analysis[algorithm][distribution] = fit_series()
+        output plus 'incomplete' (sizes that did not finish), or None when
+        fewer than two sizes completed
+    """
+    analysis = {}
+    
+    for algo_name, dists in results.items():
+        analysis[algo_name] = {}
+        for dist_name, cells in dists.items():
+            sizes, times, incomplete = [], [], []
+            for size in sorted(cells):
+                stats = cells[size]
+                value = stats.get(statistic, float('inf'))
+                if stats.get('status', 'ok') != 'ok' or not math.isfinite(value):
+                    incomplete.append(size)
+                elif value > 0 and size > 1:
+                    sizes.append(size)
+                    times.append(value)
+            
+            if len(set(sizes)) < 2:
+                analysis[algo_name][dist_name] = None
+                continue
+            
+            fit = fit_series(sizes, times, extrapolate_to, quadratic_threshold)
+            fit['incomplete'] = incomplete
+            if incomplete:
+                fit['quadratic'] = True
+            analysis[algo_name][dist_name] = fit
+    
+    return analysis
+
+
+def unsafe_series(
+    analysis: Dict[str, Dict[str, Optional[Dict[str, Any]]]],
+    budget: Optional[float] = None
+) -> List[Tuple[str, str]]:
+    """
+    List (algorithm, distribution) series that are unsafe to run at scale.
+    
+    Args:
+        analysis: Output of analyze_scaling
+        budget: If given, also flag series whose extrapolated time at any
+                size exceeds this many seconds
+    
+    Returns:
+        List of flagged series in result order
+    """
+    flagged = []
+    for algo_name, dists in analysis.items():
+        for dist_name, fit in dists.items():
+            if fit is None:
+                continue
+            over_budget = budget is not None and any(t > budget for t in fit['extrapolated'].values())
+            if fit['quadratic'] or over_budget:
+                flagged.append((algo_name, dist_name))
+    return flagged
+
+
+def _format_duration(seconds: float) -> str:
+    """Human-readable duration for extrapolated times."""
+    for unit, scale in (('d', 86400.0), ('h', 3600.0), ('min', 60.0)):
+        if seconds >= scale:
+            return f"{seconds / scale:.1f}{unit}"
+    return f"{seconds:.3g}s"
+
+
+def format_scaling_report(analysis: Dict[str, Dict[str, Optional[Dict[str, Any]]]]) -> str:
+    """
+    Format a scaling analysis as a readable table.
+    
+    Args:
+        analysis: Output of analyze_scaling
+    
+    Returns:
+        Formatted string table
+    """
+    lines = []
+    lines.append("=" * 80)
+    lines.append("EMPIRICAL SCALING ANALYSIS")
+    lines.append("=" * 80)
+    
+    for algo_name in analysis:
+        lines.append(f"\n{algo_name.upper()}")
+        lines.append("-" * 80)
+        
+        for dist_name, fit in analysis[algo_name].items():
+            if fit is None:
+                lines.append(f"\n  {dist_name}: not enough completed sizes to fit")
+                continue
+            
+            flag = "  <-- TRENDING QUADRATIC" if fit['quadratic'] else ""
+            lines.append(f"\n  {dist_name}:{flag}")
+            lines.append(f"    Exponent: {fit['exponent']:.2f}   Constant: {fit['constant']:.3e}   "
+                         f"Best model: {fit['model']} (c = {fit['model_constant']:.3e})")
+            if fit['incomplete']:
+                lines.append(f"    Did not complete at sizes: {fit['incomplete']}")
+            extrapolated = "   ".join(f"n={n:.0e}: {_format_duration(t)}"
+                                     for n, t in fit['extrapolated'].items())
+            lines.append(f"    Extrapolated: {extrapolated}")
+    
+    lines.append("\n" + "=" * 80)
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+"""
+Vectorized Benchmark Datasets
+
+This module provides NumPy-vectorized versions of the input distributions in
+comparison.py. Every (distribution, size, seed) cell draws from its own
+independent random stream, and generated datasets are cached on disk as .npy
+files that are memory-mapped back on later runs, so repeated benchmarks start
+instantly and see identical inputs.
+"""
+
+import os
+import zlib
+from typing import Callable, Dict, Any, Optional
+
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'QUICKSORT_DATASET_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'quicksort_datasets')
+)
+
+
+def _random(rng: np.random.Generator, size: int, min_val: int = 0, max_val: int = 1000) -> np.ndarray:
+    """Uniform random integers in [min_val, max_val]."""
+    return rng.integers(min_val, max_val, size=size, endpoint=True, dtype=np.int64)
+
+
+def _sorted(rng: np.random.Generator, size: int, start: int = 0, step: int = 1) -> np.ndarray:
+    """Ascending integers."""
+    return np.arange(start, start + size * step, step, dtype=np.int64)
+
+
+def _reverse_sorted(rng: np.random.Generator, size: int, start: int = 0, step: int = 1) -> np.ndarray:
+    """Descending integers."""
+    return np.arange(start + (size - 1) * step, start - step, -step, dtype=np.int64)
+
+
+def _nearly_sorted(rng: np.random.Generator, size: int, swap_count: int = 10) -> np.ndarray:
+    """Ascending integers with swap_count random transpositions."""
+    arr = np.arange(size, dtype=np.int64)
+    if size == 0:
+        return arr
+    pairs = rng.integers(0, size, size=(swap_count, 2))
+    # Apply swaps in order so overlapping pairs behave like the list version
+    for i, j in pairs:
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def _duplicates(rng: np.random.Generator, size: int, unique_count: int = 10) -> np.ndarray:
+    """Values drawn uniformly from range(unique_count)."""
+    return rng.integers(0, unique_count, size=size, dtype=np.int64)
+
+
+# Vectorized counterparts of the list generators in comparison.py
+DISTRIBUTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    'random': _random,
+    'sorted': _sorted,
+    'reverse_sorted': _reverse_sorted,
+    'nearly_sorted': _nearly_sorted,
+    'duplicates': _duplicates,
+}
+
+
+def cell_rng(distribution: str, size: int, seed: int = 0) -> np.random.Generator:
+    """
+    Independent random stream for one (distribution, size, seed) cell.
+    
+    Streams are derived with SeedSequence spawn keys, so cells never share or
+    overlap random state and each cell is reproducible on its own.
+    
+    Args:
+        distribution: Distribution name
+        size: Array size
+        seed: Root seed of the benchmark run
+    
+    Returns:
+        A seeded numpy Generator
+    """
+    spawn_key = (zlib.crc32(distribution.encode('utf-8')), size)
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=spawn_key))
+
+
+def _cache_path(cache_dir: str, distribution: str, size: int, seed: int, params: Dict[str, Any]) -> str:
+    """File name encoding the full cache key of a dataset."""
+    suffix = ''.join(f"-{name}={params[name]}" for name in sorted(params))
+    return os.path.join(cache_dir, f"{distribution}{suffix}-n{size}-s{seed}.npy")
+
+
+def generate_dataset(
+    distribution: str,
+    size: int,
+    seed: int = 0,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    **params: Any
+) -> np.ndarray:
+    """
+    Generate (or load from cache) the dataset for one benchmark cell.
+    
+    Args:
+        distribution: One of the names in DISTRIBUTIONS
+        size: Number of elements
+        seed: Root seed; combined with distribution and size into a cell stream
+        cache_dir: Directory for cached .npy files, or None to disable caching
+        **params: Distribution parameters (e.g. unique_count, swap_count),
+                  which are part of the cache key
+    
+    Returns:
+        A read-only memory-mapped array when cached, otherwise an in-memory array
+    
+    Example:
+        >>> data = generate_dataset('duplicates', 1000, seed=7, cache_dir=None, unique_count=5)
+        >>> len(data), int(data.max()) < 5
+        (1000, True)
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}'")
+    
+    generator = DISTRIBUTIONS[distribution]
+    if cache_dir is None:
+        return generator(cell_rng(distribution, size, seed), size, **params)
+    
+    path = _cache_path(cache_dir, distribution, size, seed, params)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        data = generator(cell_rng(distribution, size, seed), size, **params)
+        # Write to a private file first so concurrent workers never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, data)
+        os.replace(tmp_path, path)
+    
+    return np.load(path, mmap_mode='r')
+
+
+def cached_generator(
+    distribution: str,
+    seed: int = 0,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    as_list: bool = True,
+    **params: Any
+) -> Callable[[int], Any]:
+    """
+    Build a size -> array generator for use with compare_algorithms.
+    
+    Args:
+        distribution: One of the names in DISTRIBUTIONS
+        seed: Root seed of the benchmark run
+        cache_dir: Directory for cached .npy files, or None to disable caching
+        as_list: If True, return Python lists (what the sort engines expect);
+                 otherwise return the memory-mapped array itself
+        **params: Distribution parameters forwarded to generate_dataset
+    
+    Returns:
+        Function taking a size and returning the dataset for that cell
+    
+    Example:
+        >>> array_generators = {
+        ...     'Random': cached_generator('random', seed=42),
+        ...     'Many Duplicates': cached_generator('duplicates', seed=42, unique_count=10),
+        ... }
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}'")
+    
+    def generator(size: int) -> Any:
+        data = generate_dataset(distribution, size, seed, cache_dir, **params)
+        return data.tolist() if as_list else data
+    
+    return generator
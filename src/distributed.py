@@ -0,0 +1,232 @@
+"""
+Distributed Sample Sort
+
+This module sorts a dataset that is spread across several worker processes,
+each standing in for a node that holds one shard. The coordinator collects a
+random sample from every worker, picks p-1 splitters, and broadcasts them;
+the workers then split their shards into buckets, exchange the buckets
+all-to-all over pipes, sort the bucket they own with the Sorter engine, and
+stream it back. Every phase is timed.
+"""
+
+import time
+import random
+import threading
+from bisect import bisect_right
+from multiprocessing.connection import Connection, wait
+from typing import List, Callable, Optional, Any, Dict, Sequence, Tuple
+
+from .sorter import Sorter, BATCH_CUTOFF
+from .comparison import _process_context
+
+
+PHASES = ('sample', 'exchange', 'local_sort', 'output')
+
+
+def choose_splitters(samples: List[Any], parts: int) -> List[Any]:
+    """
+    Pick parts-1 evenly spaced splitters from a sorted sample.
+    
+    Args:
+        samples: Sorted sample keys
+        parts: Number of buckets the splitters should define
+    
+    Returns:
+        Splitter keys; empty if there are no samples
+    """
+    if not samples:
+        return []
+    return [samples[len(samples) * i // parts] for i in range(1, parts)]
+
+
+def _sample_sort_worker(
+    index: int,
+    shard: List[Any],
+    conn: Connection,
+    inbound: List[Connection],
+    outbound: Dict[int, Connection],
+    sorter: Sorter,
+    oversample: int,
+    seed: Optional[int]
+) -> None:
+    """
+    One node of the sample sort.
+    
+    Sends ('sample', keys), waits for the splitters, exchanges buckets with
+    its peers, then sends ('timings', exchange, local_sort) followed by
+    ('bucket', items), or ('error', exception) if anything fails.
+    """
+    try:
+        sort_keys = sorter._extract_keys(shard)
+        keys = shard if sort_keys is None else sort_keys
+        rng = random.Random(seed)
+        conn.send(('sample', rng.sample(keys, min(oversample, len(keys)))))
+        splitters = conn.recv()
+        
+        # Buckets hold (items, keys); keys are shipped along so the key
+        # function is still called only once per element
+        start = time.perf_counter()
+        parts = len(outbound) + 1
+        buckets = [([], None if sort_keys is None else []) for _ in range(parts)]
+        for position, sort_key in enumerate(keys):
+            bucket = bisect_right(splitters, sort_key)
+            items, bucket_keys = buckets[parts - 1 - bucket if sorter._descending else bucket]
+            items.append(shard[position])
+            if bucket_keys is not None:
+                bucket_keys.append(sort_key)
+        
+        # Send from a thread while receiving here, so two peers writing large
+        # buckets to each other cannot both block on full pipes
+        def send_buckets() -> None:
+            for peer, peer_conn in outbound.items():
+                peer_conn.send(buckets[peer])
+                peer_conn.close()
+        
+        sender = threading.Thread(target=send_buckets)
+        sender.start()
+        items, bucket_keys = buckets[index]
+        pending = list(inbound)
+        while pending:
+            for peer_conn in wait(pending):
+                peer_items, peer_keys = peer_conn.recv()
+                items.extend(peer_items)
+                if bucket_keys is not None:
+                    bucket_keys.extend(peer_keys)
+                pending.remove(peer_conn)
+        sender.join()
+        exchange = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        if len(items) > 1:
+            sorter._sort(items, bucket_keys, 0, len(items) - 1)
+        local_sort = time.perf_counter() - start
+        
+        conn.send(('timings', exchange, local_sort))
+        conn.send(('bucket', items))
+    except Exception as e:
+        conn.send(('error', e))
+    finally:
+        conn.close()
+
+
+def _gather(workers: List[Tuple[Connection, Any]], expected: str) -> List[Tuple[Any, ...]]:
+    """
+    Receive one message from every worker, in worker order.
+    
+    Waits on all workers at once, so an error from any of them is raised
+    immediately even while its peers are blocked waiting for its buckets.
+    """
+    received = {}
+    running = {conn: (i, proc) for i, (conn, proc) in enumerate(workers)}
+    while running:
+        for conn in wait(list(running)):
+            i, proc = running.pop(conn)
+            try:
+                message = conn.recv()
+            except EOFError:
+                raise RuntimeError(f"worker exited with code {proc.exitcode}")
+            if message[0] == 'error':
+                raise message[1]
+            if message[0] != expected:
+                raise RuntimeError(f"expected '{expected}' from worker, got '{message[0]}'")
+            received[i] = message[1:]
+    return [received[i] for i in range(len(workers))]
+
+
+def sample_sort(
+    shards: Sequence[List[Any]],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    algorithm: str = 'quicksort',
+    oversample: int = 32,
+    seed: Optional[int] = None
+) -> Tuple[List[Any], Dict[str, float]]:
+    """
+    Sort data spread over shards with one worker process per shard.
+    
+    Phases:
+        - sample: each worker sends up to oversample random keys; the
+          coordinator sorts them and broadcasts p-1 splitters
+        - exchange: each worker buckets its shard by splitter and sends
+          bucket j to worker j over a pipe
+        - local_sort: each worker sorts the bucket it owns
+        - output: the coordinator concatenates the buckets in worker order
+    
+    Workers are forked on platforms that support it, so shards and key
+    functions are inherited rather than pickled. Many equal keys can make
+    buckets uneven (all copies of a splitter key land in one bucket), but
+    the result is always fully sorted.
+    
+    Args:
+        shards: One list of elements per worker
+        key: Optional key function, called once per element
+        reverse: If True, sort in descending order
+        algorithm: Sorter algorithm for the local sorts, 'quicksort' or '3way'
+        oversample: Sample size drawn from each shard
+        seed: Optional random seed for reproducible samples and pivots
+    
+    Returns:
+        Tuple of (sorted list, timings). Timings maps each of PHASES to
+        seconds, plus 'total'; worker-side phases report the slowest worker.
+    
+    Example:
+        >>> result, timings = sample_sort([[5, 1, 9], [3, 7], [2, 8, 4, 6]])
+        >>> result
+        [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    """
+    if oversample < 1:
+        raise ValueError("oversample must be a positive integer")
+    parts = len(shards)
+    if parts == 0:
+        return [], dict.fromkeys(PHASES + ('total',), 0.0)
+    
+    sorter = Sorter(algorithm, 'random', BATCH_CUTOFF, key=key, reverse=reverse, seed=seed)
+    ctx = _process_context()
+    timings = {}
+    total_start = time.perf_counter()
+    
+    # peer_pipes[(i, j)] carries worker i's bucket j to worker j
+    peer_pipes = {(i, j): ctx.Pipe(duplex=False)
+                  for i in range(parts) for j in range(parts) if i != j}
+    workers = []
+    for i, shard in enumerate(shards):
+        conn, child_conn = ctx.Pipe()
+        inbound = [peer_pipes[(j, i)][0] for j in range(parts) if j != i]
+        outbound = {j: peer_pipes[(i, j)][1] for j in range(parts) if j != i}
+        proc = ctx.Process(target=_sample_sort_worker,
+                           args=(i, shard, child_conn, inbound, outbound, sorter, oversample,
+                                 None if seed is None else seed + i),
+                           daemon=True)
+        proc.start()
+        child_conn.close()
+        workers.append((conn, proc))
+    for recv_conn, send_conn in peer_pipes.values():
+        recv_conn.close()
+        send_conn.close()
+    
+    try:
+        start = time.perf_counter()
+        samples = [key for (sample,) in _gather(workers, 'sample') for key in sample]
+        if len(samples) > 1:
+            Sorter(algorithm, 'random', BATCH_CUTOFF, seed=seed).sort(samples)
+        splitters = choose_splitters(samples, parts)
+        for conn, _ in workers:
+            conn.send(splitters)
+        timings['sample'] = time.perf_counter() - start
+        
+        worker_timings = _gather(workers, 'timings')
+        timings['exchange'] = max(exchange for exchange, _ in worker_timings)
+        timings['local_sort'] = max(local_sort for _, local_sort in worker_timings)
+        
+        start = time.perf_counter()
+        result = [item for (bucket,) in _gather(workers, 'bucket') for item in bucket]
+        timings['output'] = time.perf_counter() - start
+    finally:
+        for conn, proc in workers:
+            conn.close()
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+    
+    timings['total'] = time.perf_counter() - total_start
+    return result, timings
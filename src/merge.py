@@ -0,0 +1,196 @@
+"""
+Merging Pre-Sorted Runs
+
+This module combines runs that are already sorted (e.g. the outputs of
+several shards) without re-sorting them. merge_sorted() uses a heap-based
+k-way merge for any number of lists or iterators, costing O(n log k), and a
+galloping two-way merge for two lists of very unequal length, which copies
+whole blocks and needs only O(m log(n/m)) comparisons for the shorter run.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import List, Callable, Optional, Any, Iterable, Iterator, Tuple
+
+from .quicksort import _Reversed, _invert_column
+
+
+# Length ratio from which two lists are merged by galloping instead of the heap
+GALLOP_RATIO = 10
+
+
+def merge_sorted(
+    runs: Iterable[Iterable[Any]],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
+) -> List[Any]:
+    """
+    Merge sorted runs into one sorted list.
+    
+    The merge is stable: elements with equal keys keep their order within a
+    run, and runs listed earlier come first.
+    
+    Args:
+        runs: Sorted lists or iterators (each ascending, or descending if reverse)
+        key: Optional key function, called once per element
+        reverse: If True, the runs are in descending order and so is the result
+    
+    Returns:
+        A new list holding every element of every run
+    
+    Time Complexity: O(n log k) for k runs and n elements in total
+    
+    Example:
+        >>> merge_sorted([[1, 4, 9], iter([2, 3]), [5]])
+        [1, 2, 3, 4, 5, 9]
+    """
+    runs = list(runs)
+    if len(runs) == 2 and all(isinstance(run, list) for run in runs):
+        shorter, longer = sorted(map(len, runs))
+        if longer >= GALLOP_RATIO * shorter:
+            return gallop_merge(runs[0], runs[1], key, reverse)
+    if len(runs) == 1:
+        return list(runs[0])
+    return list(_kway_merge(runs, key, reverse))
+
+
+def _kway_merge(
+    runs: List[Iterable[Any]],
+    key: Optional[Callable[[Any], Any]],
+    reverse: bool
+) -> Iterator[Any]:
+    """Heap-based k-way merge; the heap holds one [key, run index, value, next] per run."""
+    iterators = [iter(run) for run in runs]
+    heap = []
+    for index, iterator in enumerate(iterators):
+        advance = iterator.__next__
+        try:
+            value = advance()
+        except StopIteration:
+            continue
+        sort_key = value if key is None else key(value)
+        heap.append([_Reversed(sort_key) if reverse else sort_key, index, value, advance])
+    heapq.heapify(heap)
+    
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        try:
+            value = entry[3]()
+        except StopIteration:
+            heapq.heappop(heap)
+            continue
+        sort_key = value if key is None else key(value)
+        entry[0] = _Reversed(sort_key) if reverse else sort_key
+        entry[2] = value
+        heapq.heapreplace(heap, entry)
+    
+    # One run left: pass the rest through without comparisons
+    if heap:
+        _, index, value, _ = heap[0]
+        yield value
+        yield from iterators[index]
+
+
+def _gallop(keys: List[Any], x: Any, lo: int, right: bool) -> int:
+    """
+    Insertion point for x in keys[lo:], searched outward from lo.
+    
+    Probes lo, lo+1, lo+3, lo+7, ... until it passes x, then bisects the
+    last gap, so finding a block of length m costs O(log m) comparisons.
+    With right=True equal keys count as before x (bisect_right semantics).
+    """
+    n = len(keys)
+    prev = lo
+    step = 1
+    while lo + step <= n:
+        probe = keys[lo + step - 1]
+        if (x < probe) if right else not (probe < x):
+            break
+        prev = lo + step
+        step *= 2
+    search = bisect_right if right else bisect_left
+    return search(keys, x, prev, min(lo + step - 1, n))
+
+
+def gallop_merge(
+    a: List[Any],
+    b: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
+) -> List[Any]:
+    """
+    Merge two sorted lists by galloping over blocks.
+    
+    Instead of comparing element by element, each step finds (by galloping
+    search) the whole block of one run that precedes the other run's head
+    and copies it with one slice. Ties take elements of a first. When the
+    runs interleave finely the blocks have length 1 and the heap merge in
+    merge_sorted() is faster, which is why it only gallops from GALLOP_RATIO.
+    
+    Args:
+        a: First sorted list
+        b: Second sorted list
+        key: Optional key function, called once per element
+        reverse: If True, both lists are descending and so is the result
+    
+    Returns:
+        A new merged list
+    
+    Time Complexity:
+        - O(m log(n/m) + m) comparisons for runs of lengths m <= n
+        - O(m + n) element copies
+    
+    Example:
+        >>> gallop_merge([1, 3, 5, 7, 9, 11], [4])
+        [1, 3, 4, 5, 7, 9, 11]
+    """
+    if not a or not b:
+        return a + b
+    
+    a_keys = a if key is None else list(map(key, a))
+    b_keys = b if key is None else list(map(key, b))
+    if reverse:
+        a_keys, b_keys = _invert_column(a_keys), _invert_column(b_keys)
+    return _gallop_merge_keyed(a, a_keys, b, b_keys)[0]
+
+
+def _gallop_merge_keyed(
+    a: List[Any],
+    a_keys: List[Any],
+    b: List[Any],
+    b_keys: List[Any],
+    keep_keys: bool = False
+) -> Tuple[List[Any], Optional[List[Any]]]:
+    """
+    Galloping merge of two runs given their ascending key lists.
+    
+    Returns:
+        Tuple of (merged items, merged keys if keep_keys else None)
+    """
+    result = []
+    result_keys = [] if keep_keys else None
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        # Block of a up to and including keys equal to b's head
+        end = _gallop(a_keys, b_keys[j], i, right=True)
+        result.extend(a[i:end])
+        if keep_keys:
+            result_keys.extend(a_keys[i:end])
+        i = end
+        if i == len_a:
+            break
+        # Block of b strictly before a's head
+        end = _gallop(b_keys, a_keys[i], j, right=False)
+        result.extend(b[j:end])
+        if keep_keys:
+            result_keys.extend(b_keys[j:end])
+        j = end
+    
+    result.extend(a[i:])
+    result.extend(b[j:])
+    if keep_keys:
+        result_keys.extend(a_keys[i:])
+        result_keys.extend(b_keys[j:])
+    return result, result_keys
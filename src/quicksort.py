@@ -4,8 +4,12 @@ Quicksort Implementation
 This module provides both deterministic and randomized versions of the Quicksort algorithm.
 """
 
-from typing import List, Callable, Optional, Any
+from typing import List, Callable, Optional, Any, Sequence, Tuple, Union, Iterable, Iterator
+import os
+import operator
 import random
+import struct
+from array import array
 
 
 def partition(
@@ -13,13 +17,15 @@ def partition(
     low: int,
     high: int,
     pivot_index: int,
-    key: Optional[Callable[[Any], Any]] = None
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
 ) -> int:
     """
     Partition the array around a pivot element.
     
     After partitioning, all elements less than the pivot are on the left,
-    and all elements greater than or equal to the pivot are on the right.
+    and all elements greater than or equal to the pivot are on the right
+    (the other way round when reverse=True).
     
     Args:
         arr: The array to partition
@@ -27,6 +33,7 @@ def partition(
         high: Ending index of the subarray (inclusive)
         pivot_index: Index of the pivot element
         key: Optional function to extract comparison key from elements
+        reverse: If True, partition for descending order
     
     Returns:
         The final position of the pivot element after partitioning
@@ -46,7 +53,7 @@ def partition(
     for j in range(low, high):
         # Compare current element with pivot
         current_value = key(arr[j]) if key else arr[j]
-        if current_value < pivot_value:
+        if (current_value > pivot_value) if reverse else (current_value < pivot_value):
             i += 1
             arr[i], arr[j] = arr[j], arr[i]
     
@@ -60,7 +67,8 @@ def _quicksort_recursive(
     low: int,
     high: int,
     pivot_selector: Callable[[int, int], int],
-    key: Optional[Callable[[Any], Any]] = None
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
 ) -> None:
     """
     Recursive helper function for Quicksort.
@@ -71,23 +79,329 @@ def _quicksort_recursive(
         high: Ending index (inclusive)
         pivot_selector: Function that takes (low, high) and returns pivot index
         key: Optional function to extract comparison key from elements
+        reverse: If True, sort in descending order
     """
     if low < high:
         # Select pivot using the provided selector function
         pivot_index = pivot_selector(low, high)
         
         # Partition the array and get the pivot's final position
-        pivot_pos = partition(arr, low, high, pivot_index, key)
+        pivot_pos = partition(arr, low, high, pivot_index, key, reverse)
         
         # Recursively sort elements before and after partition
-        _quicksort_recursive(arr, low, pivot_pos - 1, pivot_selector, key)
-        _quicksort_recursive(arr, pivot_pos + 1, high, pivot_selector, key)
+        _quicksort_recursive(arr, low, pivot_pos - 1, pivot_selector, key, reverse)
+        _quicksort_recursive(arr, pivot_pos + 1, high, pivot_selector, key, reverse)
+
+
+class _Reversed:
+    """Key wrapper that inverts the order of a non-numeric column."""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def __eq__(self, other: '_Reversed') -> bool:
+        return self.value == other.value
+    
+    def __lt__(self, other: '_Reversed') -> bool:
+        return other.value < self.value
+    
+    def __gt__(self, other: '_Reversed') -> bool:
+        return other.value > self.value
+
+
+def _invert_column(column: List[Any]) -> List[Any]:
+    """Reverse the order of one key column: negate numbers, wrap anything else."""
+    if all(type(value) in (int, float) for value in column):
+        return [-value for value in column]
+    return [_Reversed(value) for value in column]
+
+
+# Key functions implemented in C that are cheap to apply to a whole array with
+# map(); their keys are extracted up front instead of in the partition loop
+_BULK_KEY_TYPES = (operator.itemgetter, operator.attrgetter)
+
+
+def _resolve_keys(
+    arr: List[Any],
+    key: Optional[Callable[[Any], Any]],
+    keys: Optional[Sequence[Callable[[Any], Any]]],
+    reverse: Union[bool, Sequence[bool]]
+) -> Tuple[Optional[List[Any]], bool]:
+    """
+    Extract the sort keys for a keys=[...] sort, one column at a time.
+    
+    Each key function is called exactly once per element. Columns are
+    combined into tuples and compared lexicographically. A column whose
+    direction differs from the first column's is inverted, so the whole
+    sort can run in the first column's direction by flipping comparisons.
+    A single operator.itemgetter/attrgetter key is treated as keys=[key].
+    
+    Returns:
+        Tuple of (sort keys parallel to arr, or None when keys is not given;
+        True if the sort runs in descending order)
+    """
+    if keys is None and isinstance(key, _BULK_KEY_TYPES):
+        keys, key = [key], None
+    
+    if keys is None:
+        if not isinstance(reverse, bool):
+            raise ValueError("A sequence of reverse flags requires keys=[...]")
+        return None, reverse
+    
+    if key is not None:
+        raise ValueError("Pass either key or keys, not both")
+    keys = list(keys)
+    if not keys:
+        raise ValueError("keys must contain at least one key function")
+    directions = [reverse] * len(keys) if isinstance(reverse, bool) else list(reverse)
+    if len(directions) != len(keys):
+        raise ValueError(f"Got {len(directions)} reverse flags for {len(keys)} keys")
+    
+    descending = bool(directions[0])
+    columns = []
+    for key_func, direction in zip(keys, directions):
+        column = list(map(key_func, arr))
+        if bool(direction) != descending:
+            column = _invert_column(column)
+        columns.append(column)
+    
+    if len(columns) == 1:
+        return columns[0], descending
+    return list(zip(*columns)), descending
+
+
+def _partition_keyed(
+    arr: List[Any],
+    sort_keys: List[Any],
+    low: int,
+    high: int,
+    pivot_index: int,
+    reverse: bool = False
+) -> int:
+    """
+    Lomuto partition on precomputed keys, moving elements alongside.
+    
+    Same as partition(), but compares sort_keys[j] directly instead of
+    calling a key function, and applies every swap to both lists.
+    """
+    sort_keys[pivot_index], sort_keys[high] = sort_keys[high], sort_keys[pivot_index]
+    arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+    pivot_value = sort_keys[high]
+    i = low - 1
+    
+    for j in range(low, high):
+        current_value = sort_keys[j]
+        if (current_value > pivot_value) if reverse else (current_value < pivot_value):
+            i += 1
+            sort_keys[i], sort_keys[j] = sort_keys[j], sort_keys[i]
+            arr[i], arr[j] = arr[j], arr[i]
+    
+    sort_keys[i + 1], sort_keys[high] = sort_keys[high], sort_keys[i + 1]
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
+def _quicksort_keyed_recursive(
+    arr: List[Any],
+    sort_keys: List[Any],
+    low: int,
+    high: int,
+    pivot_selector: Callable[[int, int], int],
+    reverse: bool = False
+) -> None:
+    """Recursive helper for Quicksort on precomputed keys."""
+    if low < high:
+        pivot_pos = _partition_keyed(arr, sort_keys, low, high, pivot_selector(low, high), reverse)
+        _quicksort_keyed_recursive(arr, sort_keys, low, pivot_pos - 1, pivot_selector, reverse)
+        _quicksort_keyed_recursive(arr, sort_keys, pivot_pos + 1, high, pivot_selector, reverse)
+
+
+def _check_cmp(
+    key: Optional[Callable[[Any], Any]],
+    keys: Optional[Sequence[Callable[[Any], Any]]],
+    reverse: Union[bool, Sequence[bool]]
+) -> None:
+    """Reject arguments that cannot be combined with cmp."""
+    if key is not None or keys is not None:
+        raise ValueError("cmp cannot be combined with key or keys")
+    if not isinstance(reverse, bool):
+        raise ValueError("A sequence of reverse flags requires keys=[...]")
+
+
+def _partition_cmp(
+    arr: List[Any],
+    low: int,
+    high: int,
+    pivot_index: int,
+    cmp: Callable[[Any, Any], int],
+    reverse: bool = False
+) -> int:
+    """
+    Lomuto partition driven by a three-way comparator.
+    
+    cmp(a, b) is called once per element and returns a negative number,
+    zero, or a positive number when a sorts before, with, or after b.
+    """
+    arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+    pivot = arr[high]
+    i = low - 1
+    
+    for j in range(low, high):
+        order = -cmp(arr[j], pivot) if reverse else cmp(arr[j], pivot)
+        if order < 0:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+    
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
+def _quicksort_cmp_recursive(
+    arr: List[Any],
+    low: int,
+    high: int,
+    pivot_selector: Callable[[int, int], int],
+    cmp: Callable[[Any, Any], int],
+    reverse: bool = False
+) -> None:
+    """Recursive helper for Quicksort with a comparator."""
+    if low < high:
+        pivot_pos = _partition_cmp(arr, low, high, pivot_selector(low, high), cmp, reverse)
+        _quicksort_cmp_recursive(arr, low, pivot_pos - 1, pivot_selector, cmp, reverse)
+        _quicksort_cmp_recursive(arr, pivot_pos + 1, high, pivot_selector, cmp, reverse)
+
+
+def _check_out(arr: Sequence[Any], out: Any) -> None:
+    """Reject an out buffer whose length does not match arr."""
+    if len(out) != len(arr):
+        raise ValueError(f"out has length {len(out)}, expected {len(arr)}")
+
+
+def _copy_into(arr: Sequence[Any], out: Any) -> None:
+    """Copy arr into out element for element, without a temporary list."""
+    try:
+        out[:] = arr
+    except TypeError:
+        # array.array only accepts slice assignment from another array
+        for i, element in enumerate(arr):
+            out[i] = element
+
+
+def _copy_partition(
+    arr: Sequence[Any],
+    out: Any,
+    pivot_index: int,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
+) -> int:
+    """
+    Copy arr into out partitioned around arr[pivot_index], in one read of arr.
+    
+    Elements that sort before the pivot are written from the front of out,
+    the rest from the back, and the pivot goes in the gap, so out ends up
+    exactly as partition() would leave a copy of arr. arr is not modified.
+    
+    Returns:
+        The position of the pivot in out
+    """
+    pivot = arr[pivot_index]
+    pivot_value = key(pivot) if key else pivot
+    left = 0
+    right = len(arr) - 1
+    
+    for j, element in enumerate(arr):
+        if j == pivot_index:
+            continue
+        current_value = key(element) if key else element
+        if (current_value > pivot_value) if reverse else (current_value < pivot_value):
+            out[left] = element
+            left += 1
+        else:
+            out[right] = element
+            right -= 1
+    
+    out[left] = pivot
+    return left
+
+
+def _copy_partition_cmp(
+    arr: Sequence[Any],
+    out: Any,
+    pivot_index: int,
+    cmp: Callable[[Any, Any], int],
+    reverse: bool = False
+) -> int:
+    """_copy_partition driven by a three-way comparator."""
+    pivot = arr[pivot_index]
+    left = 0
+    right = len(arr) - 1
+    
+    for j, element in enumerate(arr):
+        if j == pivot_index:
+            continue
+        order = -cmp(element, pivot) if reverse else cmp(element, pivot)
+        if order < 0:
+            out[left] = element
+            left += 1
+        else:
+            out[right] = element
+            right -= 1
+    
+    out[left] = pivot
+    return left
+
+
+def _run_quicksort(
+    arr: List[Any],
+    pivot_selector: Callable[[int, int], int],
+    key: Optional[Callable[[Any], Any]],
+    keys: Optional[Sequence[Callable[[Any], Any]]],
+    reverse: Union[bool, Sequence[bool]],
+    cmp: Optional[Callable[[Any, Any], int]] = None,
+    out: Optional[Any] = None
+) -> None:
+    """
+    Sort arr in place, on precomputed keys or a comparator when given.
+    
+    With out, arr is left unchanged and the sorted elements are written to
+    out instead; the copy is fused into the first partition pass.
+    """
+    high = len(arr) - 1
+    if cmp is not None:
+        _check_cmp(key, keys, reverse)
+        if out is None:
+            _quicksort_cmp_recursive(arr, 0, high, pivot_selector, cmp, reverse)
+        else:
+            pivot_pos = _copy_partition_cmp(arr, out, pivot_selector(0, high), cmp, reverse)
+            _quicksort_cmp_recursive(out, 0, pivot_pos - 1, pivot_selector, cmp, reverse)
+            _quicksort_cmp_recursive(out, pivot_pos + 1, high, pivot_selector, cmp, reverse)
+        return
+    
+    sort_keys, descending = _resolve_keys(arr, key, keys, reverse)
+    if sort_keys is not None:
+        # The key columns are a fresh allocation anyway; copy, then sort out in place
+        if out is not None:
+            _copy_into(arr, out)
+            arr = out
+        _quicksort_keyed_recursive(arr, sort_keys, 0, high, pivot_selector, descending)
+    elif out is None:
+        _quicksort_recursive(arr, 0, high, pivot_selector, key, descending)
+    else:
+        pivot_pos = _copy_partition(arr, out, pivot_selector(0, high), key, descending)
+        _quicksort_recursive(out, 0, pivot_pos - 1, pivot_selector, key, descending)
+        _quicksort_recursive(out, pivot_pos + 1, high, pivot_selector, key, descending)
 
 
 def quicksort(
     arr: List[Any],
     in_place: bool = True,
-    key: Optional[Callable[[Any], Any]] = None
+    key: Optional[Callable[[Any], Any]] = None,
+    keys: Optional[Sequence[Callable[[Any], Any]]] = None,
+    reverse: Union[bool, Sequence[bool]] = False,
+    cmp: Optional[Callable[[Any, Any], int]] = None,
+    out: Optional[Any] = None
 ) -> Optional[List[Any]]:
     """
     Deterministic Quicksort algorithm.
@@ -100,9 +414,24 @@ def quicksort(
                   If False, returns a new sorted array without modifying the original.
         key: Optional function to extract comparison key from elements.
              If provided, elements are compared using key(element).
+        keys: Optional list of key functions, compared lexicographically.
+              Each is called once per element, instead of building a tuple
+              for every comparison. Cannot be combined with key.
+        reverse: If True, sort in descending order. With keys, may also be
+                 a list of flags giving the direction of each key.
+        cmp: Optional three-way comparator, cmp(a, b) < 0 when a sorts
+             before b. Called once per element-pivot test, without the
+             wrapper objects functools.cmp_to_key creates. Cannot be
+             combined with key or keys.
+        out: Optional preallocated list, array.array or 1-D ndarray of the
+             same length as arr. The sorted elements are written into it
+             and arr is left unchanged (in_place is ignored). The copy is
+             fused into the first partition pass, which reads arr once and
+             writes each element straight to its side of out, so repeated
+             non-destructive sorts allocate no new list.
     
     Returns:
-        None if in_place=True, otherwise a new sorted list
+        out if given; otherwise None if in_place=True, or a new sorted list
     
     Time Complexity:
         - Best case: O(n log n) - balanced partitions
@@ -127,19 +456,28 @@ def quicksort(
         >>> arr  # Original unchanged
         [3, 6, 8, 10, 1, 2, 1]
     """
-    if not arr:
+    if out is not None:
+        _check_out(arr, out)
+        if out is arr:
+            quicksort(arr, True, key, keys, reverse, cmp)
+            return out
+        if len(arr):
+            _run_quicksort(arr, lambda low, high: high, key, keys, reverse, cmp, out)
+        return out
+    
+    if not len(arr):
         return None if in_place else []
     
     if in_place:
         # Use last element as pivot (deterministic)
         pivot_selector = lambda low, high: high
-        _quicksort_recursive(arr, 0, len(arr) - 1, pivot_selector, key)
+        _run_quicksort(arr, pivot_selector, key, keys, reverse, cmp)
         return None
     else:
         # Create a copy to avoid modifying the original
         arr_copy = arr.copy()
         pivot_selector = lambda low, high: high
-        _quicksort_recursive(arr_copy, 0, len(arr_copy) - 1, pivot_selector, key)
+        _run_quicksort(arr_copy, pivot_selector, key, keys, reverse, cmp)
         return arr_copy
 
 
@@ -147,7 +485,11 @@ def randomized_quicksort(
     arr: List[Any],
     in_place: bool = True,
     key: Optional[Callable[[Any], Any]] = None,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    keys: Optional[Sequence[Callable[[Any], Any]]] = None,
+    reverse: Union[bool, Sequence[bool]] = False,
+    cmp: Optional[Callable[[Any, Any], int]] = None,
+    out: Optional[Any] = None
 ) -> Optional[List[Any]]:
     """
     Randomized Quicksort algorithm.
@@ -162,9 +504,15 @@ def randomized_quicksort(
         key: Optional function to extract comparison key from elements.
              If provided, elements are compared using key(element).
         seed: Optional random seed for reproducibility
+        keys: Optional list of key functions, compared lexicographically
+              (see quicksort)
+        reverse: If True, sort in descending order; with keys, may be a
+                 list of per-key flags
+        cmp: Optional three-way comparator (see quicksort)
+        out: Optional preallocated output buffer (see quicksort)
     
     Returns:
-        None if in_place=True, otherwise a new sorted list
+        out if given; otherwise None if in_place=True, or a new sorted list
     
     Time Complexity:
         - Best case: O(n log n) - balanced partitions
@@ -187,7 +535,18 @@ def randomized_quicksort(
         >>> sorted_arr
         [1, 1, 2, 3, 6, 8, 10]
     """
-    if not arr:
+    if out is not None:
+        _check_out(arr, out)
+        if out is arr:
+            randomized_quicksort(arr, True, key, seed, keys, reverse, cmp)
+            return out
+        if len(arr):
+            if seed is not None:
+                random.seed(seed)
+            _run_quicksort(arr, lambda low, high: random.randint(low, high), key, keys, reverse, cmp, out)
+        return out
+    
+    if not len(arr):
         return None if in_place else []
     
     if seed is not None:
@@ -196,20 +555,24 @@ def randomized_quicksort(
     if in_place:
         # Use random element as pivot
         pivot_selector = lambda low, high: random.randint(low, high)
-        _quicksort_recursive(arr, 0, len(arr) - 1, pivot_selector, key)
+        _run_quicksort(arr, pivot_selector, key, keys, reverse, cmp)
         return None
     else:
         # Create a copy to avoid modifying the original
         arr_copy = arr.copy()
         pivot_selector = lambda low, high: random.randint(low, high)
-        _quicksort_recursive(arr_copy, 0, len(arr_copy) - 1, pivot_selector, key)
+        _run_quicksort(arr_copy, pivot_selector, key, keys, reverse, cmp)
         return arr_copy
 
 
 def quicksort_3way(
     arr: List[Any],
     in_place: bool = True,
-    key: Optional[Callable[[Any], Any]] = None
+    key: Optional[Callable[[Any], Any]] = None,
+    keys: Optional[Sequence[Callable[[Any], Any]]] = None,
+    reverse: Union[bool, Sequence[bool]] = False,
+    cmp: Optional[Callable[[Any, Any], int]] = None,
+    out: Optional[Any] = None
 ) -> Optional[List[Any]]:
     """
     Three-way Quicksort (Dutch National Flag algorithm variant).
@@ -222,9 +585,17 @@ def quicksort_3way(
         in_place: If True, sorts the array in place and returns None.
                   If False, returns a new sorted array without modifying the original.
         key: Optional function to extract comparison key from elements.
+        keys: Optional list of key functions, compared lexicographically
+              (see quicksort)
+        reverse: If True, sort in descending order; with keys, may be a
+                 list of per-key flags
+        cmp: Optional three-way comparator (see quicksort)
+        out: Optional preallocated output buffer (see quicksort). The fused
+             first pass is a two-way split; elements equal to its pivot are
+             grouped by the three-way partitions that follow.
     
     Returns:
-        None if in_place=True, otherwise a new sorted list
+        out if given; otherwise None if in_place=True, or a new sorted list
     
     Time Complexity:
         - Best case: O(n) - when all elements are equal
@@ -237,9 +608,43 @@ def quicksort_3way(
         >>> arr
         [1, 1, 2, 2, 3, 3, 3]
     """
-    if not arr:
+    if out is not None:
+        _check_out(arr, out)
+        if out is arr:
+            quicksort_3way(arr, True, key, keys, reverse, cmp)
+            return out
+        if not len(arr):
+            return out
+    
+    if not len(arr):
         return None if in_place else []
     
+    high = len(arr) - 1
+    if cmp is not None:
+        _check_cmp(key, keys, reverse)
+        if out is not None:
+            pivot_pos = _copy_partition_cmp(arr, out, high, cmp, reverse)
+            _3way_cmp_recursive(out, 0, pivot_pos - 1, cmp, reverse)
+            _3way_cmp_recursive(out, pivot_pos + 1, high, cmp, reverse)
+            return out
+        target = arr if in_place else arr.copy()
+        _3way_cmp_recursive(target, 0, high, cmp, reverse)
+        return None if in_place else target
+    
+    if keys is not None or isinstance(key, _BULK_KEY_TYPES):
+        if out is not None:
+            _copy_into(arr, out)
+            sort_keys, descending = _resolve_keys(out, key, keys, reverse)
+            _3way_keyed_recursive(out, sort_keys, 0, high, descending)
+            return out
+        target = arr if in_place else arr.copy()
+        sort_keys, descending = _resolve_keys(target, key, keys, reverse)
+        _3way_keyed_recursive(target, sort_keys, 0, high, descending)
+        return None if in_place else target
+    
+    if not isinstance(reverse, bool):
+        raise ValueError("A sequence of reverse flags requires keys=[...]")
+    
     def _3way_partition(low: int, high: int) -> tuple[int, int]:
         """Three-way partition: returns (lt, gt) indices."""
         if low >= high:
@@ -252,11 +657,11 @@ def quicksort_3way(
         
         while i <= gt:
             current_value = key(arr[i]) if key else arr[i]
-            if current_value < pivot_value:
+            if (current_value > pivot_value) if reverse else (current_value < pivot_value):
                 arr[lt], arr[i] = arr[i], arr[lt]
                 lt += 1
                 i += 1
-            elif current_value > pivot_value:
+            elif (current_value < pivot_value) if reverse else (current_value > pivot_value):
                 arr[i], arr[gt] = arr[gt], arr[i]
                 gt -= 1
             else:
@@ -270,7 +675,13 @@ def quicksort_3way(
             _3way_quicksort_recursive(low, lt - 1)
             _3way_quicksort_recursive(gt + 1, high)
     
-    if in_place:
+    if out is not None:
+        pivot_pos = _copy_partition(arr, out, high, key, reverse)
+        arr = out
+        _3way_quicksort_recursive(0, pivot_pos - 1)
+        _3way_quicksort_recursive(pivot_pos + 1, high)
+        return out
+    elif in_place:
         _3way_quicksort_recursive(0, len(arr) - 1)
         return None
     else:
@@ -282,3 +693,433 @@ def quicksort_3way(
         arr = original_arr
         return arr_copy
 
+
+def _3way_partition_keyed(
+    arr: List[Any],
+    sort_keys: List[Any],
+    low: int,
+    high: int,
+    reverse: bool = False
+) -> Tuple[int, int]:
+    """Three-way partition on precomputed keys, moving elements alongside."""
+    pivot_value = sort_keys[high]
+    lt = low
+    i = low
+    gt = high
+    
+    while i <= gt:
+        current_value = sort_keys[i]
+        if (current_value > pivot_value) if reverse else (current_value < pivot_value):
+            sort_keys[lt], sort_keys[i] = sort_keys[i], sort_keys[lt]
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif (current_value < pivot_value) if reverse else (current_value > pivot_value):
+            sort_keys[i], sort_keys[gt] = sort_keys[gt], sort_keys[i]
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    
+    return lt, gt
+
+
+def _3way_keyed_recursive(
+    arr: List[Any],
+    sort_keys: List[Any],
+    low: int,
+    high: int,
+    reverse: bool = False
+) -> None:
+    """Recursive helper for three-way Quicksort on precomputed keys."""
+    if low < high:
+        lt, gt = _3way_partition_keyed(arr, sort_keys, low, high, reverse)
+        _3way_keyed_recursive(arr, sort_keys, low, lt - 1, reverse)
+        _3way_keyed_recursive(arr, sort_keys, gt + 1, high, reverse)
+
+
+def _3way_partition_cmp(
+    arr: List[Any],
+    low: int,
+    high: int,
+    cmp: Callable[[Any, Any], int],
+    reverse: bool = False
+) -> Tuple[int, int]:
+    """Three-way partition branching on the sign of one comparator call."""
+    pivot = arr[high]
+    lt = low
+    i = low
+    gt = high
+    
+    while i <= gt:
+        order = -cmp(arr[i], pivot) if reverse else cmp(arr[i], pivot)
+        if order < 0:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif order > 0:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    
+    return lt, gt
+
+
+def _3way_cmp_recursive(
+    arr: List[Any],
+    low: int,
+    high: int,
+    cmp: Callable[[Any, Any], int],
+    reverse: bool = False
+) -> None:
+    """Recursive helper for three-way Quicksort with a comparator."""
+    if low < high:
+        lt, gt = _3way_partition_cmp(arr, low, high, cmp, reverse)
+        _3way_cmp_recursive(arr, low, lt - 1, cmp, reverse)
+        _3way_cmp_recursive(arr, gt + 1, high, cmp, reverse)
+
+
+def iter_counts(
+    arr: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
+) -> Iterator[Tuple[Any, int]]:
+    """
+    Yield (value, count) for each distinct value of arr in sorted order.
+    
+    Runs three-way Quicksort with random pivots on a working copy, but each
+    pivot's equal range is reported as one (value, count) pair and never
+    revisited, so sorted runs of duplicates are never built. Ranges are
+    visited left to right with an explicit stack, so each pair is yielded as
+    soon as everything before it is settled: reading only the first few
+    pairs leaves the rest of the array unsorted.
+    
+    Args:
+        arr: Elements to count (not modified)
+        key: Optional key function, called once per element. Elements with
+             equal keys count as one value; an arbitrary one of them is yielded.
+        reverse: If True, yield values in descending order
+    
+    Yields:
+        (value, count) pairs
+    
+    Time Complexity: O(n log d) expected, for d distinct values
+    """
+    items = list(arr)
+    values = items if key is None else list(map(key, items))
+    if key is None:
+        items = None
+    
+    # Entries are (low, high) ranges still to partition, or (value, count)
+    # pairs tagged with None, pushed so that they pop in sorted order
+    stack: List[Tuple[Any, ...]] = [(0, len(values) - 1)]
+    while stack:
+        entry = stack.pop()
+        if len(entry) == 3:
+            yield entry[1], entry[2]
+            continue
+        low, high = entry
+        if low > high:
+            continue
+        if low == high:
+            yield (values[low] if items is None else items[low]), 1
+            continue
+        
+        pivot_index = random.randint(low, high)
+        values[pivot_index], values[high] = values[high], values[pivot_index]
+        if items is not None:
+            items[pivot_index], items[high] = items[high], items[pivot_index]
+        pivot_value = values[high]
+        lt = low
+        i = low
+        gt = high
+        while i <= gt:
+            current_value = values[i]
+            if (current_value > pivot_value) if reverse else (current_value < pivot_value):
+                values[lt], values[i] = values[i], values[lt]
+                if items is not None:
+                    items[lt], items[i] = items[i], items[lt]
+                lt += 1
+                i += 1
+            elif (current_value < pivot_value) if reverse else (current_value > pivot_value):
+                values[i], values[gt] = values[gt], values[i]
+                if items is not None:
+                    items[i], items[gt] = items[gt], items[i]
+                gt -= 1
+            else:
+                i += 1
+        
+        stack.append((gt + 1, high))
+        stack.append((None, pivot_value if items is None else items[lt], gt - lt + 1))
+        stack.append((low, lt - 1))
+
+
+def sort_counts(
+    arr: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
+) -> List[Tuple[Any, int]]:
+    """
+    Sorted distinct values of arr with their multiplicities.
+    
+    Fuses sorting and run-length counting: see iter_counts, which this
+    collects into a list.
+    
+    Example:
+        >>> sort_counts([3, 1, 3, 2, 3, 1])
+        [(1, 2), (2, 1), (3, 3)]
+    """
+    return list(iter_counts(arr, key, reverse))
+
+
+def sort_unique(
+    arr: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False
+) -> List[Any]:
+    """
+    Sorted distinct values of arr, each once.
+    
+    Fuses sorting and deduplication: see iter_counts.
+    
+    Example:
+        >>> sort_unique([3, 1, 3, 2, 3, 1])
+        [1, 2, 3]
+    """
+    return [value for value, _ in iter_counts(arr, key, reverse)]
+
+
+def multikey_quicksort(
+    arr: List[Any],
+    in_place: bool = True,
+    key: Optional[Callable[[Any], Any]] = None,
+    encoding: Optional[str] = None
+) -> Optional[List[Any]]:
+    """
+    Multikey Quicksort for strings (Bentley-Sedgewick).
+    
+    Partitions three ways on the character at the current depth instead of
+    comparing whole strings, then sorts the equal partition on the next
+    character. Strings sharing long prefixes are therefore scanned only once
+    per prefix character, not once per comparison.
+    
+    Args:
+        arr: The array of strings (or bytes) to sort
+        in_place: If True, sorts the array in place and returns None.
+                  If False, returns a new sorted array without modifying the original.
+        key: Optional function returning the string to sort each element by.
+             Called once per element.
+        encoding: If given, each string is encoded once to bytes with this
+                  encoding and sorted by byte value, so every character test
+                  compares small integers (for UTF-8 this matches code point
+                  order)
+    
+    Returns:
+        None if in_place=True, otherwise a new sorted list
+    
+    Time Complexity:
+        - Average case: O(n log n + D) character comparisons, where D is the
+          total length of the distinguishing prefixes
+        - Worst case: O(n² + D) - highly unbalanced character partitions
+    
+    Space Complexity:
+        - O(n + D) work stack in the worst case; sorting uses an explicit
+          stack, so long common prefixes do not hit the recursion limit
+    
+    Example:
+        >>> arr = ['https://a/x', 'https://a/b', 'http://z']
+        >>> multikey_quicksort(arr)
+        >>> arr
+        ['http://z', 'https://a/b', 'https://a/x']
+    """
+    if not arr:
+        return None if in_place else []
+    
+    target = arr if in_place else arr.copy()
+    
+    if key is None and encoding is None:
+        _multikey_sort(target, None)
+    else:
+        strings = list(map(key, target)) if key else list(target)
+        if encoding is not None:
+            strings = [s.encode(encoding) for s in strings]
+        _multikey_sort(strings, target)
+    
+    return None if in_place else target
+
+
+def _multikey_sort(strings: List[Any], items: Optional[List[Any]]) -> None:
+    """
+    Sort strings in place by multikey Quicksort, moving items alongside.
+    
+    Each work item is (low, high, depth): strings[low..high] share their
+    first depth characters. A string shorter than depth + 1 reads as a
+    sentinel that sorts before every character, so it ends its recursion.
+    """
+    # Sentinel below every character: '' for str, -1 for bytes (ints)
+    end = -1 if isinstance(strings[0], (bytes, bytearray)) else ''
+    stack = [(0, len(strings) - 1, 0)]
+    
+    while stack:
+        low, high, depth = stack.pop()
+        if low >= high:
+            continue
+        
+        pivot_string = strings[(low + high) // 2]
+        pivot = pivot_string[depth] if depth < len(pivot_string) else end
+        lt = low   # strings[low..lt-1] have a smaller character at depth
+        i = low    # strings[lt..i-1] have the pivot character
+        gt = high  # strings[gt+1..high] have a larger character
+        
+        while i <= gt:
+            s = strings[i]
+            c = s[depth] if depth < len(s) else end
+            if c < pivot:
+                strings[lt], strings[i] = strings[i], strings[lt]
+                if items is not None:
+                    items[lt], items[i] = items[i], items[lt]
+                lt += 1
+                i += 1
+            elif c > pivot:
+                strings[i], strings[gt] = strings[gt], strings[i]
+                if items is not None:
+                    items[i], items[gt] = items[gt], items[i]
+                gt -= 1
+            else:
+                i += 1
+        
+        stack.append((low, lt - 1, depth))
+        stack.append((gt + 1, high, depth))
+        # Strings that ended at this depth are equal; nothing left to compare
+        if pivot == end:
+            continue
+        if lt == low and gt == high:
+            # The whole range shares this character: skip the rest of its
+            # common prefix in one step instead of one partition per character
+            next_depth = max(depth + 1, len(os.path.commonprefix(strings[low:high + 1])))
+        else:
+            next_depth = depth + 1
+        stack.append((lt, gt, next_depth))
+
+
+# IEEE-754 double bit patterns
+_SIGN_BIT = 1 << 63
+_ALL_BITS = (1 << 64) - 1
+_ABS_BITS = _SIGN_BIT - 1
+_INF_BITS = 0x7FF0000000000000
+
+
+def float_total_order_key(value: float, nan_position: str = 'last') -> int:
+    """
+    Map a float to an unsigned 64-bit integer that sorts in IEEE-754 total order.
+    
+    -inf < negative numbers < -0.0 < 0.0 < positive numbers < inf, with every
+    NaN grouped at the end given by nan_position. Unlike the float itself, the
+    key is safe to compare with <, so it can be passed as key= to any engine.
+    
+    Args:
+        value: The float to map
+        nan_position: 'last' or 'first'
+    
+    Returns:
+        Integer key in [0, 2**64)
+    """
+    bits = struct.unpack('<Q', struct.pack('<d', value))[0]
+    if bits & _ABS_BITS > _INF_BITS:
+        bits = bits & _ABS_BITS if nan_position == 'last' else bits | _SIGN_BIT
+    return bits ^ _ALL_BITS if bits & _SIGN_BIT else bits | _SIGN_BIT
+
+
+def _float_order_keys(values: List[float], nan_position: str) -> List[int]:
+    """Bulk version of float_total_order_key, reinterpreting bits via array."""
+    bits = array('Q')
+    bits.frombytes(array('d', values).tobytes())
+    if any(value != value for value in values):
+        if nan_position == 'last':
+            bits = [b & _ABS_BITS if b & _ABS_BITS > _INF_BITS else b for b in bits]
+        else:
+            bits = [b | _SIGN_BIT if b & _ABS_BITS > _INF_BITS else b for b in bits]
+    return [b ^ _ALL_BITS if b & _SIGN_BIT else b | _SIGN_BIT for b in bits]
+
+
+def _floats_from_order_keys(keys: List[int]) -> List[float]:
+    """Invert _float_order_keys."""
+    bits = array('Q', [k ^ _SIGN_BIT if k & _SIGN_BIT else k ^ _ALL_BITS for k in keys])
+    return array('d', bits.tobytes()).tolist()
+
+
+def _radix_sort_u64(keys: List[int], digit_bits: int = 8) -> List[int]:
+    """
+    LSD radix sort of unsigned 64-bit integers.
+    
+    Each pass distributes the keys into buckets by one digit, stably.
+    A pass whose digit is the same for every key is skipped.
+    """
+    mask = (1 << digit_bits) - 1
+    for shift in range(0, 64, digit_bits):
+        buckets = [[] for _ in range(1 << digit_bits)]
+        appends = [bucket.append for bucket in buckets]
+        for k in keys:
+            appends[(k >> shift) & mask](k)
+        if any(len(bucket) == len(keys) for bucket in buckets):
+            continue
+        keys = []
+        for bucket in buckets:
+            keys.extend(bucket)
+    return keys
+
+
+def sort_floats(
+    arr: List[float],
+    in_place: bool = True,
+    nan_position: str = 'last',
+    reverse: bool = False
+) -> Optional[List[float]]:
+    """
+    NaN-aware float sort in IEEE-754 total order.
+    
+    Comparison sorts silently misorder arrays containing NaN, because every
+    comparison with NaN is False. This maps each double to an order-preserving
+    unsigned 64-bit key, sorts the keys with LSD radix passes (integer digit
+    extraction only, no float comparisons), and maps them back.
+    
+    Args:
+        arr: The array of floats (ints are converted to float)
+        in_place: If True, sorts the array in place and returns None.
+                  If False, returns a new sorted array without modifying the original.
+        nan_position: 'last' or 'first'; where all NaNs are grouped
+        reverse: If True, sort in descending order (NaNs still go to
+                 nan_position)
+    
+    Returns:
+        None if in_place=True, otherwise a new sorted list
+    
+    Time Complexity: O(n) - at most eight passes of 8-bit digits
+    
+    Space Complexity: O(n) - key list and buckets
+    
+    Example:
+        >>> arr = [2.5, float('nan'), -0.0, -1.0, 0.0]
+        >>> sort_floats(arr, nan_position='first')
+        >>> arr
+        [nan, -1.0, -0.0, 0.0, 2.5]
+    """
+    if nan_position not in ('last', 'first'):
+        raise ValueError("nan_position must be 'last' or 'first'")
+    if not arr:
+        return None if in_place else []
+    
+    # Descending order is the ascending order reversed, so put NaNs at the
+    # opposite end before reversing
+    if reverse:
+        nan_position = 'first' if nan_position == 'last' else 'last'
+    
+    result = _floats_from_order_keys(_radix_sort_u64(_float_order_keys(arr, nan_position)))
+    if reverse:
+        result.reverse()
+    
+    if in_place:
+        arr[:] = result
+        return None
+    return result
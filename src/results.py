@@ -0,0 +1,730 @@
+"""
+Benchmark Results Store
+
+This module persists results from compare_algorithms to JSON or CSV together
+with environment metadata, loads earlier runs back, compares a new run
+against a baseline to flag statistically significant regressions per cell,
+and reruns only the cells whose code or inputs changed since a saved run.
+"""
+
+import os
+import csv
+import json
+import math
+import types
+import hashlib
+import platform
+import functools
+import subprocess
+import datetime
+from typing import List, Callable, Dict, Tuple, Any, Optional, TextIO
+
+from .comparison import compare_algorithms
+
+
+Results = Dict[str, Dict[str, Dict[int, Dict[str, Any]]]]
+
+# Stats fields written to CSV, in column order
+_CSV_STATS = ['mean', 'median', 'min', 'max', 'stdev']
+# Integer fields present only when the run measured memory
+_CSV_OPTIONAL = ['peak_memory', 'net_memory', 'max_depth']
+_CSV_METADATA_PREFIX = '# metadata: '
+
+
+def _cpu_model() -> str:
+    """Best-effort human-readable CPU model name."""
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _git_commit() -> Optional[str]:
+    """Commit hash of the checkout this module lives in, if available."""
+    try:
+        output = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if output.returncode != 0:
+        return None
+    return output.stdout.strip() or None
+
+
+def collect_environment() -> Dict[str, Any]:
+    """
+    Collect metadata describing the machine and code a run was produced on.
+    
+    Returns:
+        Dictionary with Python version, platform, CPU model and count,
+        git commit (or None), and an ISO-8601 UTC timestamp
+    """
+    return {
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu': _cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'commit': _git_commit(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat()
+    }
+
+
+def write_results(
+    results: Results,
+    f: TextIO,
+    fmt: str = 'json',
+    metadata: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Write compare_algorithms results to an open text stream.
+    
+    Args:
+        results: Results dictionary from compare_algorithms
+        f: Writable text stream (open CSV files with newline='')
+        fmt: 'json' or 'csv'
+        metadata: Extra metadata merged over collect_environment()
+    """
+    meta = collect_environment()
+    if metadata:
+        meta.update(metadata)
+    
+    if fmt == 'json':
+        payload = {
+            'metadata': meta,
+            'results': {
+                algo_name: {
+                    dist_name: {str(size): stats for size, stats in cells.items()}
+                    for dist_name, cells in dists.items()
+                }
+                for algo_name, dists in results.items()
+            }
+        }
+        json.dump(payload, f, indent=2)
+        f.write('\n')
+    elif fmt == 'csv':
+        f.write(_CSV_METADATA_PREFIX + json.dumps(meta) + '\n')
+        writer = csv.writer(f)
+        writer.writerow(['algorithm', 'distribution', 'size', 'status']
+                        + _CSV_STATS + _CSV_OPTIONAL + ['samples'])
+        for algo_name, dists in results.items():
+            for dist_name, cells in dists.items():
+                for size, stats in cells.items():
+                    writer.writerow(
+                        [algo_name, dist_name, size, stats.get('status', 'ok')]
+                        + [repr(stats[field]) for field in _CSV_STATS]
+                        + [stats.get(field, '') for field in _CSV_OPTIONAL]
+                        + [';'.join(repr(t) for t in stats.get('samples', []))]
+                    )
+    else:
+        raise ValueError(f"Unsupported results format '{fmt}' (use json or csv)")
+
+
+def save_results(
+    results: Results,
+    path: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Save compare_algorithms results to a JSON or CSV file.
+    
+    The format is chosen from the file extension (.json or .csv).
+    
+    Args:
+        results: Results dictionary from compare_algorithms
+        path: Destination file path
+        metadata: Extra metadata merged over collect_environment()
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in ('.json', '.csv'):
+        raise ValueError(f"Unsupported results format '{ext}' (use .json or .csv)")
+    with open(path, 'w', newline='') as f:
+        write_results(results, f, ext[1:], metadata)
+
+
+def load_results(path: str) -> Tuple[Results, Dict[str, Any]]:
+    """
+    Load results previously written by save_results.
+    
+    Args:
+        path: JSON or CSV file path
+    
+    Returns:
+        Tuple of (results, metadata), with results in the compare_algorithms
+        layout and integer size keys
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path) as f:
+            payload = json.load(f)
+        results = {
+            algo_name: {
+                dist_name: {int(size): stats for size, stats in cells.items()}
+                for dist_name, cells in dists.items()
+            }
+            for algo_name, dists in payload['results'].items()
+        }
+        return results, payload.get('metadata', {})
+    
+    if ext == '.csv':
+        metadata = {}
+        results = {}
+        with open(path, newline='') as f:
+            first = f.readline()
+            if first.startswith(_CSV_METADATA_PREFIX):
+                metadata = json.loads(first[len(_CSV_METADATA_PREFIX):])
+            else:
+                f.seek(0)
+            for row in csv.DictReader(f):
+                stats = {field: float(row[field]) for field in _CSV_STATS}
+                for field in _CSV_OPTIONAL:
+                    if row.get(field):
+                        stats[field] = int(row[field])
+                stats['samples'] = [float(t) for t in row['samples'].split(';') if t]
+                stats['status'] = row['status']
+                cells = results.setdefault(row['algorithm'], {}).setdefault(row['distribution'], {})
+                cells[int(row['size'])] = stats
+        return results, metadata
+    
+    raise ValueError(f"Unsupported results format '{ext}' (use .json or .csv)")
+
+
+def _u_distribution(m: int, n: int) -> List[int]:
+    """
+    Exact null distribution of the Mann-Whitney U statistic without ties.
+    
+    Returns counts where counts[u] is the number of orderings of m + n
+    distinct values that give U = u; the total is C(m + n, m).
+    """
+    # dist[j] holds the counts for the current i and j
+    dist = [[1] for _ in range(n + 1)]
+    for i in range(1, m + 1):
+        new = [[1]]
+        for j in range(1, n + 1):
+            counts = [0] * (i * j + 1)
+            # Largest value belongs to the first sample: it beats all j others
+            for u, c in enumerate(dist[j]):
+                counts[u + j] += c
+            # Largest value belongs to the second sample
+            for u, c in enumerate(new[j - 1]):
+                counts[u] += c
+            new.append(counts)
+        dist = new
+    return dist[n]
+
+
+def mann_whitney_u(x: List[float], y: List[float]) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that x tends to be larger than y.
+    
+    Uses the exact null distribution for small samples without ties and a
+    tie-corrected normal approximation otherwise.
+    
+    Args:
+        x: First sample (e.g. current timings)
+        y: Second sample (e.g. baseline timings)
+    
+    Returns:
+        Tuple of (U statistic for x, one-sided p-value)
+    """
+    m, n = len(x), len(y)
+    if m == 0 or n == 0:
+        raise ValueError("Mann-Whitney U requires two non-empty samples")
+    
+    u = sum(1.0 if a > b else 0.5 if a == b else 0.0 for a in x for b in y)
+    
+    combined = sorted(x + y)
+    tie_sizes = []
+    run = 1
+    for prev, cur in zip(combined, combined[1:]):
+        if cur == prev:
+            run += 1
+        else:
+            tie_sizes.append(run)
+            run = 1
+    tie_sizes.append(run)
+    has_ties = any(t > 1 for t in tie_sizes)
+    
+    if not has_ties and m + n <= 40:
+        counts = _u_distribution(m, n)
+        p_value = sum(counts[int(u):]) / math.comb(m + n, m)
+        return u, p_value
+    
+    total = m + n
+    tie_term = sum(t ** 3 - t for t in tie_sizes) / (total * (total - 1))
+    variance = m * n / 12.0 * ((total + 1) - tie_term)
+    if variance <= 0:
+        return u, 1.0
+    z = (u - m * n / 2.0 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_to_baseline(
+    baseline: Results,
+    current: Results,
+    alpha: float = 0.05,
+    threshold: float = 0.05
+) -> Dict[str, Dict[str, Dict[int, Dict[str, Any]]]]:
+    """
+    Compare a new run against a baseline run cell by cell.
+    
+    A cell is a regression when the current samples are significantly slower
+    and the median slowed down by more than threshold, or when it completed
+    in the baseline but not in the current run. Improvements are detected
+    symmetrically. Significance uses a one-sided Mann-Whitney test per cell
+    with a Holm correction across all tested cells, so the chance of flagging
+    any cell of an unchanged grid stays below alpha. Cells with too few
+    samples for the test to ever reach alpha (1 / C(m+n, m) >= alpha, e.g.
+    3 vs 3 iterations) are marked 'insufficient samples' instead.
+    
+    Args:
+        baseline: Results of the reference run
+        current: Results of the new run
+        alpha: Family-wise significance level
+        threshold: Minimum relative change in median time to report
+    
+    Returns:
+        Nested dictionary: comparison[algorithm][distribution][size] with
+        'status' ('regression', 'improvement', 'unchanged', 'insufficient
+        samples', or 'incomparable'), 'baseline_median', 'current_median',
+        'ratio', and 'p_value' (uncorrected)
+    """
+    comparison = {}
+    tested = []
+    
+    for algo_name, dists in current.items():
+        for dist_name, cells in dists.items():
+            for size, stats in cells.items():
+                base = baseline.get(algo_name, {}).get(dist_name, {}).get(size)
+                entry = {
+                    'baseline_median': base['median'] if base else None,
+                    'current_median': stats['median'],
+                    'ratio': None,
+                    'p_value': None
+                }
+                base_ok = base is not None and base.get('status', 'ok') == 'ok'
+                current_ok = stats.get('status', 'ok') == 'ok'
+                
+                if not base_ok:
+                    entry['status'] = 'incomparable'
+                elif not current_ok:
+                    entry['status'] = 'regression'
+                else:
+                    entry['ratio'] = (stats['median'] / base['median']
+                                      if base['median'] > 0 else float('inf'))
+                    base_samples = base.get('samples') or [base['median']]
+                    current_samples = stats.get('samples') or [stats['median']]
+                    
+                    if 1 / math.comb(len(base_samples) + len(current_samples),
+                                     len(base_samples)) >= alpha:
+                        entry['status'] = 'insufficient samples'
+                    else:
+                        entry['status'] = 'unchanged'
+                        # Test in the direction of the change; every tested
+                        # cell counts towards the Holm correction
+                        if entry['ratio'] >= 1:
+                            _, entry['p_value'] = mann_whitney_u(current_samples, base_samples)
+                        else:
+                            _, entry['p_value'] = mann_whitney_u(base_samples, current_samples)
+                        tested.append(entry)
+                
+                comparison.setdefault(algo_name, {}).setdefault(dist_name, {})[size] = entry
+    
+    # Holm step-down: the k-th smallest p-value must beat alpha / (T - k)
+    tested.sort(key=lambda entry: entry['p_value'])
+    for k, entry in enumerate(tested):
+        if not entry['p_value'] < alpha / (len(tested) - k):
+            break
+        if entry['ratio'] > 1 + threshold:
+            entry['status'] = 'regression'
+        elif entry['ratio'] < 1 - threshold:
+            entry['status'] = 'improvement'
+    
+    return comparison
+
+
+def find_regressions(
+    comparison: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]]
+) -> List[Tuple[str, str, int]]:
+    """
+    List the (algorithm, distribution, size) cells flagged as regressions.
+    
+    Args:
+        comparison: Output of compare_to_baseline
+    
+    Returns:
+        List of regressed cells in grid order
+    """
+    return [
+        (algo_name, dist_name, size)
+        for algo_name, dists in comparison.items()
+        for dist_name, cells in dists.items()
+        for size, entry in cells.items()
+        if entry['status'] == 'regression'
+    ]
+
+
+def format_comparison_table(
+    comparison: Dict[str, Dict[str, Dict[int, Dict[str, Any]]]]
+) -> str:
+    """
+    Format a baseline comparison as a readable table.
+    
+    Args:
+        comparison: Output of compare_to_baseline
+    
+    Returns:
+        Formatted string table
+    """
+    def _fmt(value: Optional[float], spec: str) -> str:
+        return 'n/a' if value is None else format(value, spec)
+    
+    lines = []
+    lines.append("=" * 80)
+    lines.append("BENCHMARK COMPARISON AGAINST BASELINE")
+    lines.append("=" * 80)
+    
+    for algo_name in comparison:
+        lines.append(f"\n{algo_name.upper()}")
+        lines.append("-" * 80)
+        
+        for dist_name in comparison[algo_name]:
+            lines.append(f"\n  {dist_name}:")
+            lines.append(f"  {'Size':<10} {'Baseline (s)':<15} {'Current (s)':<15} "
+                         f"{'Ratio':<10} {'p-value':<10} {'Status'}")
+            lines.append("  " + "-" * 75)
+            
+            for size in sorted(comparison[algo_name][dist_name].keys()):
+                entry = comparison[algo_name][dist_name][size]
+                lines.append(
+                    f"  {size:<10} {_fmt(entry['baseline_median'], '.6f'):<15} "
+                    f"{_fmt(entry['current_median'], '.6f'):<15} "
+                    f"{_fmt(entry['ratio'], '.3f'):<10} {_fmt(entry['p_value'], '.4f'):<10} "
+                    f"{entry['status']}"
+                )
+    
+    lines.append("\n" + "=" * 80)
+    return "\n".join(lines)
+
+
+def _code_signature(code: types.CodeType, digest: Any, names: List[str]) -> None:
+    """Hash a code object's bytecode, constants, and names, ignoring line numbers."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    names.extend(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_signature(const, digest, names)
+        elif isinstance(const, frozenset):
+            # Set literals iterate in hash order, which varies between processes
+            digest.update(repr(sorted(map(repr, const))).encode('utf-8'))
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+
+# Values whose repr() is the same in every process
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, type(Ellipsis))
+
+# Values fingerprinted by the code they run
+_CODE_TYPES = (types.FunctionType, types.MethodType, functools.partial, type)
+
+# Class attributes that do not affect behaviour
+_CLASS_METADATA = frozenset({'__dict__', '__weakref__', '__module__', '__qualname__',
+                             '__doc__', '__firstlineno__', '__static_attributes__'})
+
+
+def _hash_owner(owner: Any, digest: Any, stack: List[Any]) -> None:
+    """
+    Hash the object a method is bound to by its class alone.
+    
+    Instance state is left out: a bound method such as random.randint
+    belongs to a shared instance whose attributes change as it is used.
+    """
+    cls = owner if isinstance(owner, type) else type(owner)
+    digest.update(f'<bound to {cls.__qualname__}>'.encode('utf-8'))
+    stack.append(cls)
+
+
+def _hash_value(value: Any, digest: Any, stack: List[Any], seen: Dict[Any, Any]) -> None:
+    """
+    Hash a value by type and content, queueing any code it holds on stack.
+    
+    Plain values hash by repr() and containers element by element; functions,
+    methods, partials and classes are queued for fingerprint_callable; modules
+    and builtins hash by name. Any other object hashes by its class and its
+    public attributes, because its repr() usually embeds a memory address and
+    its private attributes are usually caches and scratch buffers.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        digest.update(repr(value).encode('utf-8'))
+        return
+    if isinstance(value, _CODE_TYPES):
+        digest.update(b'<code>')
+        stack.append(value)
+        return
+    if isinstance(value, types.ModuleType):
+        digest.update(f'<module {value.__name__}>'.encode('utf-8'))
+        return
+    if isinstance(value, types.BuiltinFunctionType):
+        owner = value.__self__
+        if owner is not None and not isinstance(owner, types.ModuleType):
+            _hash_owner(owner, digest, stack)
+        digest.update(f'<builtin {value.__qualname__}>'.encode('utf-8'))
+        return
+    if id(value) in seen:
+        digest.update(b'<seen>')
+        return
+    seen[id(value)] = value
+    
+    digest.update(f'<{type(value).__qualname__}>'.encode('utf-8'))
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            _hash_value(item, digest, stack, seen)
+    elif isinstance(value, dict):
+        for item in value.items():
+            _hash_value(item, digest, stack, seen)
+    elif isinstance(value, (set, frozenset)):
+        # Hash each element on its own and sort, since set order varies
+        parts = []
+        for item in value:
+            part = hashlib.sha256()
+            _hash_value(item, part, stack, seen)
+            parts.append(part.digest())
+        digest.update(b''.join(sorted(parts)))
+    else:
+        stack.append(type(value))
+        qualname = getattr(value, '__qualname__', None)
+        if isinstance(qualname, str):
+            digest.update(qualname.encode('utf-8'))
+        state = dict(getattr(value, '__dict__', None) or {})
+        for cls in type(value).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if hasattr(value, slot):
+                    state[slot] = getattr(value, slot)
+        for name in sorted(state):
+            if not name.startswith('_'):
+                digest.update(name.encode('utf-8'))
+                _hash_value(state[name], digest, stack, seen)
+
+
+def _hash_global(value: Any, digest: Any, stack: List[Any], seen: Dict[Any, Any]) -> None:
+    """
+    Hash a value reached by global or module attribute name.
+    
+    Immutable values hash in full. Mutable ones (registries, caches, shared
+    instances) hash by class only, since their contents are runtime state
+    that differs between processes.
+    """
+    if isinstance(value, (tuple, frozenset) + _PLAIN_TYPES + _CODE_TYPES) or callable(value):
+        _hash_value(value, digest, stack, seen)
+    else:
+        digest.update(f'<{type(value).__qualname__}>'.encode('utf-8'))
+        stack.append(type(value))
+
+
+def _hash_module_attributes(
+    module: types.ModuleType,
+    names: List[str],
+    digest: Any,
+    stack: List[Any],
+    seen: Dict[Any, Any]
+) -> None:
+    """Hash the attributes of module named in names, following chains like os.path.join."""
+    for name in names:
+        if (id(module), name) in seen or name not in vars(module):
+            continue
+        seen[(id(module), name)] = module
+        value = vars(module)[name]
+        digest.update(f'{module.__name__}.{name}'.encode('utf-8'))
+        if isinstance(value, types.ModuleType):
+            _hash_module_attributes(value, names, digest, stack, seen)
+        else:
+            _hash_global(value, digest, stack, seen)
+
+
+def fingerprint_callable(func: Callable) -> str:
+    """
+    Fingerprint the code a callable runs.
+    
+    The fingerprint covers the callable's bytecode and constants, default
+    arguments, closure values (objects by class and public attributes), and,
+    recursively, everything it references by global name: functions,
+    classes (by the code of their methods), and attributes of imported
+    modules named in the code, such as helpers.run in
+    `lambda a: helpers.run(a)`. Bound methods count only the class of their
+    instance, not its state.
+    `lambda arr: quicksort(arr)` therefore changes fingerprint when
+    partition() changes, but not when unrelated code moves, and the same
+    callable gets the same fingerprint in every process.
+    
+    Args:
+        func: Function, lambda, bound method, functools.partial, class, or
+              callable object
+    
+    Returns:
+        Hex digest identifying the code
+    """
+    digest = hashlib.sha256()
+    seen = {}
+    stack = [func]
+    
+    while stack:
+        current = stack.pop()
+        if isinstance(current, functools.partial):
+            _hash_value((current.args, sorted(current.keywords.items())), digest, stack, seen)
+            stack.append(current.func)
+            continue
+        if isinstance(current, types.MethodType):
+            _hash_owner(current.__self__, digest, stack)
+            stack.append(current.__func__)
+            continue
+        if isinstance(current, type):
+            if id(current) in seen:
+                continue
+            seen[id(current)] = current
+            digest.update(f'<class {current.__module__}.{current.__qualname__}>'.encode('utf-8'))
+            if current.__module__ == 'builtins':
+                continue
+            for name, attr in sorted(vars(current).items()):
+                if name in _CLASS_METADATA:
+                    continue
+                digest.update(name.encode('utf-8'))
+                if isinstance(attr, (staticmethod, classmethod)):
+                    attr = attr.__func__
+                elif isinstance(attr, property):
+                    attr = (attr.fget, attr.fset, attr.fdel)
+                _hash_value(attr, digest, stack, seen)
+            stack.extend(current.__bases__)
+            continue
+        code = getattr(current, '__code__', None)
+        if code is None:
+            # Builtins by name, callable objects by class and state
+            _hash_value(current, digest, stack, seen)
+            continue
+        if id(current) in seen:
+            continue
+        seen[id(current)] = current
+        
+        names = []
+        _code_signature(code, digest, names)
+        _hash_value(current.__defaults__, digest, stack, seen)
+        _hash_value(current.__kwdefaults__, digest, stack, seen)
+        
+        for cell in current.__closure__ or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                digest.update(b'<empty cell>')
+                continue
+            if isinstance(value, types.ModuleType):
+                _hash_module_attributes(value, names, digest, stack, seen)
+            else:
+                _hash_value(value, digest, stack, seen)
+        
+        for name in names:
+            if name not in current.__globals__:
+                continue
+            value = current.__globals__[name]
+            digest.update(name.encode('utf-8'))
+            if isinstance(value, types.ModuleType):
+                _hash_module_attributes(value, names, digest, stack, seen)
+            else:
+                _hash_global(value, digest, stack, seen)
+    
+    return digest.hexdigest()
+
+
+def run_incremental_benchmark(
+    algorithms: Dict[str, Callable[[List[Any]], Any]],
+    array_generators: Dict[str, Callable[[int], List[Any]]],
+    sizes: List[int],
+    path: str,
+    iterations: int = 3,
+    **options: Any
+) -> Results:
+    """
+    Run a benchmark grid, reusing cells from a previous run saved at path.
+    
+    A saved cell is reused only when it completed (status 'ok'), its
+    algorithm and generator have the same fingerprint (see
+    fingerprint_callable), and iterations and options match; every other
+    cell, including newly added sizes and cells that failed or timed out, is
+    benchmarked again. The new cells are merged into the saved ones, so
+    sizes, algorithms and distributions outside this grid are kept unless
+    their code or the settings changed, and the result is written back to
+    path as JSON.
+    
+    Args:
+        algorithms: Dictionary mapping algorithm names to sorting functions
+        array_generators: Dictionary mapping distribution names to generator functions
+        sizes: List of array sizes to test
+        path: JSON results artifact to read and update
+        iterations: Number of iterations per test (for averaging)
+        **options: Forwarded to compare_algorithms (workers, cpu_affinity,
+                   timeout, measure_memory)
+    
+    Returns:
+        Nested dictionary: results[algorithm][distribution][size] = timing_stats
+    """
+    fingerprints = {
+        'algorithms': {name: fingerprint_callable(func) for name, func in algorithms.items()},
+        'generators': {name: fingerprint_callable(func) for name, func in array_generators.items()},
+        'settings': {'iterations': iterations, 'timeout': options.get('timeout'),
+                     'measure_memory': bool(options.get('measure_memory'))}
+    }
+    
+    previous, previous_fingerprints = {}, {}
+    if os.path.exists(path):
+        previous, metadata = load_results(path)
+        previous_fingerprints = metadata.get('fingerprints', {})
+    same_settings = previous_fingerprints.get('settings') == fingerprints['settings']
+    
+    def is_current(kind: str, name: str) -> bool:
+        """Whether saved cells for name are still valid (names outside the grid are kept)."""
+        current = fingerprints[kind].get(name)
+        return current is None or previous_fingerprints.get(kind, {}).get(name) == current
+    
+    # Saved series that are still valid; everything else is dropped
+    merged = {}
+    if same_settings:
+        for algo_name, dists in previous.items():
+            for dist_name, cells in dists.items():
+                if is_current('algorithms', algo_name) and is_current('generators', dist_name):
+                    merged.setdefault(algo_name, {})[dist_name] = dict(cells)
+        for kind in ('algorithms', 'generators'):
+            fingerprints[kind] = dict(previous_fingerprints.get(kind, {}), **fingerprints[kind])
+    
+    results = {algo_name: {dist_name: {} for dist_name in array_generators}
+               for algo_name in algorithms}
+    for algo_name, algo_func in algorithms.items():
+        for dist_name, gen_func in array_generators.items():
+            series = merged.setdefault(algo_name, {}).setdefault(dist_name, {})
+            cached = {size: stats for size, stats in series.items()
+                      if stats.get('status', 'ok') == 'ok'}
+            
+            missing = [size for size in sizes if size not in cached]
+            fresh = {}
+            if missing:
+                fresh = compare_algorithms({algo_name: algo_func}, {dist_name: gen_func},
+                                           missing, iterations=iterations, **options)
+                fresh = fresh[algo_name][dist_name]
+            else:
+                print(f"Reusing {algo_name} on {dist_name} from {path}")
+            
+            for size in sizes:
+                results[algo_name][dist_name][size] = cached[size] if size in cached else fresh[size]
+            series.update(results[algo_name][dist_name])
+            merged[algo_name][dist_name] = dict(sorted(series.items()))
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    save_results(merged, path, metadata={'fingerprints': fingerprints})
+    return results
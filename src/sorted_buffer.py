@@ -0,0 +1,224 @@
+"""
+Incremental Sorted Container
+
+This module provides SortedBuffer, a sorted collection that takes new items
+in batches. Storage is a sorted list of chunks (each at most 2 * load items)
+with the largest key of every chunk kept in a separate index. An incoming
+batch is sorted on its own with the Sorter engine and then merged only into
+the chunks it touches, so a batch of b items costs O(b log b) plus the size
+of the touched chunks, instead of re-sorting all n items.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import List, Callable, Optional, Any, Iterable, Iterator, Tuple
+
+from .sorter import Sorter, BATCH_CUTOFF
+from .merge import _gallop_merge_keyed
+
+
+class SortedBuffer:
+    """
+    Sorted container with batched inserts, bisect lookups and range queries.
+    
+    Items are ordered by key(item), or by the items themselves when no key
+    is given. Items with equal keys keep their insertion order across
+    batches; the order of equal keys within one batch is unspecified.
+    
+    Example:
+        >>> buf = SortedBuffer([5, 1, 3])
+        >>> buf.update([4, 2])
+        >>> list(buf)
+        [1, 2, 3, 4, 5]
+        >>> list(buf.irange(2, 4))
+        [2, 3, 4]
+    """
+    
+    DEFAULT_LOAD = 1000
+    
+    def __init__(
+        self,
+        iterable: Iterable[Any] = (),
+        key: Optional[Callable[[Any], Any]] = None,
+        load: int = DEFAULT_LOAD,
+        algorithm: str = '3way'
+    ):
+        """
+        Create a buffer, optionally filled from iterable.
+        
+        Args:
+            iterable: Initial items
+            key: Optional key function, called once per inserted item
+            load: Target chunk size; chunks are split once they exceed 2 * load
+            algorithm: Sorter algorithm for incoming batches, 'quicksort' or '3way'
+        """
+        if load < 1:
+            raise ValueError("load must be a positive integer")
+        self.key = key
+        self.load = load
+        self._sorter = Sorter(algorithm, 'random', BATCH_CUTOFF, seed=0)
+        self._chunks: List[List[Any]] = []
+        # Key chunks parallel to _chunks; None when items are their own keys
+        self._key_chunks: Optional[List[List[Any]]] = None if key is None else []
+        self._maxes: List[Any] = []
+        self._len = 0
+        self.update(iterable)
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._chunks:
+            yield from chunk
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+    
+    def __getitem__(self, index: int) -> Any:
+        """Item at a position in sorted order; O(n / load) to find the chunk."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedBuffer index out of range")
+        for chunk in self._chunks:
+            if index < len(chunk):
+                return chunk[index]
+            index -= len(chunk)
+    
+    def _keys_of(self, c: int) -> List[Any]:
+        return self._chunks[c] if self._key_chunks is None else self._key_chunks[c]
+    
+    def add(self, item: Any) -> None:
+        """Insert one item after any items with an equal key."""
+        sort_key = item if self.key is None else self.key(item)
+        if not self._chunks:
+            self._chunks.append([item])
+            if self._key_chunks is not None:
+                self._key_chunks.append([sort_key])
+            self._maxes.append(sort_key)
+            self._len = 1
+            return
+        
+        c = min(bisect_right(self._maxes, sort_key), len(self._chunks) - 1)
+        chunk_keys = self._keys_of(c)
+        position = bisect_right(chunk_keys, sort_key)
+        self._chunks[c].insert(position, item)
+        if self._key_chunks is not None:
+            chunk_keys.insert(position, sort_key)
+        self._maxes[c] = chunk_keys[-1]
+        self._len += 1
+        self._split(c)
+    
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Insert a batch of items.
+        
+        The batch is sorted with the Sorter engine, cut at the chunk
+        boundaries, and each piece is merged into its chunk with a
+        galloping merge; oversized chunks are then split.
+        """
+        items = list(iterable)
+        if not items:
+            return
+        keys = items if self.key is None else list(map(self.key, items))
+        if len(items) > 1:
+            try:
+                self._sorter._sort(items, None if self.key is None else keys, 0, len(items) - 1)
+            finally:
+                self._sorter._stack.clear()
+        self._len += len(items)
+        
+        if not self._chunks:
+            self._chunks = [items[i:i + self.load] for i in range(0, len(items), self.load)]
+            if self._key_chunks is not None:
+                self._key_chunks = [keys[i:i + self.load] for i in range(0, len(keys), self.load)]
+            self._maxes = [self._keys_of(c)[-1] for c in range(len(self._chunks))]
+            return
+        
+        last = len(self._chunks) - 1
+        touched = []
+        start = 0
+        while start < len(items):
+            # Items go to the first chunk whose largest key exceeds theirs
+            c = min(bisect_right(self._maxes, keys[start]), last)
+            end = len(items) if c == last else bisect_left(keys, self._maxes[c], start)
+            self._merge_into(c, items[start:end], keys[start:end])
+            touched.append(c)
+            start = end
+        
+        # Split from the back so earlier chunk indices stay valid
+        for c in reversed(touched):
+            self._split(c)
+    
+    def _merge_into(self, c: int, items: List[Any], keys: List[Any]) -> None:
+        """Merge sorted items (with their keys) into chunk c, after equal keys."""
+        if self._key_chunks is None:
+            self._chunks[c] = _gallop_merge_keyed(self._chunks[c], self._chunks[c], items, items)[0]
+        else:
+            self._chunks[c], self._key_chunks[c] = _gallop_merge_keyed(
+                self._chunks[c], self._key_chunks[c], items, keys, keep_keys=True)
+        self._maxes[c] = self._keys_of(c)[-1]
+    
+    def _split(self, c: int) -> None:
+        """Split chunk c into chunks of load items once it exceeds 2 * load."""
+        chunk = self._chunks[c]
+        if len(chunk) <= 2 * self.load:
+            return
+        load = self.load
+        pieces = [chunk[i:i + load] for i in range(0, len(chunk), load)]
+        self._chunks[c:c + 1] = pieces
+        if self._key_chunks is not None:
+            chunk_keys = self._key_chunks[c]
+            self._key_chunks[c:c + 1] = [chunk_keys[i:i + load] for i in range(0, len(chunk_keys), load)]
+        self._maxes[c:c + 1] = [self._keys_of(c + i)[-1] for i in range(len(pieces))]
+    
+    def _locate(self, sort_key: Any, right: bool) -> Tuple[int, int]:
+        """(chunk, offset) where sort_key would be inserted, bisect_left or bisect_right style."""
+        search = bisect_right if right else bisect_left
+        c = search(self._maxes, sort_key)
+        if c == len(self._chunks):
+            return c, 0
+        return c, search(self._keys_of(c), sort_key)
+    
+    def _position(self, c: int, offset: int) -> int:
+        return sum(map(len, self._chunks[:c])) + offset
+    
+    def bisect_left(self, sort_key: Any) -> int:
+        """Index of the first item whose key is not less than sort_key."""
+        return self._position(*self._locate(sort_key, right=False))
+    
+    def bisect_right(self, sort_key: Any) -> int:
+        """Index just past the last item whose key is not greater than sort_key."""
+        return self._position(*self._locate(sort_key, right=True))
+    
+    def count(self, sort_key: Any) -> int:
+        """Number of items whose key equals sort_key."""
+        return self.bisect_right(sort_key) - self.bisect_left(sort_key)
+    
+    def irange(
+        self,
+        minimum: Optional[Any] = None,
+        maximum: Optional[Any] = None,
+        inclusive: Tuple[bool, bool] = (True, True)
+    ) -> Iterator[Any]:
+        """
+        Iterate over the items whose keys lie between minimum and maximum.
+        
+        Args:
+            minimum: Lower key bound, or None for no lower bound
+            maximum: Upper key bound, or None for no upper bound
+            inclusive: Whether each bound is included
+        
+        Returns:
+            Iterator over the matching items in sorted order
+        """
+        start_c, start_i = (0, 0) if minimum is None else self._locate(minimum, right=not inclusive[0])
+        if maximum is None:
+            stop_c, stop_i = len(self._chunks) - 1, None
+        else:
+            stop_c, stop_i = self._locate(maximum, right=inclusive[1])
+            if stop_c == len(self._chunks):
+                stop_c, stop_i = stop_c - 1, None
+        
+        for c in range(start_c, stop_c + 1):
+            chunk = self._chunks[c]
+            yield from chunk[start_i if c == start_c else 0:stop_i if c == stop_c else None]
@@ -0,0 +1,629 @@
+"""
+Reusable Sorting Engine
+
+This module provides Sorter, a Quicksort engine configured once (algorithm,
+pivot strategy, small-subarray cutoff, key mode and random generator) and
+then applied to many arrays. The per-call setup that quicksort(),
+randomized_quicksort() and quicksort_3way() repeat on every call (pivot
+selector lambdas, nested closures, argument validation) happens once in the
+constructor, and the work stack and key buffer are kept between calls.
+"""
+
+import sys
+import time
+import heapq
+import random
+import asyncio
+import itertools
+from multiprocessing.connection import wait
+from concurrent.futures import Executor
+from typing import List, Callable, Optional, Any, Sequence, Union, Iterator, Generator
+
+from .quicksort import _check_cmp, _resolve_keys
+from .comparison import _process_context
+
+
+class Sorter:
+    """
+    Reusable Quicksort engine.
+    
+    Example:
+        >>> sorter = Sorter(algorithm='3way', pivot='random', cutoff=16, seed=42)
+        >>> batch = [3, 1, 2, 3, 1]
+        >>> sorter.sort(batch)
+        >>> batch
+        [1, 1, 2, 3, 3]
+    """
+    
+    ALGORITHMS = ('quicksort', '3way')
+    PIVOTS = ('last', 'middle', 'random')
+    
+    def __init__(
+        self,
+        algorithm: str = 'quicksort',
+        pivot: str = 'last',
+        cutoff: int = 0,
+        key: Optional[Callable[[Any], Any]] = None,
+        keys: Optional[Sequence[Callable[[Any], Any]]] = None,
+        reverse: Union[bool, Sequence[bool]] = False,
+        cmp: Optional[Callable[[Any, Any], int]] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Configure the engine.
+        
+        Args:
+            algorithm: 'quicksort' (Lomuto partition) or '3way' (Dutch
+                       National Flag partition)
+            pivot: Pivot strategy: 'last', 'middle', or 'random'
+            cutoff: Subarrays of at most this many elements are finished
+                    with insertion sort (0 disables it)
+            key: Optional key function; keys are extracted once per element
+                 into a reused buffer
+            keys: Optional list of key functions compared lexicographically
+                  (see quicksort)
+            reverse: If True, sort in descending order; with keys, may be a
+                     list of per-key flags
+            cmp: Optional three-way comparator (see quicksort)
+            seed: Seed for this engine's own random generator, used by the
+                  'random' pivot strategy. Unlike randomized_quicksort, the
+                  global random module is never reseeded.
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm '{algorithm}'; choose from {list(self.ALGORITHMS)}")
+        if pivot not in self.PIVOTS:
+            raise ValueError(f"Unknown pivot strategy '{pivot}'; choose from {list(self.PIVOTS)}")
+        if cutoff < 0:
+            raise ValueError("cutoff must be non-negative")
+        
+        # Validate the key mode once, using the same rules as the engines
+        if cmp is not None:
+            _check_cmp(key, keys, reverse)
+            descending = reverse
+        else:
+            _, descending = _resolve_keys([], key, keys, reverse)
+        
+        self.algorithm = algorithm
+        self.pivot = pivot
+        self.cutoff = cutoff
+        self.key = key
+        self.keys = list(keys) if keys is not None else None
+        self.reverse = reverse
+        self.cmp = cmp
+        self._descending = descending
+        self._rng = random.Random(seed)
+        self._select_pivot: Callable[[int, int], int] = {
+            'last': lambda low, high: high,
+            'middle': lambda low, high: (low + high) // 2,
+            'random': self._rng.randint,
+        }[pivot]
+        
+        # Buffers kept between calls
+        self._stack: List[Any] = []
+        self._key_buffer: List[Any] = []
+    
+    def sort(self, arr: List[Any], in_place: bool = True) -> Optional[List[Any]]:
+        """
+        Sort one array with this engine's configuration.
+        
+        Args:
+            arr: The array to sort
+            in_place: If True, sorts the array in place and returns None.
+                      If False, returns a new sorted array without modifying the original.
+        
+        Returns:
+            None if in_place=True, otherwise a new sorted list
+        """
+        target = arr if in_place else arr.copy()
+        if len(target) > 1:
+            sort_keys = self._extract_keys(target)
+            try:
+                self._sort(target, sort_keys, 0, len(target) - 1)
+            finally:
+                self._stack.clear()
+        return None if in_place else target
+    
+    __call__ = sort
+    
+    def _extract_keys(self, arr: List[Any]) -> Optional[List[Any]]:
+        """Keys parallel to arr, or None when elements are compared directly."""
+        if self.keys is not None:
+            return _resolve_keys(arr, None, self.keys, self.reverse)[0]
+        if self.key is None:
+            return None
+        
+        # Refill the same list object so its storage is reused across calls
+        buffer = self._key_buffer
+        buffer[:] = map(self.key, arr)
+        return buffer
+    
+    def _sort(self, arr: List[Any], sort_keys: Optional[List[Any]], low: int, high: int) -> None:
+        """Iterative Quicksort of arr[low..high], moving items alongside when keyed."""
+        for _ in self._sort_steps(arr, sort_keys, low, high, sys.maxsize):
+            pass
+    
+    def _sort_steps(
+        self,
+        arr: List[Any],
+        sort_keys: Optional[List[Any]],
+        low: int,
+        high: int,
+        chunk: int
+    ) -> Iterator[None]:
+        """
+        Resumable form of _sort: yields after every chunk partition steps
+        and after each insertion-sorted subarray, so callers can interleave
+        other work without changing the result.
+        """
+        values = arr if sort_keys is None else sort_keys
+        items = None if sort_keys is None else arr
+        partition = self._partition_3way if self.algorithm == '3way' else self._partition_lomuto
+        stack = self._stack
+        stack.append((low, high))
+        
+        while stack:
+            low, high = stack.pop()
+            if high - low < self.cutoff:
+                self._insertion_sort(values, items, low, high)
+                yield
+                continue
+            
+            pivot_index = self._select_pivot(low, high)
+            values[pivot_index], values[high] = values[high], values[pivot_index]
+            if items is not None:
+                items[pivot_index], items[high] = items[high], items[pivot_index]
+            
+            lt, gt = yield from partition(values, items, low, high, chunk)
+            
+            # Push the larger side first so the smaller one is sorted next,
+            # which bounds the stack at O(log n) entries
+            left, right = (low, lt - 1), (gt + 1, high)
+            if lt - low > high - gt:
+                left, right = right, left
+            if right[0] < right[1]:
+                stack.append(right)
+            if left[0] < left[1]:
+                stack.append(left)
+    
+    def _partition_lomuto(self, values: List[Any], items: Optional[List[Any]],
+                          low: int, high: int, chunk: int) -> Generator[None, None, tuple[int, int]]:
+        """Lomuto partition around values[high], yielding every chunk steps; returns (pos, pos)."""
+        pivot_value = values[high]
+        cmp, reverse = self.cmp, self._descending
+        i = low - 1
+        
+        for start in range(low, high, chunk):
+            for j in range(start, min(start + chunk, high)):
+                current_value = values[j]
+                if cmp is not None:
+                    order = cmp(current_value, pivot_value)
+                    before = order > 0 if reverse else order < 0
+                else:
+                    before = (current_value > pivot_value) if reverse else (current_value < pivot_value)
+                if before:
+                    i += 1
+                    values[i], values[j] = values[j], values[i]
+                    if items is not None:
+                        items[i], items[j] = items[j], items[i]
+            yield
+        
+        values[i + 1], values[high] = values[high], values[i + 1]
+        if items is not None:
+            items[i + 1], items[high] = items[high], items[i + 1]
+        return i + 1, i + 1
+    
+    def _partition_3way(self, values: List[Any], items: Optional[List[Any]],
+                        low: int, high: int, chunk: int) -> Generator[None, None, tuple[int, int]]:
+        """Three-way partition around values[high], yielding every chunk steps; returns (lt, gt)."""
+        pivot_value = values[high]
+        cmp, reverse = self.cmp, self._descending
+        lt = low
+        i = low
+        gt = high
+        steps = chunk
+        
+        if cmp is not None:
+            while i <= gt:
+                order = -cmp(values[i], pivot_value) if reverse else cmp(values[i], pivot_value)
+                if order < 0:
+                    values[lt], values[i] = values[i], values[lt]
+                    if items is not None:
+                        items[lt], items[i] = items[i], items[lt]
+                    lt += 1
+                    i += 1
+                elif order > 0:
+                    values[i], values[gt] = values[gt], values[i]
+                    if items is not None:
+                        items[i], items[gt] = items[gt], items[i]
+                    gt -= 1
+                else:
+                    i += 1
+                steps -= 1
+                if not steps:
+                    yield
+                    steps = chunk
+            return lt, gt
+        
+        while i <= gt:
+            current_value = values[i]
+            if (current_value > pivot_value) if reverse else (current_value < pivot_value):
+                values[lt], values[i] = values[i], values[lt]
+                if items is not None:
+                    items[lt], items[i] = items[i], items[lt]
+                lt += 1
+                i += 1
+            elif (current_value < pivot_value) if reverse else (current_value > pivot_value):
+                values[i], values[gt] = values[gt], values[i]
+                if items is not None:
+                    items[i], items[gt] = items[gt], items[i]
+                gt -= 1
+            else:
+                i += 1
+            steps -= 1
+            if not steps:
+                yield
+                steps = chunk
+        
+        return lt, gt
+    
+    def _insertion_sort(self, values: List[Any], items: Optional[List[Any]],
+                        low: int, high: int) -> None:
+        """Insertion sort of values[low..high], moving items alongside."""
+        cmp, reverse = self.cmp, self._descending
+        
+        for i in range(low + 1, high + 1):
+            value = values[i]
+            item = items[i] if items is not None else None
+            j = i - 1
+            while j >= low:
+                if cmp is not None:
+                    order = cmp(value, values[j])
+                    before = order > 0 if reverse else order < 0
+                else:
+                    before = (value > values[j]) if reverse else (value < values[j])
+                if not before:
+                    break
+                values[j + 1] = values[j]
+                if items is not None:
+                    items[j + 1] = items[j]
+                j -= 1
+            values[j + 1] = value
+            if items is not None:
+                items[j + 1] = item
+
+
+# Optimal sorting networks as (i, j) compare-exchange pairs. Beyond four
+# elements, insertion sort (the Sorter cutoff path) was faster in CPython.
+SORTING_NETWORKS = {
+    2: [(0, 1)],
+    3: [(1, 2), (0, 2), (0, 1)],
+    4: [(0, 1), (2, 3), (0, 2), (1, 3), (1, 2)],
+}
+
+# Lists up to this length are finished by insertion sort inside Sorter
+BATCH_CUTOFF = 16
+
+
+def _network_sort(
+    values: List[Any],
+    items: Optional[List[Any]],
+    network: List[tuple[int, int]],
+    reverse: bool
+) -> None:
+    """Apply a sorting network to values, moving items alongside."""
+    for i, j in network:
+        if (values[j] > values[i]) if reverse else (values[j] < values[i]):
+            values[i], values[j] = values[j], values[i]
+            if items is not None:
+                items[i], items[j] = items[j], items[i]
+
+
+def _numpy_row_sort(lists: List[List[Any]], reverse: bool) -> bool:
+    """
+    Sort equal-length numeric lists as the rows of one 2-D ndarray.
+    
+    Returns:
+        True if the group was sorted, False if it is not homogeneously
+        int or float (it is then left for the Python kernels)
+    """
+    import numpy as np
+    
+    first = type(lists[0][0])
+    if first not in (int, float) or any(type(v) is not first for lst in lists for v in lst):
+        return False
+    rows = np.array(lists)
+    if rows.dtype.kind not in 'if':
+        return False
+    
+    rows.sort(axis=1, kind='quicksort')
+    if reverse:
+        rows = rows[:, ::-1]
+    for lst, row in zip(lists, rows.tolist()):
+        lst[:] = row
+    return True
+
+
+def sort_many(
+    lists: List[List[Any]],
+    in_place: bool = True,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    use_numpy: bool = False
+) -> Optional[List[List[Any]]]:
+    """
+    Sort many small lists in one call.
+    
+    Lists are grouped by length and each group runs through one kernel:
+    sorting networks for up to four elements, and a single shared Sorter
+    (insertion sort up to BATCH_CUTOFF elements, Quicksort above) for the
+    rest, so per-call setup is paid once for the whole batch.
+    
+    Args:
+        lists: The lists to sort
+        in_place: If True, sorts every list in place and returns None.
+                  If False, returns new sorted lists without modifying the originals.
+        key: Optional key function, called once per element
+        reverse: If True, sort each list in descending order
+        use_numpy: If True, equal-length groups of plain ints or floats (and
+                   no key) are packed into one 2-D ndarray and row-sorted
+                   by NumPy. Requires NumPy.
+    
+    Returns:
+        None if in_place=True, otherwise a list of new sorted lists
+    
+    Example:
+        >>> batch = [[3, 1, 2], [9, 8], [5, 4, 6, 1, 0]]
+        >>> sort_many(batch)
+        >>> batch
+        [[1, 2, 3], [8, 9], [0, 1, 4, 5, 6]]
+    """
+    targets = lists if in_place else [lst.copy() for lst in lists]
+    
+    groups: dict[int, List[List[Any]]] = {}
+    for lst in targets:
+        if len(lst) > 1:
+            groups.setdefault(len(lst), []).append(lst)
+    
+    sorter = Sorter('quicksort', 'random', BATCH_CUTOFF, key=key, reverse=reverse, seed=0)
+    for size, group in groups.items():
+        if use_numpy and key is None and len(group) > 1 and _numpy_row_sort(group, reverse):
+            continue
+        
+        network = SORTING_NETWORKS.get(size)
+        if network is None:
+            for lst in group:
+                sorter.sort(lst)
+        elif key is None:
+            for lst in group:
+                _network_sort(lst, None, network, reverse)
+        else:
+            for lst in group:
+                _network_sort(list(map(key, lst)), lst, network, reverse)
+    
+    return None if in_place else targets
+
+
+def balance_segments(offsets: Sequence[int], workers: int) -> List[List[int]]:
+    """
+    Split segments into batches of roughly equal total element count.
+    
+    Greedy longest-first assignment: each segment, largest first, goes to
+    the batch with the fewest elements so far.
+    
+    Args:
+        offsets: Segment boundaries; segment i is [offsets[i], offsets[i+1])
+        workers: Number of batches
+    
+    Returns:
+        List of batches, each a list of segment indices (empty batches dropped)
+    """
+    sizes = [offsets[i + 1] - offsets[i] for i in range(len(offsets) - 1)]
+    loads = [(0, w) for w in range(workers)]
+    batches: List[List[int]] = [[] for _ in range(workers)]
+    for i in sorted(range(len(sizes)), key=sizes.__getitem__, reverse=True):
+        if sizes[i] < 2:
+            continue
+        load, w = heapq.heappop(loads)
+        batches[w].append(i)
+        heapq.heappush(loads, (load + sizes[i], w))
+    return [batch for batch in batches if batch]
+
+
+def _segment_worker(
+    conn: Any,
+    sorter: Sorter,
+    arr: List[Any],
+    sort_keys: Optional[List[Any]],
+    offsets: Sequence[int],
+    batch: List[int]
+) -> None:
+    """
+    Entry point of a worker process that sorts one batch of segments.
+    
+    Sorts its forked copy of arr and sends back ('ok', [(start, values)])
+    or ('error', exception).
+    """
+    try:
+        sorted_segments = []
+        for i in batch:
+            start, stop = offsets[i], offsets[i + 1]
+            sorter._sort(arr, sort_keys, start, stop - 1)
+            sorted_segments.append((start, arr[start:stop]))
+        conn.send(('ok', sorted_segments))
+    except Exception as e:
+        conn.send(('error', e))
+    finally:
+        conn.close()
+
+
+def segmented_sort(
+    arr: List[Any],
+    offsets: Sequence[int],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    algorithm: str = 'quicksort',
+    workers: Optional[int] = None
+) -> None:
+    """
+    Sort each segment [offsets[i], offsets[i+1]) of arr independently, in place.
+    
+    Segments are sorted directly inside arr by index range, without slicing
+    copies. Elements outside the first and last offsets are left untouched.
+    
+    Args:
+        arr: The flat array holding every segment
+        offsets: Non-decreasing segment boundaries (CSR-style row pointers)
+        key: Optional key function, called once per element
+        reverse: If True, sort each segment in descending order
+        algorithm: Sorter algorithm, 'quicksort' or '3way'
+        workers: If greater than 1, sort batches of segments (balanced by
+                 element count) in this many worker processes. Each worker
+                 sends its sorted segments back to be copied into arr, so
+                 this only pays off when segments are large.
+    
+    Example:
+        >>> arr = [3, 1, 2, 9, 7, 8, 5]
+        >>> segmented_sort(arr, [0, 3, 6])
+        >>> arr
+        [1, 2, 3, 7, 8, 9, 5]
+    """
+    if any(offsets[i] > offsets[i + 1] for i in range(len(offsets) - 1)):
+        raise ValueError("offsets must be non-decreasing")
+    if len(offsets) and (offsets[0] < 0 or offsets[-1] > len(arr)):
+        raise ValueError("offsets must lie within the array")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    
+    sorter = Sorter(algorithm, 'random', BATCH_CUTOFF, key=key, reverse=reverse, seed=0)
+    sort_keys = sorter._extract_keys(arr)
+    batches = balance_segments(offsets, workers or 1)
+    
+    if not workers or workers == 1 or len(batches) < 2:
+        for batch in batches:
+            for i in batch:
+                sorter._sort(arr, sort_keys, offsets[i], offsets[i + 1] - 1)
+        sorter._stack.clear()
+        return
+    
+    ctx = _process_context()
+    running = {}
+    for batch in batches:
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(target=_segment_worker,
+                           args=(send_conn, sorter, arr, sort_keys, offsets, batch),
+                           daemon=True)
+        proc.start()
+        send_conn.close()
+        running[recv_conn] = proc
+    
+    error = None
+    while running:
+        for conn in wait(list(running)):
+            proc = running.pop(conn)
+            try:
+                status, payload = conn.recv()
+            except EOFError:
+                status, payload = 'error', RuntimeError(f"worker exited with code {proc.exitcode}")
+            conn.close()
+            proc.join()
+            
+            if status == 'ok':
+                for start, values in payload:
+                    arr[start:start + len(values)] = values
+            elif error is None:
+                error = payload
+    
+    if error is not None:
+        raise error
+
+
+# Partition steps (or keys extracted) between checks of the slice deadline
+ASYNC_CHUNK = 2048
+
+
+def _sorted_copy(sorter: Sorter, arr: List[Any]) -> List[Any]:
+    """Executor entry point for aquicksort (module-level so process pools can pickle it)."""
+    return sorter.sort(arr, in_place=False)
+
+
+async def aquicksort(
+    arr: List[Any],
+    in_place: bool = True,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    sorter: Optional[Sorter] = None,
+    slice_budget: float = 0.005,
+    executor: Optional[Executor] = None,
+    executor_threshold: int = 100_000
+) -> Optional[List[Any]]:
+    """
+    Sort inside an asyncio event loop without stalling other coroutines.
+    
+    The Sorter engine runs in time slices: partition work is resumed in
+    chunks of ASYNC_CHUNK steps, and once a slice has used slice_budget
+    seconds the coroutine awaits asyncio.sleep(0) so other tasks can run.
+    The sequence of partitions is exactly that of Sorter.sort, so the result
+    is identical to the synchronous engine with the same configuration.
+    
+    Args:
+        arr: The array to sort
+        in_place: If True, sorts the array in place and returns None.
+                  If False, returns a new sorted array without modifying the original.
+        key: Optional key function, called once per element
+        reverse: If True, sort in descending order
+        sorter: Optional preconfigured Sorter (instead of key and reverse);
+                its buffers are in use until the sort finishes, so one
+                Sorter must not serve concurrent aquicksort calls
+        slice_budget: Longest time in seconds to run before yielding to the loop
+        executor: Optional concurrent.futures executor; arrays of at least
+                  executor_threshold elements are sorted there in one piece
+                  instead of in slices. A ProcessPoolExecutor needs a
+                  picklable sorter (no lambda keys).
+        executor_threshold: Minimum length sent to the executor
+    
+    Returns:
+        None if in_place=True, otherwise a new sorted list
+    
+    Example:
+        >>> asyncio.run(aquicksort([3, 1, 2], in_place=False))
+        [1, 2, 3]
+    """
+    if sorter is None:
+        sorter = Sorter('quicksort', 'random', BATCH_CUTOFF, key=key, reverse=reverse)
+    elif key is not None or reverse:
+        raise ValueError("Pass key and reverse to the Sorter, not alongside it")
+    if slice_budget <= 0:
+        raise ValueError("slice_budget must be positive")
+    
+    target = arr if in_place else arr.copy()
+    if len(target) < 2:
+        return None if in_place else target
+    
+    if executor is not None and len(target) >= executor_threshold:
+        loop = asyncio.get_running_loop()
+        target[:] = await loop.run_in_executor(executor, _sorted_copy, sorter, target)
+        return None if in_place else target
+    
+    deadline = time.perf_counter() + slice_budget
+    
+    if sorter.key is not None and sorter.keys is None:
+        # Extract keys in chunks too; a slow key function can stall the loop on its own
+        sort_keys = sorter._key_buffer
+        sort_keys.clear()
+        keys_iter = map(sorter.key, target)
+        while len(sort_keys) < len(target):
+            sort_keys.extend(itertools.islice(keys_iter, ASYNC_CHUNK))
+            if time.perf_counter() >= deadline:
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + slice_budget
+    else:
+        sort_keys = sorter._extract_keys(target)
+    
+    try:
+        for _ in sorter._sort_steps(target, sort_keys, 0, len(target) - 1, ASYNC_CHUNK):
+            if time.perf_counter() >= deadline:
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + slice_budget
+    finally:
+        sorter._stack.clear()
+    return None if in_place else target
@@ -0,0 +1,152 @@
+"""
+Test cases for the benchmark command-line runner.
+"""
+
+import io
+import os
+import json
+import random
+import tempfile
+import unittest
+import contextlib
+from src.bench import main, load_config, build_algorithms, build_generators
+from src.quicksort import quicksort
+from src.results import load_results
+
+
+class TestBenchCLI(unittest.TestCase):
+    """Test the python -m src.bench entry point."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _run(self, argv):
+        """Run main() capturing stdout and stderr."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = main(argv)
+        return code, stdout.getvalue(), stderr.getvalue()
+    
+    def test_table_output(self):
+        """Test the default table output on stdout."""
+        code, out, err = self._run(['--algorithms', 'quicksort,3way', '--distributions', 'random',
+                                    '--sizes', '10,20', '--iterations', '1'])
+        self.assertEqual(code, 0)
+        self.assertIn('SORTING ALGORITHM PERFORMANCE COMPARISON', out)
+        self.assertIn('Testing', err)
+        self.assertNotIn('Testing', out)
+    
+    def test_scaling_report(self):
+        """Test the optional scaling report on stderr."""
+        code, _, err = self._run(['--algorithms', '3way', '--distributions', 'random',
+                                  '--sizes', '50,200', '--iterations', '1', '--scaling'])
+        self.assertEqual(code, 0)
+        self.assertIn('EMPIRICAL SCALING ANALYSIS', err)
+    
+    def test_json_stdout_is_machine_readable(self):
+        """Test that JSON output on stdout parses cleanly."""
+        code, out, _ = self._run(['--algorithms', 'randomized', '--distributions', 'sorted',
+                                  '--sizes', '15', '--iterations', '2', '--format', 'json'])
+        self.assertEqual(code, 0)
+        payload = json.loads(out)
+        self.assertIn('15', payload['results']['randomized']['sorted'])
+        self.assertEqual(payload['metadata']['settings']['sizes'], [15])
+    
+    def test_config_file_with_flag_override(self):
+        """Test settings from a config file, overridden by flags."""
+        config_path = os.path.join(self.tmpdir.name, 'bench.json')
+        with open(config_path, 'w') as f:
+            json.dump({'algorithms': ['quicksort'], 'distributions': ['duplicates', 'mcilroy'],
+                       'sizes': [10, 30], 'iterations': 1}, f)
+        output = os.path.join(self.tmpdir.name, 'run.csv')
+        
+        code, _, _ = self._run(['--config', config_path, '--sizes', '25',
+                                '--format', 'csv', '--output', output])
+        self.assertEqual(code, 0)
+        results, meta = load_results(output)
+        self.assertEqual(set(results['quicksort']), {'duplicates', 'mcilroy'})
+        self.assertEqual(list(results['quicksort']['mcilroy']), [25])
+    
+    def test_toml_config(self):
+        """Test loading a TOML config file."""
+        config_path = os.path.join(self.tmpdir.name, 'bench.toml')
+        with open(config_path, 'w') as f:
+            f.write('algorithms = ["3way"]\nsizes = [10, 100]\nseed = 7\n')
+        try:
+            config = load_config(config_path)
+        except ValueError:
+            self.skipTest("TOML support requires Python 3.11+")
+        self.assertEqual(config, {'algorithms': ['3way'], 'sizes': [10, 100], 'seed': 7})
+    
+    def test_baseline_regression_exit_code(self):
+        """Test that a regression against the baseline exits with 1."""
+        baseline = os.path.join(self.tmpdir.name, 'baseline.json')
+        self._run(['--algorithms', 'quicksort', '--distributions', 'random', '--sizes', '50',
+                   '--iterations', '5', '--format', 'json', '--output', baseline])
+        with open(baseline) as f:
+            payload = json.load(f)
+        payload['results']['quicksort']['random']['50']['status'] = 'ok'
+        payload['results']['quicksort']['random']['50']['median'] = 1e-12
+        payload['results']['quicksort']['random']['50']['samples'] = [1e-12] * 5
+        with open(baseline, 'w') as f:
+            json.dump(payload, f)
+        
+        code, _, err = self._run(['--algorithms', 'quicksort', '--distributions', 'random',
+                                  '--sizes', '50', '--iterations', '5', '--baseline', baseline])
+        self.assertEqual(code, 1)
+        self.assertIn('regression', err)
+    
+    def test_baseline_needs_enough_iterations(self):
+        """Test that --baseline refuses runs too short to compare."""
+        baseline = os.path.join(self.tmpdir.name, 'baseline.json')
+        args = ['--algorithms', 'quicksort', '--distributions', 'random', '--sizes', '50']
+        self._run(args + ['--iterations', '3', '--format', 'json', '--output', baseline])
+        
+        # Default settings (3 iterations) and a 3-iteration baseline are both refused
+        for iterations in ([], ['--iterations', '5']):
+            with self.assertRaises(SystemExit) as ctx:
+                self._run(args + iterations + ['--baseline', baseline])
+            self.assertEqual(ctx.exception.code, 2)
+        
+        self._run(args + ['--iterations', '5', '--format', 'json', '--output', baseline])
+        _, _, err = self._run(args + ['--iterations', '5', '--baseline', baseline])
+        self.assertIn('BENCHMARK COMPARISON AGAINST BASELINE', err)
+    
+    def test_measure_memory_flag(self):
+        """Test --measure-memory and its --memory alias."""
+        for flag in ('--measure-memory', '--memory'):
+            code, out, _ = self._run(['--algorithms', '3way', '--distributions', 'random',
+                                      '--sizes', '20', '--iterations', '1', '--format', 'json', flag])
+            self.assertEqual(code, 0)
+            payload = json.loads(out)
+            self.assertTrue(payload['metadata']['settings']['measure_memory'])
+            self.assertIn('peak_memory', payload['results']['3way']['random']['20'])
+    
+    def test_inputs_do_not_depend_on_rng_state(self):
+        """Test that each cell's input depends only on the seed, distribution and size."""
+        generators = build_generators(['random', 'nearly_sorted', 'duplicates'], quicksort, seed=3)
+        first = {name: gen(50) for name, gen in generators.items()}
+        random.seed(12345)
+        random.random()
+        self.assertEqual({name: gen(50) for name, gen in generators.items()}, first)
+        self.assertNotEqual(generators['random'](50),
+                            build_generators(['random'], quicksort, seed=4)['random'](50))
+        self.assertNotEqual(generators['random'](50), generators['random'](51)[:50])
+    
+    def test_invalid_settings(self):
+        """Test that unknown names are reported as usage errors."""
+        with self.assertRaises(SystemExit) as ctx:
+            self._run(['--algorithms', 'bogosort'])
+        self.assertEqual(ctx.exception.code, 2)
+        
+        with self.assertRaises(ValueError):
+            build_generators(['bogus'], quicksort, seed=0)
+        with self.assertRaises(ValueError):
+            build_algorithms(['bogus'], seed=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,16 +2,31 @@
 Test cases for comparison utilities.
 """
 
+import os
+import time
 import unittest
+import multiprocessing
 from src.comparison import (
     generate_random_array,
     generate_sorted_array,
     generate_reverse_sorted_array,
     generate_nearly_sorted_array,
     generate_array_with_duplicates,
-    benchmark_sorting_algorithm
+    generate_organ_pipe_array,
+    generate_sawtooth_array,
+    generate_ascending_runs_array,
+    generate_skewed_duplicates_array,
+    generate_common_prefix_strings,
+    generate_mcilroy_adversary,
+    adversarial_generators,
+    run_adversarial_benchmark,
+    benchmark_sorting_algorithm,
+    measure_memory_usage,
+    measure_max_depth,
+    compare_algorithms,
+    format_results_table
 )
-from src.quicksort import quicksort, randomized_quicksort
+from src.quicksort import quicksort, randomized_quicksort, quicksort_3way
 
 
 class TestArrayGenerators(unittest.TestCase):
@@ -54,6 +69,88 @@ class TestArrayGenerators(unittest.TestCase):
         self.assertLessEqual(len(unique_values), 5)
 
 
+class TestAdversarialGenerators(unittest.TestCase):
+    """Test adversarial and structured input generators."""
+    
+    def _count_comparisons(self, sort_func, values):
+        """Count element comparisons made while sorting values."""
+        count = [0]
+        
+        class Counted:
+            def __init__(self, value):
+                self.value = value
+            
+            def __lt__(self, other):
+                count[0] += 1
+                return self.value < other.value
+            
+            def __gt__(self, other):
+                count[0] += 1
+                return self.value > other.value
+        
+        sort_func([Counted(v) for v in values])
+        return count[0]
+    
+    def test_organ_pipe(self):
+        """Test organ-pipe array generation."""
+        self.assertEqual(generate_organ_pipe_array(7), [0, 1, 2, 3, 2, 1, 0])
+        self.assertEqual(generate_organ_pipe_array(6), [0, 1, 2, 2, 1, 0])
+        self.assertEqual(generate_organ_pipe_array(0), [])
+    
+    def test_sawtooth(self):
+        """Test sawtooth array generation."""
+        self.assertEqual(generate_sawtooth_array(12, teeth=3), [0, 1, 2, 3] * 3)
+        self.assertEqual(len(generate_sawtooth_array(101, teeth=10)), 101)
+    
+    def test_ascending_runs(self):
+        """Test that runs array has the requested size and ascending runs."""
+        arr = generate_ascending_runs_array(1000, mean_run_length=50)
+        self.assertEqual(len(arr), 1000)
+        descents = sum(1 for i in range(len(arr) - 1) if arr[i] > arr[i + 1])
+        self.assertLess(descents, 100)
+    
+    def test_skewed_duplicates(self):
+        """Test that skewed duplicates favor the lowest value."""
+        arr = generate_skewed_duplicates_array(2000, unique_count=5, skew=2.0)
+        self.assertEqual(len(arr), 2000)
+        self.assertLessEqual(set(arr), set(range(5)))
+        self.assertGreater(arr.count(0), arr.count(4))
+    
+    def test_common_prefix_strings(self):
+        """Test strings sharing long prefixes."""
+        arr = generate_common_prefix_strings(50, prefix_length=20, suffix_length=4)
+        self.assertEqual(len(arr), 50)
+        self.assertTrue(all(len(s) == 24 for s in arr))
+        self.assertEqual(len({s[:19] for s in arr}), 1)
+    
+    def test_mcilroy_adversary_is_permutation(self):
+        """Test that the adversary produces a permutation of range(size)."""
+        arr = generate_mcilroy_adversary(200)
+        self.assertEqual(sorted(arr), list(range(200)))
+    
+    def test_mcilroy_adversary_is_quadratic(self):
+        """Test that the adversary forces quadratic comparisons per engine."""
+        n = 200
+        engines = [
+            lambda arr: quicksort(arr),
+            lambda arr: randomized_quicksort(arr, seed=7),
+            lambda arr: quicksort_3way(arr)
+        ]
+        for engine in engines:
+            arr = generate_mcilroy_adversary(n, engine)
+            self.assertGreater(self._count_comparisons(engine, arr), n * n // 4)
+    
+    def test_adversarial_preset(self):
+        """Test the preset runs every engine against every distribution."""
+        results = run_adversarial_benchmark([30, 60], iterations=1)
+        self.assertEqual(len(results), 3)
+        for dists in results.values():
+            self.assertEqual(set(dists), set(adversarial_generators()))
+            for cells in dists.values():
+                for stats in cells.values():
+                    self.assertEqual(stats['status'], 'ok')
+
+
 class TestBenchmarking(unittest.TestCase):
     """Test benchmarking utilities."""
     
@@ -84,6 +181,46 @@ class TestBenchmarking(unittest.TestCase):
         self.assertIn('mean', stats)
         self.assertGreater(stats['mean'], 0)
     
+    def test_benchmark_memory_measurement(self):
+        """Test optional memory and recursion depth reporting."""
+        arr = generate_random_array(200)
+        stats = benchmark_sorting_algorithm(quicksort, arr, iterations=1)
+        self.assertNotIn('peak_memory', stats)
+        
+        stats = benchmark_sorting_algorithm(quicksort, arr, iterations=1, measure_memory=True)
+        self.assertGreaterEqual(stats['peak_memory'], 0)
+        self.assertIn('net_memory', stats)
+        self.assertGreater(stats['max_depth'], 1)
+    
+    def test_copying_sort_retains_memory(self):
+        """Test that in_place=False shows up as net allocation."""
+        arr = generate_random_array(2000)
+        in_place = measure_memory_usage(quicksort, arr)
+        copying = measure_memory_usage(lambda a: quicksort(a, in_place=False), arr)
+        self.assertGreater(copying['net_memory'], in_place['net_memory'] + 8 * 1000)
+        self.assertGreaterEqual(copying['peak_memory'], copying['net_memory'])
+    
+    def test_max_depth_tracks_recursion(self):
+        """Test that sorted input drives deterministic quicksort deeper."""
+        shallow = measure_max_depth(quicksort, generate_random_array(300))
+        deep = measure_max_depth(quicksort, generate_sorted_array(300))
+        self.assertGreater(deep, 300)
+        self.assertLess(shallow, deep)
+    
+    def test_memory_columns_in_table(self):
+        """Test that memory columns appear in the formatted table."""
+        results = compare_algorithms({'Quicksort': quicksort},
+                                     {'Random': generate_random_array},
+                                     [50], iterations=1, measure_memory=True)
+        table = format_results_table(results)
+        self.assertIn('Peak (KiB)', table)
+        self.assertIn('Depth', table)
+        
+        results = compare_algorithms({'Quicksort': quicksort},
+                                     {'Random': generate_random_array},
+                                     [50], iterations=1)
+        self.assertNotIn('Peak (KiB)', format_results_table(results))
+    
     def test_benchmark_verifies_sorting(self):
         """Test that benchmarking verifies correct sorting."""
         def bad_sort(arr):
@@ -96,6 +233,101 @@ class TestBenchmarking(unittest.TestCase):
             benchmark_sorting_algorithm(bad_sort, arr)
 
 
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "process mode with lambdas requires the fork start method")
+class TestParallelComparison(unittest.TestCase):
+    """Test process-isolated execution of the benchmark grid."""
+    
+    def setUp(self):
+        self.algorithms = {
+            'Deterministic': lambda arr: quicksort(arr),
+            'Randomized': lambda arr: randomized_quicksort(arr, seed=42)
+        }
+        self.generators = {
+            'Random': generate_random_array,
+            'Duplicates': lambda size: generate_array_with_duplicates(size, 5)
+        }
+        self.sizes = [50, 10, 100]
+    
+    def test_parallel_matches_sequential_shape(self):
+        """Test that process mode returns the same nested layout."""
+        sequential = compare_algorithms(self.algorithms, self.generators,
+                                        self.sizes, iterations=2)
+        parallel = compare_algorithms(self.algorithms, self.generators,
+                                      self.sizes, iterations=2, workers=2)
+        
+        self.assertEqual(list(parallel), list(sequential))
+        for algo_name in sequential:
+            self.assertEqual(list(parallel[algo_name]), list(sequential[algo_name]))
+            for dist_name in sequential[algo_name]:
+                self.assertEqual(list(parallel[algo_name][dist_name]), self.sizes)
+                for stats in parallel[algo_name][dist_name].values():
+                    self.assertEqual(set(stats), set(sequential[algo_name][dist_name][50]))
+                    self.assertGreater(stats['mean'], 0)
+    
+    def test_parallel_records_errors(self):
+        """Test that a failing cell is recorded as infinite time."""
+        def bad_sort(arr):
+            return arr
+        
+        results = compare_algorithms({'Bad': bad_sort}, {'Random': generate_random_array},
+                                     [20], iterations=1, workers=1)
+        self.assertEqual(results['Bad']['Random'][20]['mean'], float('inf'))
+        self.assertEqual(results['Bad']['Random'][20]['status'], 'error')
+    
+    @unittest.skipUnless(hasattr(os, 'sched_getaffinity'), "CPU pinning requires Linux")
+    def test_cpu_affinity(self):
+        """Test pinning workers to the CPUs available to this process."""
+        cpus = sorted(os.sched_getaffinity(0))[:2]
+        results = compare_algorithms(self.algorithms, {'Random': generate_random_array},
+                                     [100], iterations=1, cpu_affinity=cpus)
+        for algo_name in self.algorithms:
+            self.assertLess(results[algo_name]['Random'][100]['mean'], float('inf'))
+    
+    def test_timeout_kills_cell_and_skips_larger_sizes(self):
+        """Test that a slow cell is killed and larger sizes are not run."""
+        def slow_on_large(arr):
+            if len(arr) >= 100:
+                time.sleep(30)
+            quicksort(arr)
+        
+        start = time.perf_counter()
+        results = compare_algorithms({'Slow': slow_on_large},
+                                     {'Random': generate_random_array},
+                                     [1000, 10, 100], iterations=1, timeout=0.5)
+        elapsed = time.perf_counter() - start
+        
+        cells = results['Slow']['Random']
+        self.assertEqual(list(cells), [1000, 10, 100])
+        self.assertEqual(cells[10]['status'], 'ok')
+        self.assertEqual(cells[100]['status'], 'timeout')
+        self.assertEqual(cells[1000]['status'], 'skipped')
+        self.assertEqual(cells[100]['mean'], float('inf'))
+        self.assertLess(elapsed, 10)
+        
+        table = format_results_table(results)
+        self.assertIn('TIMEOUT', table)
+        self.assertIn('SKIPPED', table)
+    
+    def test_timeout_cancels_running_larger_sizes(self):
+        """Test that larger sizes already running are cancelled on timeout."""
+        def always_slow(arr):
+            time.sleep(30)
+        
+        results = compare_algorithms({'Slow': always_slow},
+                                     {'Random': generate_random_array},
+                                     [10, 20], iterations=1, workers=2, timeout=0.5)
+        self.assertEqual(results['Slow']['Random'][10]['status'], 'timeout')
+        self.assertEqual(results['Slow']['Random'][20]['status'], 'skipped')
+    
+    def test_invalid_worker_count(self):
+        """Test that a non-positive worker count is rejected."""
+        with self.assertRaises(ValueError):
+            compare_algorithms(self.algorithms, self.generators, self.sizes, workers=0)
+        with self.assertRaises(ValueError):
+            compare_algorithms(self.algorithms, self.generators, self.sizes, timeout=0)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,102 @@
+"""
+Test cases for empirical complexity fitting.
+"""
+
+import math
+import unittest
+from src.complexity import (
+    fit_power_law,
+    fit_series,
+    analyze_scaling,
+    unsafe_series,
+    format_scaling_report
+)
+
+
+def _results(series):
+    """Build compare_algorithms-shaped results from {dist: {size: time}}."""
+    return {'Algo': {
+        dist: {size: {'median': t, 'mean': t, 'status': 'ok'} for size, t in cells.items()}
+        for dist, cells in series.items()
+    }}
+
+
+class TestComplexityFitting(unittest.TestCase):
+    """Test power-law and model fitting."""
+    
+    def setUp(self):
+        self.sizes = [100, 1000, 10000, 100000]
+    
+    def test_power_law_recovers_exponent(self):
+        """Test exact recovery of exponent and constant."""
+        times = [3e-7 * n ** 1.5 for n in self.sizes]
+        exponent, constant = fit_power_law(self.sizes, times)
+        self.assertAlmostEqual(exponent, 1.5)
+        self.assertAlmostEqual(constant, 3e-7)
+    
+    def test_power_law_requires_two_sizes(self):
+        """Test that a single size cannot be fitted."""
+        with self.assertRaises(ValueError):
+            fit_power_law([100, 100], [1.0, 1.1])
+    
+    def test_best_model_selection(self):
+        """Test that each candidate model is recognised."""
+        cases = {
+            'n': lambda n: 1e-6 * n,
+            'n log n': lambda n: 1e-7 * n * math.log2(n),
+            'n^2': lambda n: 1e-9 * n * n,
+        }
+        for model, f in cases.items():
+            fit = fit_series(self.sizes, [f(n) for n in self.sizes])
+            self.assertEqual(fit['model'], model)
+            self.assertEqual(fit['quadratic'], model == 'n^2')
+    
+    def test_extrapolation(self):
+        """Test extrapolated times from the best model."""
+        fit = fit_series(self.sizes, [1e-9 * n * n for n in self.sizes], extrapolate_to=[10 ** 6])
+        self.assertAlmostEqual(fit['extrapolated'][10 ** 6], 1e3)
+
+
+class TestScalingAnalysis(unittest.TestCase):
+    """Test analysis of compare_algorithms results."""
+    
+    def test_flags_quadratic_and_incomplete_series(self):
+        """Test flagging of quadratic, incomplete, and too-short series."""
+        results = _results({
+            'Random': {n: 1e-7 * n * math.log2(n) for n in [100, 1000, 10000]},
+            'Sorted': {n: 1e-8 * n * n for n in [100, 1000, 10000]},
+            'Short': {100: 0.01},
+        })
+        results['Algo']['Timeout'] = {
+            100: {'median': 0.001, 'status': 'ok'},
+            1000: {'median': 0.01, 'status': 'ok'},
+            10000: {'median': float('inf'), 'status': 'timeout'},
+        }
+        analysis = analyze_scaling(results)
+        
+        self.assertFalse(analysis['Algo']['Random']['quadratic'])
+        self.assertTrue(analysis['Algo']['Sorted']['quadratic'])
+        self.assertIsNone(analysis['Algo']['Short'])
+        self.assertTrue(analysis['Algo']['Timeout']['quadratic'])
+        self.assertEqual(analysis['Algo']['Timeout']['incomplete'], [10000])
+        self.assertEqual(unsafe_series(analysis), [('Algo', 'Sorted'), ('Algo', 'Timeout')])
+        self.assertIn(('Algo', 'Random'), unsafe_series(analysis, budget=1.0))
+        
+        report = format_scaling_report(analysis)
+        self.assertIn('TRENDING QUADRATIC', report)
+        self.assertIn('not enough completed sizes', report)
+    
+    def test_degenerate_points_are_not_incomplete(self):
+        """Test that size-1 and zero-time cells are skipped, not flagged."""
+        results = _results({'Linear': {n: 1e-6 * n for n in [1, 10, 100, 1000]}})
+        results['Algo']['Linear'][10]['median'] = 0.0
+        fit = analyze_scaling(results)['Algo']['Linear']
+        
+        self.assertAlmostEqual(fit['exponent'], 1.0, places=6)
+        self.assertFalse(fit['quadratic'])
+        self.assertEqual(fit['incomplete'], [])
+        self.assertEqual(fit['points'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
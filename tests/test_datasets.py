@@ -0,0 +1,81 @@
+"""
+Test cases for vectorized, cached benchmark datasets.
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from src.datasets import DISTRIBUTIONS, cell_rng, generate_dataset, cached_generator
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestDatasets(unittest.TestCase):
+    """Test dataset generation, seeding, and caching."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_distributions(self):
+        """Test the shape and content of every distribution."""
+        for name in DISTRIBUTIONS:
+            data = generate_dataset(name, 500, seed=1, cache_dir=None)
+            self.assertEqual(len(data), 500)
+        
+        self.assertEqual(generate_dataset('sorted', 5, cache_dir=None).tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(generate_dataset('reverse_sorted', 5, cache_dir=None).tolist(), [4, 3, 2, 1, 0])
+        dups = generate_dataset('duplicates', 1000, cache_dir=None, unique_count=5)
+        self.assertLessEqual(len(set(dups.tolist())), 5)
+        nearly = generate_dataset('nearly_sorted', 100, cache_dir=None, swap_count=3)
+        self.assertEqual(sorted(nearly.tolist()), list(range(100)))
+    
+    def test_cell_streams_are_independent_and_reproducible(self):
+        """Test that each cell has its own reproducible stream."""
+        a = cell_rng('random', 100, seed=3).integers(0, 1 << 30, size=10)
+        b = cell_rng('random', 100, seed=3).integers(0, 1 << 30, size=10)
+        c = cell_rng('random', 200, seed=3).integers(0, 1 << 30, size=10)
+        d = cell_rng('duplicates', 100, seed=3).integers(0, 1 << 30, size=10)
+        self.assertTrue(np.array_equal(a, b))
+        self.assertFalse(np.array_equal(a, c))
+        self.assertFalse(np.array_equal(a, d))
+    
+    def test_cache_is_memory_mapped_and_identical(self):
+        """Test that cached datasets are reused and memory-mapped."""
+        first = generate_dataset('random', 1000, seed=5, cache_dir=self.tmpdir.name)
+        files = os.listdir(self.tmpdir.name)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith('.npy'))
+        
+        second = generate_dataset('random', 1000, seed=5, cache_dir=self.tmpdir.name)
+        self.assertIsInstance(second, np.memmap)
+        self.assertTrue(np.array_equal(first, second))
+        self.assertEqual(os.listdir(self.tmpdir.name), files)
+    
+    def test_cache_key_includes_params(self):
+        """Test that different parameters produce different cache entries."""
+        generate_dataset('duplicates', 100, cache_dir=self.tmpdir.name, unique_count=5)
+        generate_dataset('duplicates', 100, cache_dir=self.tmpdir.name, unique_count=10)
+        self.assertEqual(len(os.listdir(self.tmpdir.name)), 2)
+    
+    def test_cached_generator_returns_lists(self):
+        """Test the compare_algorithms-compatible generator."""
+        gen = cached_generator('random', seed=9, cache_dir=self.tmpdir.name)
+        arr = gen(50)
+        self.assertIsInstance(arr, list)
+        self.assertEqual(arr, gen(50))
+    
+    def test_unknown_distribution(self):
+        """Test that unknown distributions are rejected."""
+        with self.assertRaises(ValueError):
+            generate_dataset('bogus', 10, cache_dir=None)
+
+
+if __name__ == '__main__':
+    unittest.main()
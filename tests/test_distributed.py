@@ -0,0 +1,65 @@
+"""
+Test cases for the distributed sample sort.
+"""
+
+import random
+import unittest
+import multiprocessing
+from operator import itemgetter
+from src.distributed import sample_sort, choose_splitters, PHASES
+
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "worker processes need the fork start method")
+class TestSampleSort(unittest.TestCase):
+    """Test sample_sort over localhost worker processes."""
+    
+    def setUp(self):
+        rng = random.Random(19)
+        self.shards = [[rng.randint(0, 500) for _ in range(rng.randint(0, 2000))]
+                       for _ in range(4)] + [[]]
+        self.flat = [x for shard in self.shards for x in shard]
+    
+    def test_sorted_with_timings(self):
+        """Test the merged result and the reported phase timings."""
+        for algorithm in ('quicksort', '3way'):
+            result, timings = sample_sort(self.shards, algorithm=algorithm, seed=1)
+            self.assertEqual(result, sorted(self.flat))
+            self.assertEqual(set(timings), set(PHASES) | {'total'})
+            self.assertTrue(all(seconds >= 0 for seconds in timings.values()))
+            self.assertGreaterEqual(timings['total'], timings['local_sort'])
+    
+    def test_key_and_reverse(self):
+        """Test descending order, key functions, and bulk itemgetter keys."""
+        self.assertEqual(sample_sort(self.shards, reverse=True)[0], sorted(self.flat, reverse=True))
+        self.assertEqual(sample_sort(self.shards, key=lambda x: -x)[0], sorted(self.flat, reverse=True))
+        
+        rows = [[(i % 7, i) for i in range(start, 600, 3)] for start in range(3)]
+        flat_rows = [row for shard in rows for row in shard]
+        result = sample_sort(rows, key=itemgetter(0), reverse=True)[0]
+        self.assertEqual([row[0] for row in result], sorted((row[0] for row in flat_rows), reverse=True))
+        self.assertEqual(sorted(result), sorted(flat_rows))
+    
+    def test_edge_cases_and_errors(self):
+        """Test empty and single shards, and worker error propagation."""
+        self.assertEqual(sample_sort([])[0], [])
+        self.assertEqual(sample_sort([[], []])[0], [])
+        self.assertEqual(sample_sort([[3, 1, 2]])[0], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            sample_sort(self.shards, oversample=0)
+        with self.assertRaises(TypeError):
+            sample_sort([[1, 2, 3] * 500, [2, 'x'] * 500, [5] * 500])
+
+
+class TestChooseSplitters(unittest.TestCase):
+    """Test splitter selection from the sample."""
+    
+    def test_evenly_spaced(self):
+        """Test p-1 splitters at even ranks of the sample."""
+        self.assertEqual(choose_splitters(list(range(12)), 4), [3, 6, 9])
+        self.assertEqual(choose_splitters([5], 3), [5, 5])
+        self.assertEqual(choose_splitters([], 3), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
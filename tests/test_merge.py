@@ -0,0 +1,74 @@
+"""
+Test cases for merging pre-sorted runs.
+"""
+
+import random
+import unittest
+from operator import itemgetter
+from src.merge import merge_sorted, gallop_merge, GALLOP_RATIO
+
+
+class TestMergeSorted(unittest.TestCase):
+    """Test merge_sorted on lists and iterators."""
+    
+    def setUp(self):
+        self.rng = random.Random(17)
+    
+    def _runs(self, k, reverse=False):
+        """Sorted runs of (value, run, position) tuples, to check stability."""
+        runs = []
+        for r in range(k):
+            values = sorted((self.rng.randint(0, 20) for _ in range(self.rng.randint(0, 40))),
+                            reverse=reverse)
+            runs.append([(v, r, i) for i, v in enumerate(values)])
+        return runs
+    
+    def test_stable_kway(self):
+        """Test k-way merges of lists and iterators against a stable sort."""
+        for k in range(0, 7):
+            for reverse in (False, True):
+                runs = self._runs(k, reverse)
+                expected = sorted([x for run in runs for x in run], key=itemgetter(0), reverse=reverse)
+                self.assertEqual(merge_sorted(runs, key=itemgetter(0), reverse=reverse), expected)
+                self.assertEqual(merge_sorted((iter(run) for run in runs), key=itemgetter(0),
+                                              reverse=reverse), expected)
+    
+    def test_plain_values(self):
+        """Test merging without a key function."""
+        self.assertEqual(merge_sorted([[1, 4, 9], iter([2, 3]), [], [5]]), [1, 2, 3, 4, 5, 9])
+        self.assertEqual(merge_sorted([['b', 'd'], ['a', 'c', 'e']]), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(merge_sorted([]), [])
+    
+    def test_unequal_lengths_gallop(self):
+        """Test that very unequal pairs take the galloping path and stay correct."""
+        long_run = sorted(self.rng.random() for _ in range(GALLOP_RATIO * 50))
+        short_run = sorted(self.rng.random() for _ in range(50))
+        self.assertEqual(merge_sorted([short_run, long_run]), sorted(short_run + long_run))
+        self.assertEqual(merge_sorted([long_run[::-1], short_run[::-1]], reverse=True),
+                         sorted(short_run + long_run, reverse=True))
+
+
+class TestGallopMerge(unittest.TestCase):
+    """Test the galloping two-way merge directly."""
+    
+    def test_against_stable_sort(self):
+        """Test random pairs, including ties, for order and stability."""
+        rng = random.Random(3)
+        for _ in range(300):
+            a = [(v, 0) for v in sorted(rng.randint(0, 10) for _ in range(rng.randint(0, 60)))]
+            b = [(v, 1) for v in sorted(rng.randint(0, 10) for _ in range(rng.randint(0, 60)))]
+            self.assertEqual(gallop_merge(a, b, key=itemgetter(0)), sorted(a + b, key=itemgetter(0)))
+            self.assertEqual(gallop_merge(a[::-1], b[::-1], key=itemgetter(0), reverse=True),
+                             sorted(a[::-1] + b[::-1], key=itemgetter(0), reverse=True))
+    
+    def test_block_copies(self):
+        """Test non-overlapping runs and a single insertion."""
+        self.assertEqual(gallop_merge([5, 6, 7], [1, 2]), [1, 2, 5, 6, 7])
+        self.assertEqual(gallop_merge([1, 2], [5, 6, 7]), [1, 2, 5, 6, 7])
+        self.assertEqual(gallop_merge(list(range(0, 100, 2)), [51]),
+                         sorted(list(range(0, 100, 2)) + [51]))
+        self.assertEqual(gallop_merge([], [1]), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Performance-budget tests for the sorting engines.
+
+Comparison-count bounds do not depend on the machine and always run. Timing
+budgets are opt-in: set QUICKSORT_PERF_TESTS=1 to enable them, e.g.
+
+    QUICKSORT_PERF_TESTS=1 python -m pytest tests/test_performance.py
+
+Each timing budget is a ratio to a reference partition loop timed on the same
+host, so the budgets hold across machines of different speeds.
+"""
+
+import os
+import math
+import time
+import random
+import unittest
+from src.comparison import benchmark_sorting_algorithm
+from src.quicksort import quicksort, randomized_quicksort, quicksort_3way
+
+
+PERF_TESTS_ENABLED = os.environ.get('QUICKSORT_PERF_TESTS', '') not in ('', '0')
+
+SEED = 2024
+
+
+def _seeded_random(size, max_val=10 ** 6):
+    """Fixed seeded input, independent of the global random state."""
+    rng = random.Random(SEED)
+    return [rng.randint(0, max_val) for _ in range(size)]
+
+
+class _Counted:
+    """Element wrapper that counts every comparison made on it."""
+    
+    comparisons = 0
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __lt__(self, other):
+        _Counted.comparisons += 1
+        return self.value < other.value
+    
+    def __gt__(self, other):
+        _Counted.comparisons += 1
+        return self.value > other.value
+
+
+def count_comparisons(sort_func, values):
+    """Sort wrapped values and return the number of comparisons made."""
+    arr = [_Counted(v) for v in values]
+    _Counted.comparisons = 0
+    sort_func(arr)
+    assert [x.value for x in arr] == sorted(values)
+    return _Counted.comparisons
+
+
+def _reference_loop(size):
+    """One Lomuto-style partition pass over a list; the unit of host speed."""
+    arr = list(range(size))
+    pivot = size // 2
+    i = -1
+    for j in range(size):
+        if arr[j] < pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+
+def calibrate(size=200000, repeats=5):
+    """Best-of-repeats time of the reference loop on this host."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _reference_loop(size)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestComparisonBounds(unittest.TestCase):
+    """Test that comparison counts stay within c * n * log2(n)."""
+    
+    def _assert_bound(self, sort_func, values, c):
+        n = len(values)
+        count = count_comparisons(sort_func, values)
+        self.assertLessEqual(count, c * n * math.log2(n),
+                             f"{count} comparisons exceeds {c} * n * log2(n) for n={n}")
+    
+    def test_random_inputs(self):
+        """Test all engines on seeded random inputs."""
+        values = _seeded_random(10000)
+        self._assert_bound(quicksort, values, 2.0)
+        self._assert_bound(lambda arr: randomized_quicksort(arr, seed=1), values, 2.0)
+        self._assert_bound(quicksort_3way, values, 3.0)
+    
+    def test_randomized_on_sorted_input(self):
+        """Test that random pivots keep sorted inputs at n log n."""
+        self._assert_bound(lambda arr: randomized_quicksort(arr, seed=1), list(range(5000)), 2.0)
+    
+    def test_3way_on_duplicates(self):
+        """Test that 3-way partitioning is sub-n-log-n on few distinct keys."""
+        self._assert_bound(quicksort_3way, _seeded_random(10000, max_val=9), 1.0)
+
+
+@unittest.skipUnless(PERF_TESTS_ENABLED, "set QUICKSORT_PERF_TESTS=1 to run timing budgets")
+class TestTimingBudgets(unittest.TestCase):
+    """Test that each engine stays within a normalized time budget."""
+    
+    # Budgets are best-of-5 sort time / reference loop time, about twice
+    # the ratios measured on a quiet host
+    BUDGETS = {
+        'quicksort': 4.0,
+        'randomized': 5.0,
+        '3way': 5.0,
+        '3way_duplicates': 1.0,
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.reference = calibrate()
+        cls.random_input = _seeded_random(20000)
+        cls.duplicate_input = _seeded_random(20000, max_val=9)
+    
+    def _assert_budget(self, name, sort_func, array):
+        best = benchmark_sorting_algorithm(sort_func, array, iterations=5)['min']
+        ratio = best / self.reference
+        self.assertLessEqual(ratio, self.BUDGETS[name],
+                             f"{name} took {ratio:.2f}x the reference loop "
+                             f"(budget {self.BUDGETS[name]}x)")
+    
+    def test_quicksort_budget(self):
+        """Test deterministic Quicksort on random input."""
+        self._assert_budget('quicksort', quicksort, self.random_input)
+    
+    def test_randomized_budget(self):
+        """Test randomized Quicksort on random input."""
+        self._assert_budget('randomized', lambda arr: randomized_quicksort(arr, seed=1),
+                            self.random_input)
+    
+    def test_3way_budget(self):
+        """Test 3-way Quicksort on random input."""
+        self._assert_budget('3way', quicksort_3way, self.random_input)
+    
+    def test_3way_duplicates_budget(self):
+        """Test 3-way Quicksort on few distinct keys."""
+        self._assert_budget('3way_duplicates', quicksort_3way, self.duplicate_input)
+
+
+if __name__ == '__main__':
+    unittest.main()
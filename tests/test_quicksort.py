@@ -4,9 +4,29 @@ Test cases for Quicksort implementation.
 
 import unittest
 import random
+import tracemalloc
+from array import array
+from collections import Counter
+from itertools import islice
+from operator import itemgetter, attrgetter
 from typing import List
 
-from src.quicksort import quicksort, randomized_quicksort, quicksort_3way
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.quicksort import (
+    quicksort,
+    randomized_quicksort,
+    quicksort_3way,
+    multikey_quicksort,
+    sort_floats,
+    float_total_order_key,
+    iter_counts,
+    sort_counts,
+    sort_unique
+)
 
 
 class TestQuicksort(unittest.TestCase):
@@ -268,6 +288,321 @@ class TestQuicksortEdgeCases(unittest.TestCase):
         self.assertEqual([x[1] for x in arr], [1, 2, 3])
 
 
+class TestMultiKeyOrdering(unittest.TestCase):
+    """Test keys=[...] and reverse= across all engines."""
+    
+    def setUp(self):
+        rng = random.Random(7)
+        self.records = [{'region': rng.choice(['eu', 'us', 'apac']), 'latency': rng.randint(0, 50),
+                         'host': rng.choice(['a', 'b', 'c'])} for _ in range(300)]
+        self.engines = [
+            quicksort,
+            lambda arr, **kw: randomized_quicksort(arr, seed=3, **kw),
+            quicksort_3way,
+        ]
+    
+    def test_reverse(self):
+        """Test descending order with and without a key."""
+        arr = [3, 6, 8, 10, 1, 2, 1]
+        for sort in self.engines:
+            self.assertEqual(sort(arr, in_place=False, reverse=True), [10, 8, 6, 3, 2, 1, 1])
+            self.assertEqual(sort(['b', 'c', 'a'], in_place=False, key=str.upper, reverse=True),
+                             ['c', 'b', 'a'])
+    
+    def test_mixed_directions(self):
+        """Test (region asc, latency desc) and (region desc, host asc)."""
+        keys = [lambda r: r['region'], lambda r: r['latency']]
+        expected = sorted(self.records, key=lambda r: (r['region'], -r['latency']))
+        for sort in self.engines:
+            result = sort(self.records, in_place=False, keys=keys, reverse=[False, True])
+            self.assertEqual([(r['region'], r['latency']) for r in result],
+                             [(r['region'], r['latency']) for r in expected])
+        
+        # A descending string column can't be negated
+        keys = [lambda r: r['region'], lambda r: r['host']]
+        expected = sorted(sorted(self.records, key=lambda r: r['host']),
+                          key=lambda r: r['region'], reverse=True)
+        for sort in self.engines:
+            arr = self.records.copy()
+            sort(arr, keys=keys, reverse=[True, False])
+            self.assertEqual([(r['region'], r['host']) for r in arr],
+                             [(r['region'], r['host']) for r in expected])
+    
+    def test_keys_called_once_per_element(self):
+        """Test that each key column is extracted exactly once."""
+        calls = []
+        
+        def region(r):
+            calls.append(r)
+            return r['region']
+        
+        quicksort(self.records, in_place=False, keys=[region])
+        self.assertEqual(len(calls), len(self.records))
+    
+    def test_invalid_arguments(self):
+        """Test rejected key/keys/reverse combinations."""
+        for sort in self.engines:
+            with self.assertRaises(ValueError):
+                sort([2, 1], key=abs, keys=[abs])
+            with self.assertRaises(ValueError):
+                sort([2, 1], reverse=[True])
+            with self.assertRaises(ValueError):
+                sort([2, 1], keys=[abs], reverse=[True, False])
+
+
+class _Row(list):
+    """List that counts item lookups, to observe key extraction."""
+    
+    lookups = 0
+    
+    def __getitem__(self, index):
+        _Row.lookups += 1
+        return super().__getitem__(index)
+
+
+class TestBulkKeyExtraction(unittest.TestCase):
+    """Test the itemgetter/attrgetter fast path."""
+    
+    def test_itemgetter_extracted_once(self):
+        """Test that itemgetter keys are extracted once per element."""
+        rows = [_Row([random.randint(0, 100), i]) for i in range(200)]
+        expected = sorted(rows, key=lambda r: list.__getitem__(r, 0))
+        for sort in (quicksort, randomized_quicksort, quicksort_3way):
+            _Row.lookups = 0
+            result = sort(rows, in_place=False, key=itemgetter(0))
+            self.assertEqual(_Row.lookups, len(rows))
+            self.assertEqual([list.__getitem__(r, 0) for r in result],
+                             [list.__getitem__(r, 0) for r in expected])
+    
+    def test_attrgetter_and_reverse(self):
+        """Test attrgetter keys, including multi-attribute and descending."""
+        points = [complex(random.randint(-9, 9), random.randint(-9, 9)) for _ in range(200)]
+        for sort in (quicksort, randomized_quicksort, quicksort_3way):
+            arr = points.copy()
+            sort(arr, key=attrgetter('real', 'imag'), reverse=True)
+            self.assertEqual(arr, sorted(points, key=lambda p: (p.real, p.imag), reverse=True))
+
+
+class TestComparator(unittest.TestCase):
+    """Test the cmp= three-way comparator parameter."""
+    
+    def setUp(self):
+        self.engines = [
+            quicksort,
+            lambda arr, **kw: randomized_quicksort(arr, seed=5, **kw),
+            quicksort_3way,
+        ]
+    
+    def test_comparator_order(self):
+        """Test ascending, descending, and custom comparator orderings."""
+        arr = [random.randint(-50, 50) for _ in range(300)]
+        by_abs_then_sign = lambda a, b: (abs(a) - abs(b)) or (a - b)
+        for sort in self.engines:
+            self.assertEqual(sort(arr, in_place=False, cmp=lambda a, b: a - b), sorted(arr))
+            self.assertEqual(sort(arr, in_place=False, cmp=lambda a, b: a - b, reverse=True),
+                             sorted(arr, reverse=True))
+            result = arr.copy()
+            sort(result, cmp=by_abs_then_sign)
+            self.assertEqual(result, sorted(arr, key=lambda x: (abs(x), x)))
+    
+    def test_3way_calls_comparator_once_per_test(self):
+        """Test that each element-pivot test is a single comparator call."""
+        calls = []
+        
+        def compare(a, b):
+            calls.append((a, b))
+            return (a > b) - (a < b)
+        
+        arr = [5] * 50
+        quicksort_3way(arr, cmp=compare)
+        self.assertEqual(len(calls), 50)
+    
+    def test_invalid_arguments(self):
+        """Test that cmp cannot be combined with key or keys."""
+        for sort in self.engines:
+            with self.assertRaises(ValueError):
+                sort([2, 1], cmp=lambda a, b: a - b, key=abs)
+            with self.assertRaises(ValueError):
+                sort([2, 1], cmp=lambda a, b: a - b, keys=[abs])
+
+
+class TestMultikeyQuicksort(unittest.TestCase):
+    """Test cases for multikey string Quicksort."""
+    
+    def test_strings(self):
+        """Test strings of varied lengths, including prefixes and empties."""
+        arr = ['banana', 'band', 'ban', '', 'apple', 'b', 'banana', 'bandana', 'a']
+        expected = sorted(arr)
+        self.assertEqual(multikey_quicksort(arr, in_place=False), expected)
+        self.assertNotEqual(arr, expected)
+        multikey_quicksort(arr)
+        self.assertEqual(arr, expected)
+        
+        empty = []
+        multikey_quicksort(empty)
+        self.assertEqual(empty, [])
+    
+    def test_long_common_prefixes(self):
+        """Test prefixes longer than the recursion limit."""
+        prefix = 'x' * 5000
+        arr = [prefix + ''.join(random.choice('abc') for _ in range(6)) for _ in range(300)]
+        arr += [prefix, prefix[:-1] + 'y']
+        expected = sorted(arr)
+        multikey_quicksort(arr)
+        self.assertEqual(arr, expected)
+    
+    def test_key_and_encoding(self):
+        """Test key extraction and byte encodings."""
+        words = ['zeta', 'Éclair', 'émigré', 'eagle', 'ångström', 'a', '😀', 'ab']
+        self.assertEqual(multikey_quicksort(words, in_place=False, encoding='utf-8'), sorted(words))
+        
+        rows = [(w, i) for i, w in enumerate(words)]
+        result = multikey_quicksort(rows, in_place=False, key=lambda r: r[0], encoding='utf-8')
+        self.assertEqual(result, sorted(rows))
+        self.assertEqual(multikey_quicksort([b'b', b'ab', b'a'], in_place=False), [b'a', b'ab', b'b'])
+
+
+class TestFloatTotalOrder(unittest.TestCase):
+    """Test NaN-aware float sorting in IEEE-754 total order."""
+    
+    def setUp(self):
+        nan, inf = float('nan'), float('inf')
+        self.values = [2.5, nan, -0.0, -1.0, 0.0, -nan, inf, -inf, 1e-320, -1e-320, 7.0]
+        self.ordered = ['-inf', '-1.0', '-1e-320', '-0.0', '0.0', '1e-320', '2.5', '7.0', 'inf']
+    
+    def test_nan_position(self):
+        """Test total order with NaNs grouped at either end."""
+        result = sort_floats(self.values, in_place=False)
+        self.assertEqual([repr(x) for x in result], self.ordered + ['nan', 'nan'])
+        
+        arr = self.values.copy()
+        sort_floats(arr, nan_position='first')
+        self.assertEqual([repr(x) for x in arr], ['nan', 'nan'] + self.ordered)
+        
+        result = sort_floats(self.values, in_place=False, reverse=True)
+        self.assertEqual([repr(x) for x in result], self.ordered[::-1] + ['nan', 'nan'])
+        
+        with self.assertRaises(ValueError):
+            sort_floats([1.0], nan_position='middle')
+    
+    def test_matches_sorted_without_nans(self):
+        """Test random floats against the built-in sort."""
+        arr = [random.uniform(-1e9, 1e9) for _ in range(2000)] + [0, 1, -1]
+        self.assertEqual(sort_floats(arr, in_place=False), sorted(arr))
+        self.assertEqual(sort_floats([], in_place=False), [])
+    
+    def test_total_order_key_with_engines(self):
+        """Test float_total_order_key as a key for the comparison engines."""
+        for sort in (quicksort, quicksort_3way):
+            result = sort(self.values, in_place=False, key=float_total_order_key)
+            self.assertEqual([repr(x) for x in result], self.ordered + ['nan', 'nan'])
+
+
+class TestSortUniqueCounts(unittest.TestCase):
+    """Test fused sort + dedup and run-length counting."""
+    
+    def test_against_counter(self):
+        """Test random inputs against Counter and set."""
+        rng = random.Random(29)
+        for _ in range(200):
+            arr = [rng.randint(0, rng.randint(0, 30)) for _ in range(rng.randint(0, 80))]
+            original = arr.copy()
+            self.assertEqual(sort_counts(arr), sorted(Counter(arr).items()))
+            self.assertEqual(sort_unique(arr), sorted(set(arr)))
+            self.assertEqual(sort_unique(arr, reverse=True), sorted(set(arr), reverse=True))
+            self.assertEqual(arr, original)
+    
+    def test_key(self):
+        """Test that elements with equal keys count as one value."""
+        words = ['apple', 'Avocado', 'banana', 'Blueberry', 'cherry', 'apricot']
+        counts = sort_counts(words, key=lambda w: w[0].lower())
+        self.assertEqual([(w[0].lower(), c) for w, c in counts], [('a', 3), ('b', 2), ('c', 1)])
+        self.assertEqual(sort_unique(iter([]), key=len), [])
+    
+    def test_streaming(self):
+        """Test that the first pairs are available without finishing the sort."""
+        arr = [random.randint(0, 1000) for _ in range(5000)] + [-1, -1, -2]
+        self.assertEqual(list(islice(iter_counts(arr), 2)), [(-2, 1), (-1, 2)])
+
+
+class TestOutBuffer(unittest.TestCase):
+    """Test sorting into a preallocated out= buffer."""
+    
+    ENGINES = (quicksort, randomized_quicksort, quicksort_3way)
+    
+    def setUp(self):
+        rng = random.Random(31)
+        self.arr = [rng.randint(0, 40) for _ in range(300)]
+    
+    def test_key_modes(self):
+        """Test every key mode writes sorted output and leaves arr alone."""
+        original = self.arr.copy()
+        cases = [
+            ({}, sorted(self.arr)),
+            ({'reverse': True}, sorted(self.arr, reverse=True)),
+            ({'key': lambda x: -x}, sorted(self.arr, reverse=True)),
+            ({'cmp': lambda a, b: a - b}, sorted(self.arr)),
+            ({'cmp': lambda a, b: a - b, 'reverse': True}, sorted(self.arr, reverse=True)),
+            ({'keys': [lambda x: x % 3, lambda x: x]}, sorted(self.arr, key=lambda x: (x % 3, x))),
+        ]
+        for sort in self.ENGINES:
+            for kwargs, expected in cases:
+                out = [None] * len(self.arr)
+                self.assertIs(sort(self.arr, out=out, **kwargs), out)
+                self.assertEqual(out, expected, (sort.__name__, kwargs))
+                self.assertEqual(self.arr, original)
+    
+    def test_buffer_types_and_edge_cases(self):
+        """Test array.array and ndarray buffers, aliasing, and bad lengths."""
+        for sort in self.ENGINES:
+            out = array('q', bytes(8 * len(self.arr)))
+            self.assertEqual(list(sort(self.arr, out=out)), sorted(self.arr))
+            if np is not None:
+                out = np.empty(len(self.arr), dtype=np.int64)
+                self.assertEqual(sort(self.arr, out=out).tolist(), sorted(self.arr))
+            
+            arr = self.arr.copy()
+            self.assertIs(sort(arr, out=arr), arr)
+            self.assertEqual(arr, sorted(self.arr))
+            self.assertEqual(sort([], out=[]), [])
+            with self.assertRaises(ValueError):
+                sort([1, 2], out=[0])
+    
+    def test_non_list_sources(self):
+        """Test tuple, array.array and ndarray sources, including ndarray aliasing."""
+        sources = [tuple(self.arr), array('q', self.arr)]
+        if np is not None:
+            sources.append(np.array(self.arr))
+        cases = [
+            ({}, sorted(self.arr)),
+            ({'reverse': True}, sorted(self.arr, reverse=True)),
+            ({'keys': [lambda x: x % 3, lambda x: x]}, sorted(self.arr, key=lambda x: (x % 3, x))),
+        ]
+        for sort in self.ENGINES:
+            for source in sources:
+                for kwargs, expected in cases:
+                    out = [None] * len(source)
+                    sort(source, out=out, **kwargs)
+                    self.assertEqual(out, expected, (sort.__name__, type(source), kwargs))
+            if np is not None:
+                self.assertEqual(len(sort(np.array([], dtype=np.int64), out=[])), 0)
+                arr = np.array(self.arr)
+                self.assertIs(sort(arr, out=arr), arr)
+                self.assertEqual(arr.tolist(), sorted(self.arr))
+    
+    def test_repeated_sorts_do_not_allocate(self):
+        """Test that sorting into the same buffer allocates no new list."""
+        arr = [random.random() for _ in range(20000)]
+        out = [0.0] * len(arr)
+        for sort in self.ENGINES:
+            tracemalloc.start()
+            sort(arr, out=out)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertEqual(out, sorted(arr))
+            self.assertLess(peak, 8 * len(arr) // 4)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,115 @@
+"""
+Test cases for in-place sorting of fixed-width binary records.
+"""
+
+import os
+import random
+import struct
+import tempfile
+import unittest
+import tracemalloc
+from src.records import sort_records, sort_record_file
+
+
+def _pack(values, fmt, payload_size=4):
+    """Pack (key, payload) records; the payload is the record's original index."""
+    return bytearray(b''.join(struct.pack(fmt, v) + i.to_bytes(payload_size, 'big')
+                              for i, v in enumerate(values)))
+
+
+def _unpack(buf, fmt, record_size):
+    return [struct.unpack_from(fmt, buf, i)[0] for i in range(0, len(buf), record_size)]
+
+
+class TestSortRecords(unittest.TestCase):
+    """Test sort_records on in-memory buffers."""
+    
+    def setUp(self):
+        self.rng = random.Random(11)
+    
+    def test_numeric_key_types(self):
+        """Test unsigned, signed, and float keys in both byte orders."""
+        cases = [
+            ('>Q', 'uint', 'big', [self.rng.getrandbits(64) for _ in range(500)]),
+            ('<q', 'int', 'little', [self.rng.randint(-2 ** 63, 2 ** 63 - 1) for _ in range(500)]),
+            ('>h', 'int', 'big', [self.rng.randint(-5, 5) for _ in range(500)]),
+            ('>d', 'float', 'big', [self.rng.uniform(-1e6, 1e6) for _ in range(500)]),
+            ('<f', 'float', 'little', [float(self.rng.randint(-50, 50)) for _ in range(500)]),
+        ]
+        for fmt, key_type, byteorder, values in cases:
+            size = struct.calcsize(fmt)
+            buf = _pack(values, fmt)
+            sort_records(buf, size + 4, 0, size, key_type, byteorder)
+            self.assertEqual(_unpack(buf, fmt, size + 4), sorted(_unpack(_pack(values, fmt), fmt, size + 4)))
+    
+    def test_records_move_whole(self):
+        """Test that payloads move with their keys."""
+        values = [self.rng.randint(0, 1000) for _ in range(300)]
+        buf = _pack(values, '>I')
+        sort_records(buf, 8, 0, 4, seed=1)
+        for offset in range(0, len(buf), 8):
+            key = struct.unpack_from('>I', buf, offset)[0]
+            index = int.from_bytes(buf[offset + 4:offset + 8], 'big')
+            self.assertEqual(values[index], key)
+    
+    def test_key_offset_odd_length_and_bytes(self):
+        """Test keys at an offset, 3-byte integers, and raw byte keys."""
+        records = [self.rng.randbytes(2) + self.rng.randbytes(3) + self.rng.randbytes(3) for _ in range(200)]
+        buf = bytearray(b''.join(records))
+        sort_records(buf, 8, 2, 3, 'int', 'little')
+        keys = [int.from_bytes(buf[i + 2:i + 5], 'little', signed=True) for i in range(0, len(buf), 8)]
+        self.assertEqual(keys, sorted(keys))
+        
+        buf = bytearray(b''.join(records))
+        sort_records(buf, 8, 2, 3, 'bytes', reverse=True)
+        self.assertEqual([buf[i:i + 8] for i in range(0, len(buf), 8)],
+                         sorted(records, key=lambda r: r[2:5], reverse=True))
+    
+    def test_memory_is_flat(self):
+        """Test that peak memory does not grow with the record count."""
+        peaks = []
+        for count in (200, 4000):
+            buf = _pack([self.rng.getrandbits(32) for _ in range(count)], '>I')
+            tracemalloc.start()
+            sort_records(buf, 8, 0, 4, seed=2)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        self.assertLess(peaks[1], 16 * 1024)
+        self.assertLess(peaks[1], peaks[0] * 2)
+    
+    def test_invalid_arguments(self):
+        """Test rejected layouts and buffers."""
+        with self.assertRaises(ValueError):
+            sort_records(bytearray(10), 4, 0, 4)
+        with self.assertRaises(ValueError):
+            sort_records(bytearray(8), 4, 2, 4)
+        with self.assertRaises(ValueError):
+            sort_records(bytearray(8), 4, 0, 4, key_type='decimal')
+        with self.assertRaises(ValueError):
+            sort_records(bytearray(8), 4, 0, 2, key_type='float')
+        with self.assertRaises(ValueError):
+            sort_records(bytes(8), 4, 0, 4)
+
+
+class TestSortRecordFile(unittest.TestCase):
+    """Test sorting a record file through mmap."""
+    
+    def test_file_sorted_in_place(self):
+        """Test that the file is rewritten in sorted order."""
+        values = [random.randint(0, 10 ** 9) for _ in range(1000)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'events.bin')
+            with open(path, 'wb') as f:
+                f.write(_pack(values, '>Q', payload_size=24))
+            
+            self.assertEqual(sort_record_file(path, 32, 0, 8), (1000, 32000))
+            with open(path, 'rb') as f:
+                self.assertEqual(_unpack(f.read(), '>Q', 32), sorted(values))
+            
+            empty = os.path.join(tmpdir, 'empty.bin')
+            open(empty, 'wb').close()
+            self.assertEqual(sort_record_file(empty, 32, 0, 8), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
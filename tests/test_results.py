@@ -0,0 +1,336 @@
+"""
+Test cases for the benchmark results store.
+"""
+
+import os
+import sys
+import random
+import importlib
+import itertools
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+from src.comparison import compare_algorithms, generate_random_array, generate_sorted_array
+from src.quicksort import quicksort
+from src.sorter import Sorter
+from src.results import (
+    collect_environment,
+    save_results,
+    load_results,
+    mann_whitney_u,
+    compare_to_baseline,
+    find_regressions,
+    format_comparison_table,
+    fingerprint_callable,
+    run_incremental_benchmark
+)
+
+
+def _cell(samples, status='ok'):
+    """Build a stats dict from raw samples."""
+    ordered = sorted(samples)
+    return {
+        'mean': sum(samples) / len(samples),
+        'median': ordered[len(ordered) // 2],
+        'min': ordered[0],
+        'max': ordered[-1],
+        'stdev': 0.0,
+        'samples': list(samples),
+        'status': status
+    }
+
+
+class TestResultsStore(unittest.TestCase):
+    """Test saving and loading benchmark runs."""
+    
+    def setUp(self):
+        self.results = compare_algorithms(
+            {'Quicksort': quicksort}, {'Random': generate_random_array}, [10, 50], iterations=2
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_collect_environment(self):
+        """Test that environment metadata has the expected fields."""
+        meta = collect_environment()
+        for field in ['python_version', 'platform', 'cpu', 'cpu_count', 'commit', 'timestamp']:
+            self.assertIn(field, meta)
+    
+    def test_json_round_trip(self):
+        """Test saving and loading a run as JSON."""
+        path = os.path.join(self.tmpdir.name, 'run.json')
+        save_results(self.results, path, metadata={'label': 'nightly'})
+        loaded, meta = load_results(path)
+        
+        self.assertEqual(loaded, self.results)
+        self.assertEqual(meta['label'], 'nightly')
+        self.assertIn('python_version', meta)
+    
+    def test_csv_round_trip(self):
+        """Test saving and loading a run as CSV."""
+        path = os.path.join(self.tmpdir.name, 'run.csv')
+        save_results(self.results, path)
+        loaded, meta = load_results(path)
+        
+        self.assertEqual(loaded, self.results)
+        self.assertIn('cpu', meta)
+    
+    def test_csv_round_trip_with_memory(self):
+        """Test that memory fields survive the CSV format."""
+        results = compare_algorithms({'Quicksort': quicksort}, {'Random': generate_random_array},
+                                     [20], iterations=1, measure_memory=True)
+        path = os.path.join(self.tmpdir.name, 'run.csv')
+        save_results(results, path)
+        loaded, _ = load_results(path)
+        self.assertEqual(loaded, results)
+    
+    def test_unsupported_format(self):
+        """Test that unknown extensions are rejected."""
+        with self.assertRaises(ValueError):
+            save_results(self.results, os.path.join(self.tmpdir.name, 'run.txt'))
+
+
+class TestIncrementalBenchmark(unittest.TestCase):
+    """Test fingerprinting and incremental reruns."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'data', 'grid.json')
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_fingerprint_follows_called_functions(self):
+        """Test that fingerprints change with code, not identity."""
+        self.assertEqual(fingerprint_callable(lambda arr: quicksort(arr)),
+                         fingerprint_callable(lambda arr: quicksort(arr)))
+        self.assertNotEqual(fingerprint_callable(lambda arr: quicksort(arr)),
+                            fingerprint_callable(lambda arr: quicksort(arr, in_place=True)))
+        self.assertNotEqual(fingerprint_callable(lambda size: [5] * size),
+                            fingerprint_callable(lambda size: [6] * size))
+    
+    def test_fingerprint_follows_classes_and_module_attributes(self):
+        """Test that editing a method in a helper module changes dependent fingerprints."""
+        helper_path = os.path.join(self.tmpdir.name, 'fingerprint_helper.py')
+        source = (
+            "class Eng:\n"
+            "    def sort(self, a):\n"
+            "        {body}\n"
+            "\n"
+            "def run(a):\n"
+            "    Eng().sort(a)\n"
+        )
+        with open(helper_path, 'w') as f:
+            f.write(source.format(body='a.sort()'))
+        sys.path.insert(0, self.tmpdir.name)
+        self.addCleanup(sys.path.remove, self.tmpdir.name)
+        self.addCleanup(sys.modules.pop, 'fingerprint_helper', None)
+        helper = importlib.import_module('fingerprint_helper')
+        
+        candidates = [lambda a: helper.run(a), helper.run, helper.Eng().sort]
+        before = [fingerprint_callable(func) for func in candidates]
+        
+        with open(helper_path, 'w') as f:
+            f.write(source.format(body='a.sort(reverse=False)'))
+        importlib.invalidate_caches()
+        importlib.reload(helper)
+        candidates = [lambda a: helper.run(a), helper.run, helper.Eng().sort]
+        after = [fingerprint_callable(func) for func in candidates]
+        
+        for old, new in zip(before, after):
+            self.assertNotEqual(old, new)
+    
+    def test_fingerprint_is_stable_for_objects(self):
+        """Test that objects are fingerprinted by state, not by memory address."""
+        self.assertEqual(fingerprint_callable(Sorter('3way', 'random', 16, seed=0).sort),
+                         fingerprint_callable(Sorter('3way', 'random', 16, seed=0).sort))
+        
+        def bind(sorter):
+            return lambda arr: sorter.sort(arr)
+        
+        self.assertNotEqual(fingerprint_callable(bind(Sorter('3way', 'random', 16))),
+                            fingerprint_callable(bind(Sorter('quicksort', 'random', 16))))
+        
+        # A fresh interpreter, with different string hashing, agrees
+        code = ("from src.results import fingerprint_callable; from src.sorter import Sorter; "
+                "print(fingerprint_callable(Sorter('3way', 'random', 16, seed=0).sort))")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True,
+                                text=True, check=True, env=dict(os.environ, PYTHONHASHSEED='1'))
+        self.assertEqual(output.stdout.strip(),
+                         fingerprint_callable(Sorter('3way', 'random', 16, seed=0).sort))
+    
+    def test_fingerprint_ignores_bound_instance_state(self):
+        """Test that using the shared random instance does not change fingerprints."""
+        before = fingerprint_callable(generate_random_array)
+        random.gauss(0.0, 1.0)
+        self.assertEqual(fingerprint_callable(generate_random_array), before)
+    
+    def test_reruns_only_changed_cells(self):
+        """Test that unchanged cells are reused and changed ones rerun."""
+        calls = []
+        
+        def counting_sort(arr):
+            calls.append(len(arr))
+            quicksort(arr)
+        
+        algorithms = {'Counting': counting_sort}
+        generators = {'Random': generate_random_array, 'Equal': lambda size: [1] * size}
+        first = run_incremental_benchmark(algorithms, generators, [10, 20], self.path, iterations=1)
+        self.assertEqual(len(calls), 4)
+        
+        calls.clear()
+        second = run_incremental_benchmark(algorithms, generators, [10, 20], self.path, iterations=1)
+        self.assertEqual(calls, [])
+        self.assertEqual(second, first)
+        
+        # A new size and a changed generator rerun only the affected cells
+        generators['Equal'] = lambda size: [2] * size
+        run_incremental_benchmark(algorithms, generators, [10, 20, 30], self.path, iterations=1)
+        self.assertEqual(sorted(calls), [10, 20, 30, 30])
+        
+        # Changing iterations invalidates every cell
+        calls.clear()
+        run_incremental_benchmark(algorithms, generators, [10], self.path, iterations=2)
+        self.assertEqual(len(calls), 4)
+        loaded, meta = load_results(self.path)
+        self.assertEqual(list(loaded['Counting']['Random']), [10])
+        self.assertIn('fingerprints', meta)
+    
+    def test_partial_runs_merge_into_artifact(self):
+        """Test that cells outside the current grid survive a smaller run."""
+        generators = {'Random': generate_random_array}
+        run_incremental_benchmark({'A': lambda arr: quicksort(arr)}, generators,
+                                  [10, 20], self.path, iterations=1)
+        result = run_incremental_benchmark({'B': lambda arr: quicksort(arr, in_place=True)},
+                                           generators, [30], self.path, iterations=1)
+        self.assertEqual(list(result), ['B'])
+        
+        loaded, meta = load_results(self.path)
+        self.assertEqual(list(loaded['A']['Random']), [10, 20])
+        self.assertEqual(list(loaded['B']['Random']), [30])
+        self.assertEqual(set(meta['fingerprints']['algorithms']), {'A', 'B'})
+        
+        # Changed code drops that algorithm's saved sizes, not the others'
+        run_incremental_benchmark({'A': lambda arr: quicksort(arr, in_place=False)}, generators,
+                                  [20], self.path, iterations=1)
+        loaded, _ = load_results(self.path)
+        self.assertEqual(list(loaded['A']['Random']), [20])
+        self.assertEqual(list(loaded['B']['Random']), [30])
+    
+    def test_failed_cells_are_retried(self):
+        """Test that errored cells are benchmarked again instead of reused."""
+        calls = []
+        
+        def flaky_sort(arr):
+            calls.append(len(arr))
+            if flaky_sort.fail:
+                raise RuntimeError("flaky")
+            quicksort(arr)
+        
+        flaky_sort.fail = True
+        algorithms = {'Flaky': flaky_sort}
+        generators = {'Random': generate_random_array}
+        first = run_incremental_benchmark(algorithms, generators, [10], self.path, iterations=1)
+        self.assertEqual(first['Flaky']['Random'][10]['status'], 'error')
+        
+        flaky_sort.fail = False
+        calls.clear()
+        second = run_incremental_benchmark(algorithms, generators, [10], self.path, iterations=1)
+        self.assertEqual(calls, [10])
+        self.assertEqual(second['Flaky']['Random'][10]['status'], 'ok')
+
+
+class TestRegressionDetection(unittest.TestCase):
+    """Test baseline comparison and the Mann-Whitney U test."""
+    
+    def test_mann_whitney_exact(self):
+        """Test exact p-values for small samples."""
+        u, p = mann_whitney_u([4.0, 5.0, 6.0], [1.0, 2.0, 3.0])
+        self.assertEqual(u, 9.0)
+        self.assertAlmostEqual(p, 1 / 20)
+        
+        _, p = mann_whitney_u([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+        self.assertAlmostEqual(p, 1.0)
+    
+    def test_mann_whitney_with_ties(self):
+        """Test the normal approximation when samples contain ties."""
+        _, p = mann_whitney_u([2.0] * 10 + [3.0] * 10, [1.0] * 10 + [2.0] * 10)
+        self.assertLess(p, 0.01)
+    
+    def test_detects_regression(self):
+        """Test that a consistently slower cell is flagged."""
+        baseline = {'A': {'Random': {100: _cell([1.0, 1.1, 1.05, 0.98, 1.02])}}}
+        current = {'A': {'Random': {100: _cell([1.5, 1.6, 1.55, 1.48, 1.52])}}}
+        comparison = compare_to_baseline(baseline, current)
+        
+        entry = comparison['A']['Random'][100]
+        self.assertEqual(entry['status'], 'regression')
+        self.assertGreater(entry['ratio'], 1.4)
+        self.assertEqual(find_regressions(comparison), [('A', 'Random', 100)])
+    
+    def test_detects_improvement_and_noise(self):
+        """Test that faster cells improve and overlapping cells are unchanged."""
+        baseline = {'A': {'Random': {100: _cell([1.0, 1.1, 1.05, 0.98, 1.02]),
+                                     200: _cell([2.0, 2.2, 1.9, 2.05, 1.95])}}}
+        current = {'A': {'Random': {100: _cell([0.5, 0.55, 0.52, 0.51, 0.49]),
+                                    200: _cell([2.1, 1.8, 2.3, 2.15, 1.85])}}}
+        comparison = compare_to_baseline(baseline, current)
+        
+        self.assertEqual(comparison['A']['Random'][100]['status'], 'improvement')
+        self.assertEqual(comparison['A']['Random'][200]['status'], 'unchanged')
+        self.assertEqual(find_regressions(comparison), [])
+    
+    def test_insufficient_samples(self):
+        """Test that 3 vs 3 samples are never flagged, even when fully separated."""
+        baseline = {'A': {'Random': {100: _cell([1.0, 1.01, 1.02])}}}
+        current = {'A': {'Random': {100: _cell([1.5, 1.51, 1.52])}}}
+        comparison = compare_to_baseline(baseline, current)
+        
+        self.assertEqual(comparison['A']['Random'][100]['status'], 'insufficient samples')
+        self.assertEqual(find_regressions(comparison), [])
+    
+    def test_holm_correction_across_cells(self):
+        """Test that many noisy cells of the same distribution raise no regressions."""
+        rng = random.Random(0)
+        baseline, current = {'A': {'Random': {}}}, {'A': {'Random': {}}}
+        for size in range(1, 201):
+            baseline['A']['Random'][size] = _cell([rng.gauss(1.0, 0.2) for _ in range(5)])
+            current['A']['Random'][size] = _cell([rng.gauss(1.0, 0.2) for _ in range(5)])
+        self.assertEqual(find_regressions(compare_to_baseline(baseline, current)), [])
+    
+    def test_same_code_has_no_regressions(self):
+        """Test that two runs of the same code produce no regressions."""
+        # A seeded noisy clock stands in for a quiet machine, so the two runs
+        # differ only by timing noise drawn from the same distribution
+        rng = random.Random(1)
+        ticks = itertools.accumulate(abs(rng.gauss(1e-3, 2e-4)) for _ in itertools.count())
+        algorithms = {'Quicksort': lambda arr: quicksort(arr)}
+        generators = {'Random': generate_random_array, 'Sorted': generate_sorted_array}
+        with mock.patch('time.perf_counter', side_effect=ticks):
+            first = compare_algorithms(algorithms, generators, [100, 200, 400], iterations=5)
+            second = compare_algorithms(algorithms, generators, [100, 200, 400], iterations=5)
+        
+        comparison = compare_to_baseline(first, second)
+        self.assertEqual(find_regressions(comparison), [])
+        statuses = {entry['status'] for dists in comparison.values()
+                    for cells in dists.values() for entry in cells.values()}
+        self.assertEqual(statuses, {'unchanged'})
+    
+    def test_timeout_is_regression(self):
+        """Test that a cell which stopped completing is a regression."""
+        baseline = {'A': {'Sorted': {100: _cell([1.0, 1.0])}}}
+        current = {'A': {'Sorted': {100: _cell([float('inf')], status='timeout'),
+                                    200: _cell([1.0])}}}
+        comparison = compare_to_baseline(baseline, current)
+        
+        self.assertEqual(comparison['A']['Sorted'][100]['status'], 'regression')
+        self.assertEqual(comparison['A']['Sorted'][200]['status'], 'incomparable')
+        self.assertIn('REGRESSION', format_comparison_table(comparison).upper())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Test cases for the incremental sorted container.
+"""
+
+import bisect
+import random
+import unittest
+from operator import itemgetter
+from src.sorted_buffer import SortedBuffer
+
+
+class TestSortedBuffer(unittest.TestCase):
+    """Test batched inserts, lookups and range queries."""
+    
+    def setUp(self):
+        self.rng = random.Random(23)
+    
+    def test_batches_stay_sorted(self):
+        """Test many batches and single adds against a re-sorted reference."""
+        buf = SortedBuffer(load=4)
+        reference = []
+        for _ in range(40):
+            batch = [self.rng.randint(0, 100) for _ in range(self.rng.randint(0, 25))]
+            if self.rng.random() < 0.3:
+                for value in batch:
+                    buf.add(value)
+            else:
+                buf.update(batch)
+            reference.extend(batch)
+            self.assertEqual(list(buf), sorted(reference))
+            self.assertEqual(len(buf), len(reference))
+            self.assertTrue(all(0 < len(chunk) <= 8 for chunk in buf._chunks))
+        self.assertEqual([buf[i] for i in range(-len(buf), len(buf))], sorted(reference) * 2)
+        with self.assertRaises(IndexError):
+            buf[len(buf)]
+    
+    def test_key_and_insertion_order(self):
+        """Test that equal keys from later batches come after earlier ones."""
+        buf = SortedBuffer(key=itemgetter(0), load=3)
+        reference = []
+        for batch_number in range(15):
+            batch = [(self.rng.randint(0, 5), batch_number) for _ in range(6)]
+            buf.update(batch)
+            reference.extend(batch)
+        self.assertEqual([row[1] for row in buf], [row[1] for row in sorted(reference, key=itemgetter(0))])
+    
+    def test_bisect_and_ranges(self):
+        """Test bisect, count and irange with every bound combination."""
+        values = [self.rng.randint(0, 30) for _ in range(300)]
+        buf = SortedBuffer(values, load=5)
+        buf.update(self.rng.randint(0, 30) for _ in range(50))
+        expected = list(buf)
+        self.assertEqual(expected, sorted(expected))
+        for q in range(-1, 33):
+            self.assertEqual(buf.bisect_left(q), bisect.bisect_left(expected, q))
+            self.assertEqual(buf.bisect_right(q), bisect.bisect_right(expected, q))
+            self.assertEqual(buf.count(q), expected.count(q))
+            for inclusive in ((True, True), (True, False), (False, True), (False, False)):
+                lo_ok = (lambda v: v >= q) if inclusive[0] else (lambda v: v > q)
+                hi_ok = (lambda v: v <= q + 7) if inclusive[1] else (lambda v: v < q + 7)
+                self.assertEqual(list(buf.irange(q, q + 7, inclusive)),
+                                 [v for v in expected if lo_ok(v) and hi_ok(v)])
+        self.assertEqual(list(buf.irange()), expected)
+        self.assertEqual(list(buf.irange(maximum=10)), [v for v in expected if v <= 10])
+        self.assertEqual(list(SortedBuffer().irange(1, 2)), [])
+    
+    def test_invalid_arguments(self):
+        """Test rejected configurations and incomparable batches."""
+        with self.assertRaises(ValueError):
+            SortedBuffer(load=0)
+        buf = SortedBuffer([3, 1, 2])
+        with self.assertRaises(TypeError):
+            buf.update([5, 'a', 4])
+        buf.update([0, 4])
+        self.assertEqual(list(buf), [0, 1, 2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
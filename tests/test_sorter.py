@@ -0,0 +1,280 @@
+"""
+Test cases for the reusable Sorter engine.
+"""
+
+import time
+import random
+import asyncio
+import unittest
+import itertools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from src.sorter import (Sorter, SORTING_NETWORKS, sort_many, segmented_sort, balance_segments,
+                        aquicksort)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestSorter(unittest.TestCase):
+    """Test Sorter configurations and buffer reuse."""
+    
+    def setUp(self):
+        self.rng = random.Random(5)
+        self.batches = [[self.rng.randint(0, 50) for _ in range(self.rng.randint(0, 120))]
+                        for _ in range(30)]
+    
+    def test_all_configurations(self):
+        """Test every algorithm, pivot strategy, and a range of cutoffs."""
+        for algorithm in Sorter.ALGORITHMS:
+            for pivot in Sorter.PIVOTS:
+                for cutoff in (0, 1, 16, 200):
+                    sorter = Sorter(algorithm, pivot, cutoff, seed=1)
+                    for batch in self.batches:
+                        arr = batch.copy()
+                        sorter.sort(arr)
+                        self.assertEqual(arr, sorted(batch), (algorithm, pivot, cutoff))
+    
+    def test_key_modes(self):
+        """Test key, keys with mixed directions, reverse, and cmp."""
+        rows = [(self.rng.choice('abc'), self.rng.randint(0, 9)) for _ in range(200)]
+        for algorithm in Sorter.ALGORITHMS:
+            by_second = Sorter(algorithm, 'random', 8, key=itemgetter(1), seed=2)
+            self.assertEqual([r[1] for r in by_second(rows, in_place=False)],
+                             sorted(r[1] for r in rows))
+            
+            mixed = Sorter(algorithm, 'middle', 8, keys=[itemgetter(0), itemgetter(1)],
+                           reverse=[True, False])
+            self.assertEqual(mixed(rows, in_place=False),
+                             sorted(rows, key=lambda r: (-ord(r[0]), r[1])))
+            
+            descending = Sorter(algorithm, 'random', 4, reverse=True, seed=3)
+            self.assertEqual(descending([3, 1, 2, 5, 4], in_place=False), [5, 4, 3, 2, 1])
+            
+            by_cmp = Sorter(algorithm, 'last', 4, cmp=lambda a, b: b - a)
+            self.assertEqual(by_cmp([3, 1, 2, 5, 4], in_place=False), [5, 4, 3, 2, 1])
+    
+    def test_buffers_are_reused(self):
+        """Test that the stack and key buffer persist across calls."""
+        sorter = Sorter('3way', 'random', key=lambda x: -x, seed=4)
+        stack, key_buffer = sorter._stack, sorter._key_buffer
+        for batch in self.batches:
+            arr = batch.copy()
+            sorter(arr)
+            self.assertEqual(arr, sorted(batch, reverse=True))
+        self.assertIs(sorter._stack, stack)
+        self.assertIs(sorter._key_buffer, key_buffer)
+        self.assertEqual(stack, [])
+    
+    def test_seed_is_private(self):
+        """Test that a seeded Sorter is reproducible and leaves random alone."""
+        state = random.getstate()
+        a = Sorter('quicksort', 'random', seed=9)
+        b = Sorter('quicksort', 'random', seed=9)
+        arr = list(range(100))
+        self.rng.shuffle(arr)
+        self.assertEqual(a(arr, in_place=False), b(arr, in_place=False))
+        self.assertEqual(random.getstate(), state)
+    
+    def test_invalid_configuration(self):
+        """Test rejected constructor arguments."""
+        with self.assertRaises(ValueError):
+            Sorter(algorithm='bogo')
+        with self.assertRaises(ValueError):
+            Sorter(pivot='first')
+        with self.assertRaises(ValueError):
+            Sorter(cutoff=-1)
+        with self.assertRaises(ValueError):
+            Sorter(key=abs, keys=[abs])
+        with self.assertRaises(ValueError):
+            Sorter(cmp=lambda a, b: a - b, key=abs)
+
+
+class TestSortMany(unittest.TestCase):
+    """Test the sort_many batch API."""
+    
+    def setUp(self):
+        rng = random.Random(8)
+        self.lists = [[rng.randint(-100, 100) for _ in range(size)]
+                      for size in list(range(0, 8)) * 3 + [10, 50, 120, 200]]
+    
+    def test_sorting_networks(self):
+        """Test every network on all 0-1 inputs (the 0-1 principle)."""
+        for size, network in SORTING_NETWORKS.items():
+            for bits in itertools.product([0, 1], repeat=size):
+                values = list(bits)
+                for i, j in network:
+                    if values[j] < values[i]:
+                        values[i], values[j] = values[j], values[i]
+                self.assertEqual(values, sorted(bits))
+    
+    def test_mixed_sizes(self):
+        """Test in-place and copying batches of every size class."""
+        expected = [sorted(lst) for lst in self.lists]
+        self.assertEqual(sort_many(self.lists, in_place=False), expected)
+        self.assertNotEqual(self.lists, expected)
+        
+        batch = [lst.copy() for lst in self.lists]
+        self.assertIsNone(sort_many(batch))
+        self.assertEqual(batch, expected)
+    
+    def test_key_and_reverse(self):
+        """Test key functions and descending order across kernels."""
+        result = sort_many(self.lists, in_place=False, key=abs, reverse=True)
+        self.assertEqual([[abs(x) for x in lst] for lst in result],
+                         [sorted(map(abs, lst), reverse=True) for lst in self.lists])
+        words = [['pear', 'Fig'], ['b', 'A', 'c'], ['kiwi', 'Apple', 'date', 'Banana', 'cherry']]
+        self.assertEqual(sort_many(words, in_place=False, key=str.lower),
+                         [sorted(w, key=str.lower) for w in words])
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_row_sort(self):
+        """Test vectorized row sorts and their type fallbacks."""
+        floats = [[random.random() for _ in range(30)] for _ in range(20)]
+        result = sort_many(floats, in_place=False, use_numpy=True, reverse=True)
+        self.assertEqual(result, [sorted(row, reverse=True) for row in floats])
+        self.assertIs(type(result[0][0]), float)
+        
+        mixed = [[3, 1.5, 2], [2, 1, 0.5]]
+        result = sort_many(mixed, in_place=False, use_numpy=True)
+        self.assertEqual(result, [[1.5, 2, 3], [0.5, 1, 2]])
+        self.assertIs(type(result[0][1]), int)
+        
+        self.assertEqual(sort_many(self.lists, in_place=False, use_numpy=True),
+                         [sorted(lst) for lst in self.lists])
+
+
+class TestSegmentedSort(unittest.TestCase):
+    """Test sorting of CSR-style segments."""
+    
+    def setUp(self):
+        rng = random.Random(12)
+        sizes = [rng.randint(0, 40) for _ in range(25)] + [0, 1, 300]
+        self.offsets = [2]
+        for size in sizes:
+            self.offsets.append(self.offsets[-1] + size)
+        self.arr = [rng.randint(-20, 20) for _ in range(self.offsets[-1] + 2)]
+    
+    def _expected(self, **sort_kwargs):
+        expected = self.arr.copy()
+        for start, stop in zip(self.offsets, self.offsets[1:]):
+            expected[start:stop] = sorted(expected[start:stop], **sort_kwargs)
+        return expected
+    
+    def test_segments_sorted_in_place(self):
+        """Test that each segment is sorted and the rest is untouched."""
+        for algorithm in Sorter.ALGORITHMS:
+            arr = self.arr.copy()
+            segmented_sort(arr, self.offsets, algorithm=algorithm)
+            self.assertEqual(arr, self._expected())
+        
+        arr = self.arr.copy()
+        segmented_sort(arr, self.offsets, key=lambda x: -x, reverse=True)
+        self.assertEqual(arr, self._expected())
+        
+        segmented_sort(arr, [])
+        with self.assertRaises(ValueError):
+            segmented_sort(arr, [0, 5, 3])
+        with self.assertRaises(ValueError):
+            segmented_sort(arr, [0, len(arr) + 1])
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_offsets(self):
+        """Test CSR offsets given as a NumPy array."""
+        arr = [3, 1, 2, 5, 4]
+        segmented_sort(arr, np.array([0, 3, 5]))
+        self.assertEqual(arr, [1, 2, 3, 4, 5])
+        
+        arr = self.arr.copy()
+        segmented_sort(arr, np.array(self.offsets))
+        self.assertEqual(arr, self._expected())
+        
+        segmented_sort(arr, np.array([], dtype=np.int64))
+        with self.assertRaises(ValueError):
+            segmented_sort(arr, np.array([0, len(arr) + 1]))
+    
+    def test_balance_segments(self):
+        """Test that batches are balanced by element count."""
+        offsets = [0, 100, 150, 200, 230, 260, 270, 271]
+        batches = balance_segments(offsets, 2)
+        loads = [sum(offsets[i + 1] - offsets[i] for i in batch) for batch in batches]
+        self.assertEqual(sorted(i for batch in batches for i in batch), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(sorted(loads), [130, 140])
+    
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                         "worker pools need the fork start method")
+    def test_worker_pool(self):
+        """Test segments sorted across worker processes, and error propagation."""
+        arr = self.arr.copy()
+        segmented_sort(arr, self.offsets, key=abs, workers=3)
+        self.assertEqual([abs(x) for x in arr], [abs(x) for x in self._expected(key=abs)])
+        
+        with self.assertRaises(TypeError):
+            segmented_sort([3, 'a', 1, 2, 'b', None], [0, 3, 6], workers=2)
+
+
+class TestAquicksort(unittest.TestCase):
+    """Test the asyncio-cooperative sort."""
+    
+    def setUp(self):
+        rng = random.Random(21)
+        self.arr = [rng.randint(0, 10 ** 6) for _ in range(20000)]
+    
+    def test_matches_sync_engine(self):
+        """Test that time slicing does not change the result."""
+        for algorithm in Sorter.ALGORITHMS:
+            expected = Sorter(algorithm, 'random', 16, key=lambda x: x % 1000, seed=6)(
+                self.arr, in_place=False)
+            sorter = Sorter(algorithm, 'random', 16, key=lambda x: x % 1000, seed=6)
+            result = asyncio.run(aquicksort(self.arr, in_place=False, sorter=sorter,
+                                            slice_budget=1e-6))
+            self.assertEqual(result, expected)
+        
+        arr = self.arr.copy()
+        self.assertIsNone(asyncio.run(aquicksort(arr, reverse=True)))
+        self.assertEqual(arr, sorted(self.arr, reverse=True))
+        with self.assertRaises(ValueError):
+            asyncio.run(aquicksort(arr, key=abs, sorter=Sorter()))
+    
+    def test_event_loop_keeps_running(self):
+        """Test that other coroutines are scheduled while a large sort runs."""
+        arr = self.arr * 5
+        
+        async def main():
+            gaps = []
+            done = False
+            
+            async def ticker():
+                last = time.perf_counter()
+                while not done:
+                    await asyncio.sleep(0)
+                    now = time.perf_counter()
+                    gaps.append(now - last)
+                    last = now
+            
+            task = asyncio.create_task(ticker())
+            await aquicksort(arr, key=lambda x: -x, slice_budget=0.002)
+            done = True
+            await task
+            return gaps
+        
+        gaps = asyncio.run(main())
+        self.assertEqual(arr, sorted(self.arr * 5, reverse=True))
+        self.assertGreater(len(gaps), 10)
+        self.assertLess(max(gaps), 0.1)
+    
+    def test_executor(self):
+        """Test that large inputs are handed to an executor."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            arr = self.arr.copy()
+            asyncio.run(aquicksort(arr, executor=executor, executor_threshold=1000))
+            self.assertEqual(arr, sorted(self.arr))
+            result = asyncio.run(aquicksort([2, 1], in_place=False, executor=executor))
+            self.assertEqual(result, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()